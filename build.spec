@@ -161,8 +161,7 @@ hiddenimports = [
 
 hiddenimports += collect_submodules('cryptography')
 hiddenimports += collect_submodules('PyQt5')
-hiddenimports += collect_submodules('pandas')
-hiddenimports += collect_submodules('numpy')
+# pandas e numpy: ver hook-pandas.py / hook-numpy.py (hookspath)
 hiddenimports += collect_submodules('firebirdsql')
 hiddenimports += collect_submodules('passlib')
 
@@ -2,13 +2,180 @@
 Gerenciador de Banco de Dados SQLite
 """
 import sqlite3
+import json
 import os
 import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List
 from .encryption import encryption_manager, password_hasher
 
+# Escrita dos logs de execução: linhas por transação e espera máxima (s)
+LOG_BATCH_SIZE = 100
+LOG_BATCH_WAIT = 0.5
+
+# Conexões SQLite mantidas para reuso pelas threads (scheduler, workers da interface)
+SQLITE_POOL_SIZE = 5
+
+# Cache de autenticação: entradas máximas e validade (s)
+AUTH_CACHE_SIZE = 256
+AUTH_CACHE_TTL = 300
+
+# Colunas dos logs exibidas na tabela (error_details, que pode trazer um
+# traceback inteiro, fica no banco)
+LOG_LIST_COLUMNS = """
+    id, tipo_operacao, status, mensagem,
+    registros_processados, tempo_execucao_segundos, created_at,
+    strftime('%d/%m/%Y %H:%M:%S', created_at, 'localtime') AS created_at_fmt
+"""
+
+# Colunas de agendamentos lidas por get_schedule/get_all_schedules/get_due_schedules
+# (na ordem esperada por _row_to_schedule)
+SCHEDULE_COLUMNS = """
+    id, tipo_operacao, frequencia, hora,
+    dias_semana, is_active, ultima_execucao, proxima_execucao
+"""
+
+# frequencia gravada no banco → schedule_type usado pela interface
+_SCHEDULE_TYPE_MAP = {
+    'DIARIA': 'daily',
+    'SEMANAL': 'weekly',
+    'MENSAL': 'monthly'
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_cnpj(cnpj: str) -> str:
+    """Formatação do CNPJ (função pura, memorizada por valor)"""
+    cnpj_limpo = ''.join(filter(str.isdigit, cnpj))
+    
+    if len(cnpj_limpo) != 14:
+        return cnpj
+    
+    return f"{cnpj_limpo[:2]}.{cnpj_limpo[2:5]}.{cnpj_limpo[5:8]}/{cnpj_limpo[8:12]}-{cnpj_limpo[12:]}"
+
+
+class _PooledConnection:
+    """
+    Conexão emprestada do _SQLitePool
+
+    Repassa tudo à sqlite3.Connection; close() devolve a conexão ao pool em
+    vez de fechá-la, então o código existente (conn.close() no finally)
+    não muda.
+    """
+
+    __slots__ = ('_conn', '_pool')
+
+    def __init__(self, conn: sqlite3.Connection, pool: '_SQLitePool'):
+        self._conn = conn
+        self._pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        """Devolve a conexão ao pool (uma única vez)"""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn)
+
+
+class _SQLitePool:
+    """
+    Pool de conexões SQLite para uso fora da thread principal
+
+    Evita abrir (e configurar) uma conexão por chamada nos jobs do scheduler
+    e nos workers. Uma conexão é usada por uma thread de cada vez
+    (check_same_thread=False só permite que ela troque de thread entre usos).
+    """
+
+    def __init__(self, db_path, size: int = SQLITE_POOL_SIZE):
+        self.db_path = db_path
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def acquire(self) -> _PooledConnection:
+        """Conexão ociosa do pool ou uma nova"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+        return _PooledConnection(conn, self)
+
+    def release(self, conn: sqlite3.Connection):
+        """Devolve a conexão (transação pendente é desfeita); pool cheio: fecha"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+
+    def close_all(self):
+        """Fecha as conexões ociosas"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# Marca de ausência no cache de configurações (None é um valor válido)
+_NOT_CACHED = object()
+
+
+class _AuthCache:
+    """
+    Cache LRU com expiração para os dados de login
+    (username → versão de usuários + hash + usuário)
+    
+    Evita a consulta ao banco em logins repetidos; a senha continua sendo
+    verificada contra o hash guardado. A versão permite descartar a entrada
+    assim que qualquer usuário for alterado.
+    """
+    
+    def __init__(self, maxsize: int = AUTH_CACHE_SIZE, ttl: float = AUTH_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # username → (expira_em, versão, hash, usuário)
+        self._lock = threading.Lock()
+    
+    def get(self, username: str):
+        """Retorna (versão, hash, usuário) ou None se ausente/expirado"""
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                return None
+            
+            expires_at, version, password_hash, user = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[username]
+                return None
+            
+            self._entries.move_to_end(username)
+            return version, password_hash, user
+    
+    def put(self, username: str, version: int, password_hash: str, user: Dict):
+        """Guarda a versão, o hash e os dados do usuário"""
+        with self._lock:
+            self._entries[username] = (time.monotonic() + self.ttl, version, password_hash, user)
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, username: str = None):
+        """Remove um usuário do cache (ou todos, se username for None)"""
+        with self._lock:
+            if username is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(username, None)
+
 
 class DatabaseManager:
     """Gerencia o banco SQLite local"""
@@ -29,6 +196,26 @@ class DatabaseManager:
         self.logger = logging.getLogger(__name__) 
         self.db_path = db_path
         self.conn = None
+        
+        # Conexões das outras threads (ver _get_thread_safe_connection)
+        self._pool = _SQLitePool(db_path)
+        
+        # Serializa apenas as escritas das threads de sincronização; as
+        # leituras não bloqueiam umas às outras (banco em modo WAL)
+        self._write_lock = threading.Lock()
+        
+        # Fila de logs de execução, gravada por uma única thread (iniciada no primeiro uso)
+        self._log_q = queue.Queue()
+        self._log_thread = None
+        self._log_thread_lock = threading.Lock()
+        
+        # Dados de login em cache (repetição de login sem ida ao banco)
+        self._auth_cache = _AuthCache()
+        
+        # Configurações de conexão já lidas (descartadas a cada save_*_config);
+        # a versão impede que uma leitura concorrente a um save guarde dado antigo
+        self._config_cache = {}
+        self._config_version = 0
         self._init_database()
     
     def connect(self):
@@ -38,16 +225,20 @@ class DatabaseManager:
             self.conn.row_factory = sqlite3.Row
     
     def disconnect(self):
-        """Desconecta do banco"""
+        """Desconecta do banco (conexão principal e conexões do pool)"""
         if self.conn:
             self.conn.close()
             self.conn = None
+        self._pool.close_all()
     
     def _init_database(self):
         """Cria estrutura do banco se não existir"""
         self.connect()
         cursor = self.conn.cursor()
         
+        # WAL: leitores não esperam o escritor (configuração persistente no arquivo)
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Tabela de usuários do sistema
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS usuarios (
@@ -145,6 +336,30 @@ class DatabaseManager:
                 valor TEXT NOT NULL
             )
         """)
+        
+        # Metadados (linha única): versão da tabela de usuários
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS meta (
+                id INTEGER PRIMARY KEY CHECK(id = 1),
+                users_version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("INSERT OR IGNORE INTO meta (id, users_version) VALUES (1, 0)")
+        
+        # Qualquer alteração relevante em usuários incrementa a versão
+        # (last_login não conta, senão cada login invalidaria o cache)
+        for trigger_name, event in (
+            ('trg_usuarios_version_ins', 'INSERT'),
+            ('trg_usuarios_version_del', 'DELETE'),
+            ('trg_usuarios_version_upd', 'UPDATE OF username, password_hash, is_active'),
+        ):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {trigger_name}
+                AFTER {event} ON usuarios
+                BEGIN
+                    UPDATE meta SET users_version = users_version + 1 WHERE id = 1;
+                END
+            """)
 
         # Migração: adicionar colunas de Firebird na config_oracle
         migration_columns = [
@@ -322,9 +537,9 @@ class DatabaseManager:
         cliente = cursor.fetchone()
         return dict(cliente) if cliente else None
     
-    def get_all_clientes(self) -> List[Dict]:
-        """Obtém todos os clientes ativos"""
-        cursor = self.conn.cursor()
+    def get_all_clientes(self, conn: sqlite3.Connection = None) -> List[Dict]:
+        """Obtém todos os clientes ativos (conn: conexão alternativa, ex. de outra thread)"""
+        cursor = (conn or self.conn).cursor()
         cursor.execute("""
             SELECT * FROM clientes WHERE is_active = 1 ORDER BY nome
         """)
@@ -341,12 +556,30 @@ class DatabaseManager:
         Returns:
             CNPJ formatado
         """
-        cnpj_limpo = ''.join(filter(str.isdigit, cnpj))
-        
-        if len(cnpj_limpo) != 14:
-            return cnpj
+        return _format_cnpj(cnpj)
+    
+    # ================================================================
+    # CACHE DAS CONFIGURAÇÕES DE CONEXÃO
+    # ================================================================
+    
+    def _cached_config(self, key: tuple, read) -> Optional[Dict]:
+        """
+        Retorna a configuração em cache ou a lê com read()
         
-        return f"{cnpj_limpo[:2]}.{cnpj_limpo[2:5]}.{cnpj_limpo[5:8]}/{cnpj_limpo[8:12]}-{cnpj_limpo[12:]}"
+        Devolve sempre uma cópia: quem recebe pode alterar o dict à vontade.
+        """
+        config = self._config_cache.get(key, _NOT_CACHED)
+        if config is _NOT_CACHED:
+            version = self._config_version
+            config = read()
+            if version == self._config_version:
+                self._config_cache[key] = config
+        return dict(config) if config else None
+    
+    def _invalidate_config_cache(self):
+        """Descarta as configurações em cache (chamar após gravar config_oracle/config_oriontax)"""
+        self._config_version += 1
+        self._config_cache.clear()
     
     # ================================================================
     # MÉTODOS DE CONFIGURAÇÃO ORACLE
@@ -388,14 +621,21 @@ class DatabaseManager:
                       instant_client_path, db_type, database_path, charset))
 
             self.conn.commit()
+            self._invalidate_config_cache()
             return True
         except Exception as e:
             print(f"Erro ao salvar config: {e}")
             return False
     
-    def get_oracle_config(self, nome_conexao: str = None) -> Optional[Dict]:
-        """Obtém configuração Oracle (descriptografada)"""
-        cursor = self.conn.cursor()
+    def get_oracle_config(self, nome_conexao: str = None,
+                          conn: sqlite3.Connection = None) -> Optional[Dict]:
+        """Obtém configuração Oracle (descriptografada; em cache até o próximo save)"""
+        return self._cached_config(('oracle', nome_conexao),
+                                   lambda: self._read_oracle_config(nome_conexao, conn))
+    
+    def _read_oracle_config(self, nome_conexao: str, conn: sqlite3.Connection) -> Optional[Dict]:
+        """Lê a configuração Oracle do banco"""
+        cursor = (conn or self.conn).cursor()
         
         if nome_conexao:
             cursor.execute("""
@@ -414,8 +654,7 @@ class DatabaseManager:
         if config:
             config_dict = dict(config)
             # Descriptografar senha
-            password = encryption_manager.decrypt(config_dict['password_encrypted'])
-            del config_dict['password_encrypted']
+            password = encryption_manager.decrypt(config_dict.pop('password_encrypted'))
             if not password:
                 # Chave inválida (banco veio de outra máquina) — força reconfiguração
                 import logging
@@ -451,14 +690,19 @@ class DatabaseManager:
             """, (host, port, database_name, username, password_enc, int(use_ssl)))
             
             self.conn.commit()
+            self._invalidate_config_cache()
             return True
         except Exception as e:
             print(f"Erro ao salvar config OrionTax: {e}")
             return False
     
-    def get_oriontax_config(self) -> Optional[Dict]:
-        """Obtém configuração OrionTax ativa"""
-        cursor = self.conn.cursor()
+    def get_oriontax_config(self, conn: sqlite3.Connection = None) -> Optional[Dict]:
+        """Obtém configuração OrionTax ativa (em cache até o próximo save)"""
+        return self._cached_config(('oriontax',), lambda: self._read_oriontax_config(conn))
+    
+    def _read_oriontax_config(self, conn: sqlite3.Connection) -> Optional[Dict]:
+        """Lê a configuração OrionTax do banco"""
+        cursor = (conn or self.conn).cursor()
         cursor.execute("""
             SELECT * FROM config_oriontax 
             WHERE is_active = 1 
@@ -469,8 +713,7 @@ class DatabaseManager:
         
         if config:
             config_dict = dict(config)
-            password = encryption_manager.decrypt(config_dict['password_encrypted'])
-            del config_dict['password_encrypted']
+            password = encryption_manager.decrypt(config_dict.pop('password_encrypted'))
             if not password:
                 import logging
                 logging.getLogger(__name__).warning(
@@ -504,8 +747,6 @@ class DatabaseManager:
             ID do agendamento criado
         """
         try:
-            import json
-            
             # Mapear schedule_type para frequencia
             frequencia_map = {
                 'daily': 'DIARIA',
@@ -544,8 +785,6 @@ class DatabaseManager:
                        schedule_day: int = None, is_active: bool = True):
         """Atualiza um agendamento existente"""
         try:
-            import json
-            
             # Mapear schedule_type para frequencia
             frequencia_map = {
                 'daily': 'DIARIA',
@@ -582,17 +821,74 @@ class DatabaseManager:
             self.logger.error(f"Erro ao atualizar agendamento: {e}")
             raise
     
+    def create_and_return_schedule(self, operation_type: str, schedule_type: str,
+                                   schedule_time: str, schedule_day: int = None,
+                                   is_active: bool = True) -> Dict:
+        """
+        Cria o agendamento e devolve o dict no formato de get_schedule,
+        montado a partir dos valores gravados (sem SELECT adicional)
+        """
+        schedule_id = self.create_schedule(operation_type, schedule_type, schedule_time,
+                                           schedule_day, is_active)
+        return self._schedule_dict(schedule_id, operation_type, schedule_type,
+                                   schedule_time, schedule_day, is_active)
+    
+    def update_and_return_schedule(self, schedule_id: int, operation_type: str,
+                                   schedule_type: str, schedule_time: str,
+                                   schedule_day: int = None, is_active: bool = True,
+                                   last_run=None, next_run=None) -> Dict:
+        """
+        Atualiza o agendamento e devolve o dict no formato de get_schedule
+        (last_run/next_run não são alterados pelo UPDATE: repassados pelo chamador)
+        """
+        self.update_schedule(schedule_id, operation_type, schedule_type, schedule_time,
+                             schedule_day, is_active)
+        return self._schedule_dict(schedule_id, operation_type, schedule_type,
+                                   schedule_time, schedule_day, is_active,
+                                   last_run, next_run)
+    
+    @staticmethod
+    def _schedule_dict(schedule_id: int, operation_type: str, schedule_type: str,
+                       schedule_time: str, schedule_day: int, is_active: bool,
+                       last_run=None, next_run=None) -> Dict:
+        """Dict de agendamento igual ao lido do banco por get_schedule"""
+        if schedule_type not in ('daily', 'weekly', 'monthly'):
+            schedule_type = 'daily'  # gravado como DIARIA
+        
+        return {
+            'id': schedule_id,
+            'operation_type': operation_type,
+            'schedule_type': schedule_type,
+            'schedule_time': schedule_time,
+            'schedule_day': schedule_day,
+            'is_active': bool(is_active),
+            'last_run': last_run,
+            'next_run': next_run
+        }
+    
+    @classmethod
+    def _row_to_schedule(cls, row) -> Dict:
+        """Dict de agendamento a partir de uma linha com SCHEDULE_COLUMNS"""
+        # weekly/monthly guardam o dia em dias_semana como JSON ([dia])
+        schedule_day = None
+        if row[4]:
+            try:
+                dias = json.loads(row[4])
+                if dias:
+                    schedule_day = dias[0]
+            except (ValueError, TypeError):
+                pass
+        
+        return cls._schedule_dict(row[0], row[1], _SCHEDULE_TYPE_MAP.get(row[2], 'daily'),
+                                  row[3], schedule_day, row[5], row[6], row[7])
+    
     def get_schedule(self, schedule_id: int):
         """Busca um agendamento pelo ID"""
         try:
-            import json
-            
             cursor = self.conn.cursor()
             
-            cursor.execute("""
-                SELECT 
-                    id, tipo_operacao, frequencia, hora, 
-                    dias_semana, is_active, ultima_execucao
+            cursor.execute(f"""
+                SELECT {SCHEDULE_COLUMNS}
                 FROM agendamentos
                 WHERE id = ?
             """, (schedule_id,))
@@ -600,89 +896,24 @@ class DatabaseManager:
             row = cursor.fetchone()
             cursor.close()
             
-            if row:
-                # Mapear frequencia para schedule_type
-                schedule_type_map = {
-                    'DIARIA': 'daily',
-                    'SEMANAL': 'weekly',
-                    'MENSAL': 'monthly'
-                }
-                
-                frequencia = row[2]
-                schedule_type = schedule_type_map.get(frequencia, 'daily')
-                
-                # Extrair schedule_day de dias_semana
-                schedule_day = None
-                if row[4]:  # dias_semana
-                    try:
-                        dias = json.loads(row[4])
-                        if dias and len(dias) > 0:
-                            schedule_day = dias[0]
-                    except:
-                        pass
-                
-                return {
-                    'id': row[0],
-                    'operation_type': row[1],
-                    'schedule_type': schedule_type,
-                    'schedule_time': row[3],
-                    'schedule_day': schedule_day,
-                    'is_active': bool(row[5]),
-                    'last_run': row[6]
-                }
-            
-            return None
+            return self._row_to_schedule(row) if row else None
             
         except Exception as e:
             self.logger.error(f"Erro ao buscar agendamento: {e}")
             return None
     
-    def get_all_schedules(self):
+    def get_all_schedules(self, conn: sqlite3.Connection = None):
         """Retorna todos os agendamentos"""
         try:
-            import json
-            
-            cursor = self.conn.cursor()
+            cursor = (conn or self.conn).cursor()
             
-            cursor.execute("""
-                SELECT 
-                    id, tipo_operacao, frequencia, hora,
-                    dias_semana, is_active, ultima_execucao
+            cursor.execute(f"""
+                SELECT {SCHEDULE_COLUMNS}
                 FROM agendamentos
                 ORDER BY id
             """)
             
-            schedules = []
-            for row in cursor.fetchall():
-                # Mapear frequencia para schedule_type
-                schedule_type_map = {
-                    'DIARIA': 'daily',
-                    'SEMANAL': 'weekly',
-                    'MENSAL': 'monthly'
-                }
-                
-                frequencia = row[2]
-                schedule_type = schedule_type_map.get(frequencia, 'daily')
-                
-                # Extrair schedule_day
-                schedule_day = None
-                if row[4]:  # dias_semana
-                    try:
-                        dias = json.loads(row[4])
-                        if dias and len(dias) > 0:
-                            schedule_day = dias[0]
-                    except:
-                        pass
-                
-                schedules.append({
-                    'id': row[0],
-                    'operation_type': row[1],
-                    'schedule_type': schedule_type,
-                    'schedule_time': row[3],
-                    'schedule_day': schedule_day,
-                    'is_active': bool(row[5]),
-                    'last_run': row[6]
-                })
+            schedules = [self._row_to_schedule(row) for row in cursor.fetchall()]
             
             cursor.close()
             return schedules
@@ -706,24 +937,87 @@ class DatabaseManager:
     def update_schedule_last_run(self, operation_type: str):
         """Atualiza a última execução de um agendamento"""
         try:
-            # ✅ CRIAR NOVA CONEXÃO (thread-safe)
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
+            # Conexão do pool (thread-safe)
+            conn = self._get_thread_safe_connection()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                UPDATE agendamentos
-                SET ultima_execucao = CURRENT_TIMESTAMP
-                WHERE tipo_operacao = ?
-            """, (operation_type,))
-            
-            conn.commit()
+            with self._write_lock:
+                cursor.execute("""
+                    UPDATE agendamentos
+                    SET ultima_execucao = CURRENT_TIMESTAMP
+                    WHERE tipo_operacao = ?
+                """, (operation_type,))
+                
+                conn.commit()
             cursor.close()
             conn.close()
             
         except Exception as e:
             self.logger.error(f"Erro ao atualizar última execução: {e}")
     
+    def set_schedule_next_run(self, schedule_id: int, next_run: Optional[str]):
+        """
+        Grava a próxima execução de um agendamento (thread-safe)
+        
+        Args:
+            schedule_id: ID do agendamento
+            next_run: Data/hora local 'YYYY-MM-DD HH:MM:SS' ou None
+        """
+        conn = self._get_thread_safe_connection()
+        cursor = conn.cursor()
+        
+        try:
+            with self._write_lock:
+                cursor.execute("""
+                    UPDATE agendamentos
+                    SET proxima_execucao = ?
+                    WHERE id = ?
+                """, (next_run, schedule_id))
+                conn.commit()
+            
+        finally:
+            cursor.close()
+            conn.close()
+    
+    def count_scheduled(self) -> int:
+        """Quantidade de agendamentos ativos com próxima execução definida (thread-safe)"""
+        conn = self._get_thread_safe_connection()
+        
+        try:
+            row = conn.execute("""
+                SELECT COUNT(*) FROM agendamentos
+                WHERE is_active = 1 AND proxima_execucao IS NOT NULL
+            """).fetchone()
+            return row[0]
+        finally:
+            conn.close()
+    
+    def get_due_schedules(self, now: str) -> List[Dict]:
+        """
+        Retorna os agendamentos ativos cuja próxima execução já venceu (thread-safe)
+        
+        Args:
+            now: Data/hora local 'YYYY-MM-DD HH:MM:SS'
+        """
+        conn = self._get_thread_safe_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f"""
+                SELECT {SCHEDULE_COLUMNS}
+                FROM agendamentos
+                WHERE is_active = 1
+                  AND proxima_execucao IS NOT NULL
+                  AND proxima_execucao <= ?
+                ORDER BY proxima_execucao
+            """, (now,))
+            
+            return [self._row_to_schedule(row) for row in cursor.fetchall()]
+            
+        finally:
+            cursor.close()
+            conn.close()
+    
     def get_all_clients(self) -> List[Dict]:
         """Alias para get_all_clientes (para compatibilidade com GUI)"""
         return self.get_all_clientes()
@@ -744,16 +1038,58 @@ class DatabaseManager:
         """, (tipo_operacao, status, mensagem, registros, tempo, error_details))
         self.conn.commit()
     
-    def get_logs_recentes(self, limit: int = 100) -> List[Dict]:
-        """Obtém logs recentes"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM logs_execucao 
+    def get_logs_recentes(self, limit: int = 100,
+                          conn: sqlite3.Connection = None) -> List[Dict]:
+        """Obtém logs recentes (colunas da listagem)"""
+        cursor = (conn or self.conn).cursor()
+        cursor.execute(f"""
+            SELECT {LOG_LIST_COLUMNS} FROM logs_execucao 
             ORDER BY created_at DESC LIMIT ?
         """, (limit,))
         
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_logs_since(self, last_id: int, limit: int = 100) -> List[Dict]:
+        """Obtém logs com id maior que last_id (mais recentes primeiro)"""
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT {LOG_LIST_COLUMNS} FROM logs_execucao 
+            WHERE id > ?
+            ORDER BY id DESC LIMIT ?
+        """, (last_id, limit))
+        
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def get_dashboard_snapshot(self, logs_limit: int = 100,
+                               conn: sqlite3.Connection = None) -> Dict:
+        """
+        Lê tudo o que a janela principal exibe em uma única transação de leitura
+        (visão consistente e um só BEGIN/COMMIT)
+        
+        Args:
+            logs_limit: Quantidade de logs recentes
+            conn: Conexão a usar (padrão: conexão da thread principal)
+        
+        Returns:
+            Dict com oracle_cfg, oriontax_cfg, clientes, logs e schedules
+        """
+        conn = conn or self.conn
+        own_transaction = not conn.in_transaction
+        if own_transaction:
+            conn.execute("BEGIN")
+        
+        try:
+            return {
+                'oracle_cfg': self.get_oracle_config(conn=conn),
+                'oriontax_cfg': self.get_oriontax_config(conn=conn),
+                'clientes': self.get_all_clientes(conn=conn),
+                'logs': self.get_logs_recentes(logs_limit, conn=conn),
+                'schedules': self.get_all_schedules(conn=conn),
+            }
+        finally:
+            if own_transaction:
+                conn.commit()
+    
     # ============================
     # PEGAR AS CONEXOES DO SQLITE
     # ============================
@@ -768,10 +1104,112 @@ class DatabaseManager:
     # ================================================================
     
     def _get_thread_safe_connection(self):
-        """Cria uma nova conexão SQLite (thread-safe)"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Conexão SQLite para a thread atual, emprestada do pool (close() a devolve)"""
+        return self._pool.acquire()
+    
+    def authenticate_user_threadsafe(self, username: str, password: str) -> Optional[Dict]:
+        """
+        Autentica usuário (thread-safe, para uso fora da thread da interface)
+        
+        Logins repetidos dentro de AUTH_CACHE_TTL usam o hash em cache, desde
+        que a versão de usuários não tenha mudado: só um inteiro é lido do
+        banco (last_login é atualizado só na consulta completa).
+        
+        Returns:
+            Dict com dados do usuário se autenticado, None caso contrário
+        """
+        conn = self._get_thread_safe_connection()
+        cursor = conn.cursor()
+        
+        try:
+            version = self._read_users_version(cursor)
+            
+            cached = self._auth_cache.get(username)
+            if cached is not None:
+                cached_version, password_hash, user = cached
+                if cached_version == version:
+                    if password_hasher.verify_password(password, password_hash):
+                        return dict(user)
+                    return None
+                
+                self._auth_cache.invalidate(username)
+            
+            user = self._fetch_user(cursor, username, version)
+            
+            if user and password_hasher.verify_password(password, user['password_hash']):
+                # Atualizar last_login
+                with self._write_lock:
+                    cursor.execute("""
+                        UPDATE usuarios SET last_login = ? WHERE id = ?
+                    """, (datetime.now(), user['id']))
+                    conn.commit()
+                
+                return dict(user)
+            
+            return None
+            
+        finally:
+            cursor.close()
+            conn.close()
+    
+    def prefetch_user(self, username: str):
+        """
+        Carrega o usuário no cache de autenticação (thread-safe)
+        
+        Chamado enquanto a senha é digitada: no login resta só a verificação do hash.
+        """
+        conn = self._get_thread_safe_connection()
+        cursor = conn.cursor()
+        
+        try:
+            version = self._read_users_version(cursor)
+            
+            cached = self._auth_cache.get(username)
+            if cached is not None and cached[0] == version:
+                return
+            
+            self._fetch_user(cursor, username, version)
+            
+        finally:
+            cursor.close()
+            conn.close()
+    
+    def _fetch_user(self, cursor, username: str, version: int):
+        """Busca o usuário ativo e atualiza o cache de autenticação"""
+        cursor.execute("""
+            SELECT id, username, password_hash, nome_completo, email, is_active
+            FROM usuarios
+            WHERE username = ? AND is_active = 1
+        """, (username,))
+        
+        user = cursor.fetchone()
+        
+        if user:
+            self._auth_cache.put(username, version, user['password_hash'], dict(user))
+        
+        return user
+    
+    def get_users_version(self) -> int:
+        """Versão atual da tabela de usuários (thread-safe)"""
+        conn = self._get_thread_safe_connection()
+        cursor = conn.cursor()
+        
+        try:
+            return self._read_users_version(cursor)
+        finally:
+            cursor.close()
+            conn.close()
+    
+    @staticmethod
+    def _read_users_version(cursor) -> int:
+        """Lê a versão de usuários com o cursor informado"""
+        cursor.execute("SELECT users_version FROM meta WHERE id = 1")
+        row = cursor.fetchone()
+        return row[0] if row else 0
+    
+    def invalidate_auth_cache(self, username: str = None):
+        """Descarta os dados de login em cache (chamar ao alterar usuário/senha)"""
+        self._auth_cache.invalidate(username)
     
     def get_oracle_config_threadsafe(self, nome_conexao: str = None):
         """Obtém configuração Oracle (thread-safe)"""
@@ -798,9 +1236,8 @@ class DatabaseManager:
                 config_dict = dict(config)
                 # Descriptografar senha
                 config_dict['password'] = encryption_manager.decrypt(
-                    config_dict['password_encrypted']
+                    config_dict.pop('password_encrypted')
                 )
-                del config_dict['password_encrypted']
                 return config_dict
             
             return None
@@ -827,9 +1264,8 @@ class DatabaseManager:
                 from .encryption import encryption_manager
                 config_dict = dict(config)
                 config_dict['password'] = encryption_manager.decrypt(
-                    config_dict['password_encrypted']
+                    config_dict.pop('password_encrypted')
                 )
-                del config_dict['password_encrypted']
                 return config_dict
             
             return None
@@ -838,6 +1274,15 @@ class DatabaseManager:
             cursor.close()
             conn.close()
     
+    def get_dashboard_snapshot_threadsafe(self, logs_limit: int = 100) -> Dict:
+        """Mesmo que get_dashboard_snapshot, em conexão própria (thread-safe)"""
+        conn = self._get_thread_safe_connection()
+        
+        try:
+            return self.get_dashboard_snapshot(logs_limit, conn=conn)
+        finally:
+            conn.close()
+    
     def get_all_clientes_threadsafe(self):
         """Obtém todos os clientes ativos (thread-safe)"""
         conn = self._get_thread_safe_connection()
@@ -856,23 +1301,120 @@ class DatabaseManager:
     
     def add_log_threadsafe(self, tipo_operacao: str, status: str, mensagem: str = None,
                           registros: int = 0, tempo: float = 0, error_details: str = None):
-        """Adiciona log de execução (thread-safe)"""
+        """
+        Adiciona log de execução (thread-safe)
+        
+        Apenas enfileira a linha; a gravação é feita em lote pela thread
+        de escrita de logs (_log_worker).
+        """
+        self._ensure_log_writer()
+        self._log_q.put((tipo_operacao, status, mensagem, registros, tempo, error_details))
+    
+    def add_logs_bulk_threadsafe(self, rows: List[Dict]):
+        """
+        Adiciona vários logs de execução (thread-safe)
+        
+        As linhas entram na fila como um único item: a thread de escrita
+        grava todas no mesmo executemany/transação.
+        
+        Args:
+            rows: Lista de dicts com as chaves tipo_operacao, status, mensagem,
+                  registros, tempo e error_details
+        """
+        if not rows:
+            return
+        
+        self._ensure_log_writer()
+        self._log_q.put([
+            (row['tipo_operacao'], row['status'], row.get('mensagem'),
+             row.get('registros', 0), row.get('tempo', 0), row.get('error_details'))
+            for row in rows
+        ])
+    
+    def flush_logs(self, timeout: float = 5) -> bool:
+        """
+        Aguarda a gravação de todos os logs enfileirados
+        
+        Args:
+            timeout: Tempo máximo de espera em segundos
+            
+        Returns:
+            True se a fila foi esvaziada dentro do prazo
+        """
+        if self._log_thread is None:
+            return True
+        
+        done = threading.Event()
+        self._log_q.put(done)
+        return done.wait(timeout)
+    
+    def _ensure_log_writer(self):
+        """Inicia a thread de escrita de logs no primeiro uso"""
+        if self._log_thread is not None:
+            return
+        
+        with self._log_thread_lock:
+            if self._log_thread is None:
+                thread = threading.Thread(
+                    target=self._log_worker,
+                    name='log-writer',
+                    daemon=True
+                )
+                thread.start()
+                self._log_thread = thread
+    
+    def _log_worker(self):
+        """
+        Thread única de escrita dos logs de execução: junta até
+        LOG_BATCH_SIZE linhas (ou LOG_BATCH_WAIT segundos) e grava tudo
+        em uma transação. Um lote de add_logs_bulk_threadsafe nunca é
+        dividido entre transações.
+        """
         conn = self._get_thread_safe_connection()
-        cursor = conn.cursor()
         
-        try:
-            cursor.execute("""
-                INSERT INTO logs_execucao 
-                (tipo_operacao, status, mensagem, registros_processados, 
-                 tempo_execucao_segundos, error_details)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (tipo_operacao, status, mensagem, registros, tempo, error_details))
+        while True:
+            rows = []
+            markers = []
             
-            conn.commit()
+            item = self._log_q.get()
+            deadline = time.monotonic() + LOG_BATCH_WAIT
             
-        finally:
-            cursor.close()
-            conn.close()    
+            while True:
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                elif isinstance(item, list):
+                    rows.extend(item)
+                else:
+                    rows.append(item)
+                
+                # Um pedido de flush grava imediatamente o que já chegou
+                if markers or len(rows) >= LOG_BATCH_SIZE:
+                    break
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._log_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            if rows:
+                try:
+                    with self._write_lock:
+                        conn.executemany("""
+                            INSERT INTO logs_execucao 
+                            (tipo_operacao, status, mensagem, registros_processados, 
+                             tempo_execucao_segundos, error_details)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                        """, rows)
+                        conn.commit()
+                except Exception as e:
+                    self.logger.error(f"Erro ao gravar {len(rows)} log(s) de execução: {e}")
+                    conn.rollback()
+            
+            for marker in markers:
+                marker.set()
             
     # ================================================================
     # MÉTODOS DE CONFIGURAÇÕES GERAIS
@@ -916,6 +1458,14 @@ class DatabaseManager:
         """Salva o intervalo do heartbeat em minutos"""
         return self.set_configuracao('heartbeat_interval_minutos', str(max(1, int(minutos))))
 
+    def get_max_sync_workers(self) -> int:
+        """Retorna o número máximo de clientes sincronizados em paralelo (padrão: 8)"""
+        valor = self.get_configuracao('max_sync_workers', '8')
+        try:
+            return max(1, int(valor))
+        except (ValueError, TypeError):
+            return 8
+
     def change_password(self, username: str, old_password: str, new_password: str) -> tuple:
         """
         Altera senha do usuário
@@ -948,11 +1498,14 @@ class DatabaseManager:
             # Atualizar senha
             new_hash = password_hasher.hash_password(new_password)
             
-            cursor.execute("""
-                UPDATE usuarios SET password_hash = ? WHERE id = ?
-            """, (new_hash, user['id']))
+            with self._write_lock:
+                cursor.execute("""
+                    UPDATE usuarios SET password_hash = ? WHERE id = ?
+                """, (new_hash, user['id']))
+                
+                self.conn.commit()
             
-            self.conn.commit()
+            self.invalidate_auth_cache(username)
             
             return True, "Senha alterada com sucesso!"
             
@@ -0,0 +1,37 @@
+"""
+Reconexão com backoff compartilhada pelos clientes de banco
+"""
+import time
+
+# Tentativas de reconexão em ensure_connected (backoff 1s, 2s, 4s...)
+RECONNECT_RETRIES = 3
+
+
+def reconnect_with_backoff(client, retries: int = RECONNECT_RETRIES) -> bool:
+    """
+    Garante uma conexão utilizável no cliente, reconectando com backoff
+    exponencial (1s, 2s, 4s...) se a atual caiu
+
+    O cliente precisa expor is_alive(), disconnect(), connect() e logger;
+    só is_alive() é específico de cada banco.
+
+    Args:
+        client: OracleClient, FirebirdClient ou OrionTaxClient
+        retries: Número máximo de tentativas de connect()
+
+    Returns:
+        True se conectado (relança o último erro se todas as tentativas falharem)
+    """
+    if client.is_alive():
+        return True
+
+    client.disconnect()
+    for attempt in range(retries):
+        try:
+            return client.connect()
+        except Exception as e:
+            if attempt == retries - 1:
+                raise
+            delay = 2 ** attempt
+            client.logger.warning(f"Reconexão falhou ({e}); nova tentativa em {delay}s")
+            time.sleep(delay)
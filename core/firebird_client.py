@@ -9,6 +9,7 @@ import pandas as pd
 import logging
 from typing import Dict, Tuple
 
+from .connection import RECONNECT_RETRIES, reconnect_with_backoff
 from .oracle_client import TABLE_COLUMNS, TABLE_NUMBER_COLUMNS, TABLE_ZFILL_COLUMNS
 
 
@@ -31,6 +32,8 @@ class FirebirdClient:
         self.config = config
         self.connection = None
         self.logger = logging.getLogger(__name__)
+        # Mesma interface do OracleClient (aqui um erro aborta a gravação inteira)
+        self.rejected_rows = 0
 
     # ------------------------------------------------------------------
     # CONEXÃO
@@ -83,6 +86,24 @@ class FirebirdClient:
             finally:
                 self.connection = None
 
+    def is_alive(self) -> bool:
+        """Verifica se a conexão atual ainda responde."""
+        if not self.connection:
+            return False
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT 1 FROM RDB$DATABASE")
+            cursor.fetchone()
+            cursor.close()
+            self.connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    def ensure_connected(self, retries: int = RECONNECT_RETRIES) -> bool:
+        """Garante uma conexão utilizável, reconectando com backoff exponencial."""
+        return reconnect_with_backoff(self, retries)
+
     def test_connection(self) -> Tuple[bool, str]:
         """Testa a conexão com o Firebird."""
         try:
@@ -298,30 +319,23 @@ class FirebirdClient:
                 )
                 return None
 
-        batch = []
-
-        for _, row in df.iterrows():
-            clean_row = [clean_value(row[col], col) for col in columns]
-
-            if len(clean_row) != expected_cols:
-                raise ValueError(
-                    f"{table_name} | Quantidade de colunas inválida: "
-                    f"{len(clean_row)} (esperado {expected_cols})"
-                )
+        if len(columns) != expected_cols:
+            raise ValueError(
+                f"{table_name} | Quantidade de colunas inválida: "
+                f"{len(columns)} (esperado {expected_cols})"
+            )
 
-            batch.append(tuple(clean_row))
+        # Limpeza coluna a coluna sobre o array NumPy (sem iterrows);
+        # zip monta as tuplas em C
+        values = df.to_numpy(dtype=object)
+        cleaned_columns = [
+            [clean_value(value, col) for value in values[:, i]]
+            for i, col in enumerate(columns)
+        ]
+        rows = list(zip(*cleaned_columns))
 
-            if len(batch) >= batch_size:
-                try:
-                    cursor.executemany(insert_sql, batch)
-                    inserted_rows += len(batch)
-                    batch.clear()
-                except Exception as e:
-                    logger.critical(f"Falha no executemany para {table_name}: {e}")
-                    logger.error("Amostra de dados do erro: %s", batch[0])
-                    raise
-
-        if batch:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
             try:
                 cursor.executemany(insert_sql, batch)
                 inserted_rows += len(batch)
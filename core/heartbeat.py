@@ -9,10 +9,12 @@ import os
 import platform
 import socket
 from datetime import datetime, timedelta
-from pathlib import Path
 
 import psutil
 
+from core.oriontax_client import OrionTaxClient
+from utils.logger import resolve_log_dir
+
 
 class HeartbeatService:
     """
@@ -206,7 +208,7 @@ class HeartbeatService:
         das últimas 12h como string, independente do nome do arquivo.
         """
         try:
-            log_dir = Path(__file__).parent.parent / 'logs'
+            log_dir = resolve_log_dir()
             if not log_dir.exists():
                 return ''
 
@@ -253,8 +255,6 @@ class HeartbeatService:
 
     def _send_for_client(self, oriontax_config: dict, cnpj: str, system_data: dict):
         """Executa UPSERT em cliente_monitor e INSERT em cliente_monitor_historico."""
-        from core.oriontax_client import OrionTaxClient
-
         atividade = self._get_atividade_data()
         logs_24h = self._read_log_file()
         now = system_data['timestamp']
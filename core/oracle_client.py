@@ -2,10 +2,16 @@
 Cliente Oracle - Gerencia conexão e operações com Oracle
 """
 import math
+import os
 import oracledb
 import pandas as pd
 import logging
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Iterator, Tuple
+
+from .connection import RECONNECT_RETRIES, reconnect_with_backoff
+
+# Linhas por ida ao servidor na leitura das VIEWs (padrão do driver: 100)
+ORACLE_ARRAYSIZE = int(os.environ.get('ORIONTAX_ORACLE_ARRAYSIZE', '5000'))
 
 # ============================================
 # MAPEAMENTO DE COLUNAS POR TABELA (ORACLE)
@@ -66,22 +72,29 @@ TABLE_NUMBER_COLUMNS = {
     }
 }
 
-def _execute_batch_one_by_one(cursor, insert_sql, batch, table_name, columns):
+def _execute_batch(cursor, batch, table_name, columns) -> int:
     """
-    Fallback: executa linha a linha para identificar o valor exato que causa ORA-01722.
-    Re-levanta com mensagem detalhada mostrando coluna e valor.
+    Executa o INSERT preparado (cursor.prepare) para o lote inteiro em uma
+    única ida ao servidor. Linhas com erro (ex.: ORA-01722) são registradas
+    com coluna e valor, sem abortar o lote.
+    
+    Returns:
+        Número de linhas inseridas
     """
-    for row_idx, row_tuple in enumerate(batch):
-        try:
-            cursor.execute(insert_sql, row_tuple)
-        except Exception as row_err:
-            detalhes = " | ".join(
-                f"{col}={repr(val)}({type(val).__name__})"
-                for col, val in zip(columns, row_tuple)
-            )
-            raise Exception(
-                f"ORA-01722 em {table_name} linha {row_idx}: {detalhes}"
-            ) from row_err
+    cursor.executemany(None, batch, batcherrors=True)
+    
+    errors = cursor.getbatcherrors()
+    for error in errors:
+        row_tuple = batch[error.offset]
+        detalhes = " | ".join(
+            f"{col}={repr(val)}({type(val).__name__})"
+            for col, val in zip(columns, row_tuple)
+        )
+        logging.getLogger(__name__).error(
+            f"{table_name} linha {error.offset}: {error.message.strip()} | {detalhes}"
+        )
+    
+    return len(batch) - len(errors)
 
 
 class OracleClient:
@@ -104,6 +117,8 @@ class OracleClient:
         self.connection = None
         self.logger = logging.getLogger(__name__)
         self.thick_mode_initialized = False
+        # Linhas recusadas pelo Oracle (batcherrors) na última gravação das TMP
+        self.rejected_rows = 0
     
     def _init_thick_mode(self):
         """
@@ -212,6 +227,31 @@ class OracleClient:
             finally:
                 self.connection = None
     
+    def is_alive(self) -> bool:
+        """
+        Verifica se a conexão atual ainda responde (ping)
+        
+        Returns:
+            True se a conexão pode ser reutilizada
+        """
+        if not self.connection:
+            return False
+        try:
+            self.connection.ping()
+            return True
+        except Exception:
+            return False
+    
+    def ensure_connected(self, retries: int = RECONNECT_RETRIES) -> bool:
+        """
+        Garante uma conexão utilizável, reconectando com backoff exponencial
+        (1s, 2s, 4s...) se a atual caiu
+        
+        Returns:
+            True se conectado (relança o último erro se todas as tentativas falharem)
+        """
+        return reconnect_with_backoff(self, retries)
+    
     def test_connection(self) -> Tuple[bool, str]:
         """
         Testa a conexão
@@ -403,6 +443,9 @@ class OracleClient:
 
         columns = list(df.columns)
 
+        # SQL preparado uma vez e reaproveitado em todos os lotes
+        cursor.prepare(insert_sql)
+
         # ==========================
         # LIMPEZA DE VALORES
         # ==========================
@@ -460,48 +503,37 @@ class OracleClient:
                 )
                 return None
 
+        if len(columns) != expected_cols:
+            raise ValueError(
+                f"{table_name} | Quantidade de colunas inválida: "
+                f"{len(columns)} (esperado {expected_cols})"
+            )
+
         # ==========================
-        # MONTAGEM DO BATCH
+        # MONTAGEM DAS LINHAS
         # ==========================
-        batch = []
-
-        for row_idx, row in df.iterrows():
-            clean_row = []
-
-            for i, col in enumerate(columns):
-                clean_row.append(clean_value(row[col], col))
-
-            if len(clean_row) != expected_cols:
-                raise ValueError(
-                    f"{table_name} | Quantidade de colunas inválida: "
-                    f"{len(clean_row)} (esperado {expected_cols})"
-                )
-
-            batch.append(tuple(clean_row))
-
-            # ==========================
-            # EXECUTA BATCH
-            # ==========================
-            if len(batch) >= batch_size:
-                try:
-                    cursor.executemany(insert_sql, batch)
-                    inserted_rows += len(batch)
-                    batch.clear()
-                except Exception as e:
-                    _execute_batch_one_by_one(cursor, insert_sql, batch, table_name, columns)
-                    inserted_rows += len(batch)
-                    batch.clear()
+        # Limpeza coluna a coluna sobre o array NumPy (sem iterrows, que cria
+        # uma Series por linha); zip monta as tuplas em C
+        values = df.to_numpy(dtype=object)
+        cleaned_columns = [
+            [clean_value(value, col) for value in values[:, i]]
+            for i, col in enumerate(columns)
+        ]
+        rows = list(zip(*cleaned_columns))
 
         # ==========================
-        # ÚLTIMO BATCH
+        # EXECUTA EM LOTES
         # ==========================
-        if batch:
-            try:
-                cursor.executemany(insert_sql, batch)
-                inserted_rows += len(batch)
-            except Exception as e:
-                _execute_batch_one_by_one(cursor, insert_sql, batch, table_name, columns)
-                inserted_rows += len(batch)
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            inserted_rows += _execute_batch(cursor, batch, table_name, columns)
+
+        rejected = len(rows) - inserted_rows
+        if rejected:
+            self.rejected_rows += rejected
+            logger.warning(
+                f"⚠️  {table_name} | {rejected} registros rejeitados (ver erros acima)"
+            )
 
         logger.info(
             f"{table_name} | Inseridos {inserted_rows} registros com sucesso"
@@ -509,14 +541,44 @@ class OracleClient:
 
         return inserted_rows
     
-    def read_views_to_dataframes(self) -> Dict[str, pd.DataFrame]:
+    def _read_query(self, sql: str, label: str) -> pd.DataFrame:
         """
-        Lê dados das VIEWs do Oracle para enviar à OrionTax
+        Executa o SELECT buscando ORACLE_ARRAYSIZE linhas por ida ao servidor
+        e monta o DataFrame a partir dos blocos lidos
+        """
+        with self.connection.cursor() as cursor:
+            cursor.arraysize = ORACLE_ARRAYSIZE
+            cursor.prefetchrows = ORACLE_ARRAYSIZE + 1
+            cursor.execute(sql)
+            
+            columns = [col[0] for col in cursor.description]
+            chunks = []
+            fetched = 0
+            
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                
+                chunks.append(pd.DataFrame.from_records(rows, columns=columns, coerce_float=True))
+                fetched += len(rows)
+                self.logger.debug(f"{label}: {fetched} registros lidos...")
+        
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        
+        return pd.concat(chunks, ignore_index=True)
+    
+    def read_views_iter(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Lê as VIEWs do Oracle uma a uma, entregando cada DataFrame assim
+        que é lido (permite gravar no destino e descartar antes da próxima)
         
         ✅ SEM filtro de CNPJ - pega todos os registros
         
-        Returns:
-            Dict com 4 DataFrames das VIEWs
+        Yields:
+            Tuplas (chave, DataFrame): icms_entrada, icms_saida,
+            pis_cofins, cbs_ibs
         """
         try:
             if not self.connection:
@@ -524,45 +586,34 @@ class OracleClient:
             
             self.logger.info("Lendo VIEWs Oracle (todos os registros)...")
             
-            # 1. ICMS ENTRADA
-            self.logger.info("Lendo MXF_VW_ICMS_ENTRADA...")
-            df_icms_entrada = pd.read_sql("""
-                SELECT * FROM MXF_VW_ICMS_ENTRADA
-            """, self.connection)
-            self.logger.info(f"✓ ICMS Entrada: {len(df_icms_entrada)} registros")
-            
-            # 2. ICMS SAÍDA
-            self.logger.info("Lendo MXF_VW_ICMS...")
-            df_icms_saida = pd.read_sql("""
-                SELECT * FROM MXF_VW_ICMS
-            """, self.connection)
-            self.logger.info(f"✓ ICMS Saída: {len(df_icms_saida)} registros")
+            views = [
+                ('icms_entrada', 'MXF_VW_ICMS_ENTRADA', 'ICMS Entrada'),
+                ('icms_saida', 'MXF_VW_ICMS', 'ICMS Saída'),
+                ('pis_cofins', 'MXF_VW_PIS_COFINS', 'PIS/COFINS'),
+                ('cbs_ibs', 'MXF_VW_CBS_IBS', 'CBS/IBS'),
+            ]
             
-            # 3. PIS/COFINS
-            self.logger.info("Lendo MXF_VW_PIS_COFINS...")
-            df_pis_cofins = pd.read_sql("""
-                SELECT * FROM MXF_VW_PIS_COFINS
-            """, self.connection)
-            self.logger.info(f"✓ PIS/COFINS: {len(df_pis_cofins)} registros")
-            
-            # 4. CBS/IBS
-            self.logger.info("Lendo MXF_VW_CBS_IBS...")
-            df_cbs_ibs = pd.read_sql("""
-                SELECT * FROM MXF_VW_CBS_IBS
-            """, self.connection)
-            self.logger.info(f"✓ CBS/IBS: {len(df_cbs_ibs)} registros")
-            
-            return {
-                'icms_entrada': df_icms_entrada,
-                'icms_saida': df_icms_saida,
-                'pis_cofins': df_pis_cofins,
-                'cbs_ibs': df_cbs_ibs
-            }
+            for key, view_name, label in views:
+                self.logger.info(f"Lendo {view_name}...")
+                df = self._read_query(f"SELECT * FROM {view_name}", view_name)
+                self.logger.info(f"✓ {label}: {len(df)} registros")
+                yield key, df
             
         except Exception as e:
             self.logger.error(f"Erro ao ler VIEWs: {e}")
             raise
     
+    def read_views_to_dataframes(self) -> Dict[str, pd.DataFrame]:
+        """
+        Lê dados das VIEWs do Oracle para enviar à OrionTax
+        
+        ✅ SEM filtro de CNPJ - pega todos os registros
+        
+        Returns:
+            Dict com 4 DataFrames das VIEWs
+        """
+        return dict(self.read_views_iter())
+    
     def write_dataframes_to_tmp_tables(
         self,
         dataframes: Dict[str, pd.DataFrame]
@@ -570,11 +621,6 @@ class OracleClient:
         """
         Grava DataFrames nas tabelas TMP do Oracle (dados vindos da OrionTax)
 
-        ✅ SEM CNPJ - limpa tudo e insere tudo
-        ✅ Usa oracledb + executemany
-        ✅ Ignora colunas que não existem no Oracle
-        ✅ Commit único (melhor performance)
-
         Args:
             dataframes: Dict com DataFrames:
                 - icms_entrada
@@ -582,6 +628,27 @@ class OracleClient:
                 - pis_cofins
                 - cbs_ibs
 
+        Returns:
+            Tuple (sucesso, mensagem)
+        """
+        return self.write_tmp_tables_stream(dataframes.items())
+
+    def write_tmp_tables_stream(
+        self,
+        items: Iterable[Tuple[str, pd.DataFrame]]
+    ) -> Tuple[bool, str]:
+        """
+        Grava nas tabelas TMP do Oracle os DataFrames recebidos um a um
+
+        ✅ SEM CNPJ - limpa tudo e insere tudo
+        ✅ Usa oracledb + executemany
+        ✅ Ignora colunas que não existem no Oracle
+        ✅ Commit único (melhor performance)
+
+        Args:
+            items: Iterável de tuplas (chave, DataFrame), ex.:
+                   read_tmp_tables_iter() do OrionTaxClient
+
         Returns:
             Tuple (sucesso, mensagem)
         """
@@ -591,6 +658,7 @@ class OracleClient:
 
             cursor = self.connection.cursor()
             total_inserted = 0
+            self.rejected_rows = 0
 
             # -------------------------------------------------
             # 1. Limpar tabelas TMP
@@ -615,14 +683,14 @@ class OracleClient:
             }
 
             # -------------------------------------------------
-            # 3. Inserções
+            # 3. Inserções (uma tabela por vez, à medida que chegam)
             # -------------------------------------------------
-            for df_key, table_name in table_map.items():
+            for df_key, df in items:
 
-                if df_key not in dataframes:
-                    continue
+                table_name = table_map.get(df_key)
 
-                df = dataframes[df_key]
+                if table_name is None:
+                    continue
 
                 if df.empty:
                     continue
@@ -657,6 +725,8 @@ class OracleClient:
             cursor.close()
 
             message = f"✓ {total_inserted} registros inseridos no Oracle!"
+            if self.rejected_rows:
+                message += f"\n⚠️  {self.rejected_rows} registros rejeitados (ver log)"
             self.logger.info(message)
 
             return True, message
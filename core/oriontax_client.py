@@ -1,13 +1,19 @@
 """
 Cliente OrionTax - Gerencia conexão e operações com PostgreSQL
 """
+import io
 import psycopg2
 import pandas as pd
 import logging
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 from psycopg2.extras import execute_values
 import numpy as np
 
+from .connection import RECONNECT_RETRIES, reconnect_with_backoff
+
+# A partir deste número de linhas o UPSERT usa COPY + tabela de staging
+COPY_THRESHOLD = 5000
+
 
 class OrionTaxClient:
     """Cliente para conexão e operações com OrionTax (PostgreSQL)"""
@@ -70,6 +76,36 @@ class OrionTaxClient:
             finally:
                 self.connection = None
     
+    def is_alive(self) -> bool:
+        """
+        Verifica se a conexão atual ainda responde
+        
+        Encerra qualquer transação pendente, deixando a sessão limpa para
+        reutilização.
+        
+        Returns:
+            True se a conexão pode ser reutilizada
+        """
+        if not self.connection or self.connection.closed:
+            return False
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            self.connection.rollback()
+            return True
+        except Exception:
+            return False
+    
+    def ensure_connected(self, retries: int = RECONNECT_RETRIES) -> bool:
+        """
+        Garante uma conexão utilizável, reconectando com backoff exponencial
+        (1s, 2s, 4s...) se a atual caiu
+        
+        Returns:
+            True se conectado (relança o último erro se todas as tentativas falharem)
+        """
+        return reconnect_with_backoff(self, retries)
+    
     def test_connection(self) -> Tuple[bool, str]:
         """
         Testa a conexão
@@ -254,13 +290,13 @@ class OrionTaxClient:
             
             # Preparar colunas e valores
             cols = list(df_clean.columns)
-            values = [tuple(row) for row in df_clean.to_numpy()]
             
             # Construir SQL de UPSERT
             cols_sql = ', '.join(cols)
             
-            # Placeholder para VALUES: (%s, %s, %s, ...)
-            placeholders = ', '.join(['%s'] * len(cols))
+            # Template de VALUES: (%s, %s, %s, ...) — montado uma única vez
+            # e reaproveitado em todos os chunks pelo execute_values
+            template = '(' + ', '.join(['%s'] * len(cols)) + ')'
             
             # Cláusula UPDATE SET
             update_set = ', '.join([f"{col} = EXCLUDED.{col}" for col in update_cols])
@@ -270,7 +306,12 @@ class OrionTaxClient:
                 VALUES %s
                 ON CONFLICT ({', '.join(conflict_cols)})
                 DO UPDATE SET {update_set}
-            """
+            """.encode('utf-8')
+            
+            if len(df_clean) > COPY_THRESHOLD:
+                return self._upsert_via_copy(table_name, df_clean, conflict_cols, update_set)
+            
+            values = list(map(tuple, df_clean.to_numpy(dtype=object)))
             
             self.logger.info(f"Executando UPSERT em {table_name}: {len(values)} registros")
             
@@ -286,7 +327,8 @@ class OrionTaxClient:
                         cursor,
                         insert_sql,
                         chunk,
-                        page_size=chunk_size
+                        template=template,
+                        page_size=len(chunk)
                     )
                     
                     total_inserted += len(chunk)
@@ -304,6 +346,76 @@ class OrionTaxClient:
             self.logger.error(traceback.format_exc())
             raise
         
+    def _upsert_via_copy(
+        self,
+        table_name: str,
+        df: pd.DataFrame,
+        conflict_cols: list,
+        update_set: str
+    ) -> int:
+        """
+        UPSERT de grandes volumes: COPY para uma tabela temporária de staging
+        e um único INSERT ... SELECT ... ON CONFLICT para a tabela destino
+        
+        A staging é criada a partir das colunas da tabela destino (mesmos tipos)
+        e descartada no commit.
+        
+        Returns:
+            Número de registros processados
+        """
+        cols_sql = ', '.join(df.columns)
+        # Sempre no schema temporário da sessão: sem o pg_temp. o nome seria
+        # resolvido pelo search_path e poderia atingir uma tabela permanente
+        stage_table = f"pg_temp.stage_{table_name}"
+        
+        self.logger.info(f"Executando UPSERT via COPY em {table_name}: {len(df)} registros")
+        
+        # COPY não faz a conversão 1.0 → 1 que o INSERT faz: ajustar colunas inteiras
+        df = df.copy()
+        for col in self._get_integer_columns(table_name) & set(df.columns):
+            df[col] = pd.to_numeric(df[col]).round().astype('Int64')
+        
+        buffer = io.StringIO()
+        df.to_csv(buffer, index=False, header=False, na_rep='\\N')
+        buffer.seek(0)
+        
+        with self.connection.cursor() as cursor:
+            # ON COMMIT DROP descarta a staging no commit; o DROP cobre um segundo
+            # UPSERT na mesma tabela dentro da mesma transação (write_views_stream)
+            cursor.execute(f"DROP TABLE IF EXISTS {stage_table}")
+            cursor.execute(f"""
+                CREATE TEMP TABLE {stage_table} ON COMMIT DROP AS
+                SELECT {cols_sql} FROM {table_name} WITH NO DATA
+            """)
+            
+            cursor.copy_expert(
+                f"COPY {stage_table} ({cols_sql}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer
+            )
+            
+            cursor.execute(f"""
+                INSERT INTO {table_name} ({cols_sql})
+                SELECT {cols_sql} FROM {stage_table}
+                ON CONFLICT ({', '.join(conflict_cols)})
+                DO UPDATE SET {update_set}
+            """)
+        
+        self.logger.info(f"✓ {len(df)} registros processados em {table_name}")
+        
+        return len(df)
+    
+    def _get_integer_columns(self, table_name: str) -> set:
+        """Colunas inteiras (smallint/integer/bigint) da tabela PostgreSQL"""
+        with self.connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = %s
+                AND data_type IN ('smallint', 'integer', 'bigint')
+            """, (table_name,))
+            
+            return {row[0] for row in cursor.fetchall()}
+    
     def _remove_duplicates(self, df: pd.DataFrame, key_cols: list) -> pd.DataFrame:
         """
         Remove duplicatas do DataFrame baseado nas colunas-chave
@@ -424,6 +536,21 @@ class OrionTaxClient:
                 - pis_cofins
                 - cbs_ibs
             
+        Returns:
+            Tuple (sucesso, mensagem)
+        """
+        return self.write_views_stream(cnpj, dataframes.items())
+    
+    def write_views_stream(self, cnpj: str, items: Iterable[Tuple[str, pd.DataFrame]]) -> Tuple[bool, str]:
+        """
+        Grava no PostgreSQL os DataFrames recebidos um a um, em uma única
+        transação (commit ao final, rollback em caso de erro)
+        
+        Args:
+            cnpj: CNPJ do cliente
+            items: Iterável de tuplas (chave, DataFrame), ex.:
+                   read_views_iter() do OracleClient
+            
         Returns:
             Tuple (sucesso, mensagem)
         """
@@ -433,96 +560,8 @@ class OrionTaxClient:
             
             total_processed = 0
             
-            # Mapeamento de chaves para nomes de tabelas
-            mapping = {
-                'icms_entrada': 'mxf_vw_icms_entrada',
-                'icms_saida': 'mxf_vw_icms',
-                'pis_cofins': 'mxf_vw_pis_cofins',
-                'cbs_ibs': 'mxf_vw_cbs_ibs'
-            }
-            
-            for key, table_name in mapping.items():
-                if key not in dataframes:
-                    self.logger.info(f"DataFrame '{key}' não encontrado, pulando...")
-                    continue
-                
-                df = dataframes[key]
-                
-                if df.empty:
-                    self.logger.info(f"DataFrame '{key}' está vazio, pulando...")
-                    continue
-                
-                # Fazer cópia para não modificar original
-                df = df.copy()
-                
-                # Converter nomes de colunas para lowercase (padrão PostgreSQL)
-                df.columns = [c.lower() for c in df.columns]
-                
-                # Adicionar/substituir CNPJ
-                df['cnpj'] = cnpj
-                
-                # Garantir que codigo_produto não seja None
-                if 'codigo_produto' not in df.columns:
-                    raise ValueError(f"Coluna 'codigo_produto' não encontrada no DataFrame '{key}'")
-                
-                # Remover linhas onde codigo_produto é None
-                original_count = len(df)
-                df = df[df['codigo_produto'].notna()]
-                removed_count = original_count - len(df)
-                
-                if removed_count > 0:
-                    self.logger.warning(f"  Removidas {removed_count} linhas sem codigo_produto")
-                
-                if df.empty:
-                    self.logger.warning(f"DataFrame '{key}' ficou vazio após filtrar codigo_produto nulos")
-                    continue
-                
-                self.logger.info(f"\n{'='*60}")
-                self.logger.info(f"Processando {table_name}")
-                self.logger.info(f"Registros: {len(df)}")
-                self.logger.info(f"Colunas originais: {len(df.columns)}")
-                
-                # ✅ FILTRAR COLUNAS - Manter apenas as que existem na tabela
-                df = self._filter_dataframe_columns(df, table_name)
-                
-                if df.empty:
-                    self.logger.warning(f"DataFrame '{key}' ficou vazio após filtrar colunas")
-                    continue
-                
-                # Verificar se temos as colunas obrigatórias
-                if 'cnpj' not in df.columns or 'codigo_produto' not in df.columns:
-                    self.logger.error(f"Colunas obrigatórias (cnpj, codigo_produto) não encontradas após filtro")
-                    continue
-                
-                # Colunas de conflito (chave única)
-                conflict_cols = ['cnpj', 'codigo_produto']
-                
-                # ✅ REMOVER DUPLICATAS baseado na chave única
-                df = self._remove_duplicates(df, conflict_cols)
-                
-                if df.empty:
-                    self.logger.warning(f"DataFrame '{key}' ficou vazio após remover duplicatas")
-                    continue
-                
-                # ✅ TRUNCAR COLUNAS DE TEXTO que excedem o limite
-                df = self._truncate_string_columns(df, table_name)
-                
-                # Colunas para atualizar (todas exceto as de conflito)
-                update_cols = [c for c in df.columns if c not in conflict_cols]
-                
-                if not update_cols:
-                    self.logger.warning(f"Nenhuma coluna para atualizar em {table_name}")
-                    continue
-                
-                # Executar UPSERT
-                count = self.upsert_dataframe_psycopg2(
-                    table_name=table_name,
-                    df=df,
-                    conflict_cols=conflict_cols,
-                    update_cols=update_cols
-                )
-                
-                total_processed += count
+            for key, df in items:
+                total_processed += self.write_view(cnpj, key, df)
             
             # Commit de todas as transações
             self.connection.commit()
@@ -542,6 +581,106 @@ class OrionTaxClient:
             
             return False, f"Erro: {str(e)}"
     
+    def write_view(self, cnpj: str, key: str, df: pd.DataFrame) -> int:
+        """
+        Faz o UPSERT de um DataFrame na VIEW/Tabela correspondente (sem commit)
+        
+        Args:
+            cnpj: CNPJ do cliente
+            key: icms_entrada, icms_saida, pis_cofins ou cbs_ibs
+            df: DataFrame lido do Oracle
+            
+        Returns:
+            Número de registros processados
+        """
+        # Mapeamento de chaves para nomes de tabelas
+        mapping = {
+            'icms_entrada': 'mxf_vw_icms_entrada',
+            'icms_saida': 'mxf_vw_icms',
+            'pis_cofins': 'mxf_vw_pis_cofins',
+            'cbs_ibs': 'mxf_vw_cbs_ibs'
+        }
+        
+        table_name = mapping.get(key)
+        
+        if table_name is None:
+            self.logger.info(f"DataFrame '{key}' sem tabela correspondente, pulando...")
+            return 0
+        
+        if df.empty:
+            self.logger.info(f"DataFrame '{key}' está vazio, pulando...")
+            return 0
+        
+        # Fazer cópia para não modificar original
+        df = df.copy()
+        
+        # Converter nomes de colunas para lowercase (padrão PostgreSQL)
+        df.columns = [c.lower() for c in df.columns]
+        
+        # Adicionar/substituir CNPJ
+        df['cnpj'] = cnpj
+        
+        # Garantir que codigo_produto não seja None
+        if 'codigo_produto' not in df.columns:
+            raise ValueError(f"Coluna 'codigo_produto' não encontrada no DataFrame '{key}'")
+        
+        # Remover linhas onde codigo_produto é None
+        original_count = len(df)
+        df = df[df['codigo_produto'].notna()]
+        removed_count = original_count - len(df)
+        
+        if removed_count > 0:
+            self.logger.warning(f"  Removidas {removed_count} linhas sem codigo_produto")
+        
+        if df.empty:
+            self.logger.warning(f"DataFrame '{key}' ficou vazio após filtrar codigo_produto nulos")
+            return 0
+        
+        self.logger.info(f"\n{'='*60}")
+        self.logger.info(f"Processando {table_name}")
+        self.logger.info(f"Registros: {len(df)}")
+        self.logger.info(f"Colunas originais: {len(df.columns)}")
+        
+        # ✅ FILTRAR COLUNAS - Manter apenas as que existem na tabela
+        df = self._filter_dataframe_columns(df, table_name)
+        
+        if df.empty:
+            self.logger.warning(f"DataFrame '{key}' ficou vazio após filtrar colunas")
+            return 0
+        
+        # Verificar se temos as colunas obrigatórias
+        if 'cnpj' not in df.columns or 'codigo_produto' not in df.columns:
+            self.logger.error(f"Colunas obrigatórias (cnpj, codigo_produto) não encontradas após filtro")
+            return 0
+        
+        # Colunas de conflito (chave única)
+        conflict_cols = ['cnpj', 'codigo_produto']
+        
+        # ✅ REMOVER DUPLICATAS baseado na chave única
+        df = self._remove_duplicates(df, conflict_cols)
+        
+        if df.empty:
+            self.logger.warning(f"DataFrame '{key}' ficou vazio após remover duplicatas")
+            return 0
+        
+        # ✅ TRUNCAR COLUNAS DE TEXTO que excedem o limite
+        df = self._truncate_string_columns(df, table_name)
+        
+        # Colunas para atualizar (todas exceto as de conflito)
+        update_cols = [c for c in df.columns if c not in conflict_cols]
+        
+        if not update_cols:
+            self.logger.warning(f"Nenhuma coluna para atualizar em {table_name}")
+            return 0
+        
+        # Executar UPSERT
+        return self.upsert_dataframe_psycopg2(
+            table_name=table_name,
+            df=df,
+            conflict_cols=conflict_cols,
+            update_cols=update_cols
+        )
+    
     def _read_tmp_table(self, table_name: str, cnpj: str) -> pd.DataFrame:
         """
         Lê uma tabela TMP via cursor direto (sem pd.read_sql).
@@ -556,9 +695,10 @@ class OrionTaxClient:
         cursor.close()
         return pd.DataFrame(rows, columns=columns)
 
-    def read_tmp_tables_to_dataframes(self, cnpj: str) -> Dict[str, pd.DataFrame]:
+    def read_tmp_tables_iter(self, cnpj: str) -> Iterator[Tuple[str, pd.DataFrame]]:
         """
-        Lê dados das tabelas TMP do PostgreSQL para enviar ao Oracle
+        Lê as tabelas TMP do PostgreSQL uma a uma, entregando cada
+        DataFrame assim que é lido
         
         BUSCAR: PostgreSQL TMPs → Oracle TMPs
         ✅ COM filtro de CNPJ - busca apenas dados daquele cliente
@@ -566,8 +706,9 @@ class OrionTaxClient:
         Args:
             cnpj: CNPJ do cliente
             
-        Returns:
-            Dict com 4 DataFrames das tabelas TMP
+        Yields:
+            Tuplas (chave, DataFrame): icms_entrada, icms_saida,
+            pis_cofins, cbs_ibs
         """
         try:
             if not self.connection:
@@ -575,37 +716,35 @@ class OrionTaxClient:
             
             self.logger.info(f"Lendo tabelas TMP do OrionTax para CNPJ: {cnpj}")
             
-            # 1. ICMS ENTRADA
-            self.logger.info("Lendo MXF_TMP_ICMS_ENTRADA...")
-            df_icms_entrada = self._read_tmp_table("MXF_TMP_ICMS_ENTRADA", cnpj)
-            self.logger.info(f"✓ ICMS Entrada: {len(df_icms_entrada)} registros")
-
-            # 2. ICMS SAÍDA
-            self.logger.info("Lendo MXF_TMP_ICMS_SAIDA...")
-            df_icms_saida = self._read_tmp_table("MXF_TMP_ICMS_SAIDA", cnpj)
-            self.logger.info(f"✓ ICMS Saída: {len(df_icms_saida)} registros")
-
-            # 3. PIS/COFINS
-            self.logger.info("Lendo MXF_TMP_PIS_COFINS...")
-            df_pis_cofins = self._read_tmp_table("MXF_TMP_PIS_COFINS", cnpj)
-            self.logger.info(f"✓ PIS/COFINS: {len(df_pis_cofins)} registros")
-
-            # 4. CBS/IBS
-            self.logger.info("Lendo MXF_TMP_CBS_IBS...")
-            df_cbs_ibs = self._read_tmp_table("MXF_TMP_CBS_IBS", cnpj)
-            self.logger.info(f"✓ CBS/IBS: {len(df_cbs_ibs)} registros")
-            
-            return {
-                'icms_entrada': df_icms_entrada,
-                'icms_saida': df_icms_saida,
-                'pis_cofins': df_pis_cofins,
-                'cbs_ibs': df_cbs_ibs
-            }
+            tables = [
+                ('icms_entrada', 'MXF_TMP_ICMS_ENTRADA', 'ICMS Entrada'),
+                ('icms_saida', 'MXF_TMP_ICMS_SAIDA', 'ICMS Saída'),
+                ('pis_cofins', 'MXF_TMP_PIS_COFINS', 'PIS/COFINS'),
+                ('cbs_ibs', 'MXF_TMP_CBS_IBS', 'CBS/IBS'),
+            ]
+            
+            for key, table_name, label in tables:
+                self.logger.info(f"Lendo {table_name}...")
+                df = self._read_tmp_table(table_name, cnpj)
+                self.logger.info(f"✓ {label}: {len(df)} registros")
+                yield key, df
             
         except Exception as e:
             self.logger.error(f"Erro ao ler tabelas TMP: {e}")
             raise
     
+    def read_tmp_tables_to_dataframes(self, cnpj: str) -> Dict[str, pd.DataFrame]:
+        """
+        Lê dados das tabelas TMP do PostgreSQL para enviar ao Oracle
+        
+        Args:
+            cnpj: CNPJ do cliente
+            
+        Returns:
+            Dict com 4 DataFrames das tabelas TMP
+        """
+        return dict(self.read_tmp_tables_iter(cnpj))
+    
     def __enter__(self):
         """Context manager entry"""
         self.connect()
@@ -4,9 +4,83 @@ Scheduler - Gerencia agendamentos de sincronização
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from core.oracle_client import OracleClient
+from core.oriontax_client import OrionTaxClient
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from time import perf_counter
+import atexit
 import logging
+import queue
 import threading
+import time
+import traceback
+
+
+# Formato de data/hora local gravado em agendamentos.proxima_execucao
+# (ordenável como texto, permitindo a comparação direto no SQL)
+NEXT_RUN_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Validade (segundos) do cache das configurações Oracle/OrionTax
+CONFIG_CACHE_TTL = 60
+
+# Quantas tabelas lidas podem aguardar gravação no pipeline leitura/gravação
+PIPELINE_DEPTH = 2
+
+# Marca de fim da leitura no pipeline
+_END_OF_STREAM = object()
+
+
+def _count_records(items, counter: dict):
+    """
+    Repassa as tuplas (chave, DataFrame) de um leitor em streaming,
+    acumulando o total de linhas em counter['registros']
+    """
+    for key, df in items:
+        counter['registros'] += len(df)
+        yield key, df
+
+
+def _split_schedule_time(schedule: dict) -> dict:
+    """
+    Converte schedule_time ("HH:MM") em inteiros '_hour'/'_minute' uma única
+    vez, na leitura do agendamento
+    """
+    if '_hour' not in schedule:
+        schedule['_hour'], schedule['_minute'] = map(int, schedule['schedule_time'].split(':'))
+    return schedule
+
+
+@lru_cache(maxsize=512)
+def _build_trigger(schedule_type: str, hour: int, minute: int, day):
+    """
+    Monta o CronTrigger de um agendamento; agendamentos com os mesmos
+    parâmetros compartilham a mesma instância (o trigger não guarda estado)
+    
+    Args:
+        schedule_type: 'daily', 'weekly' ou 'monthly'
+        hour: Hora (0-23)
+        minute: Minuto (0-59)
+        day: Dia da semana (weekly, 0 = Segunda ... 6 = Domingo),
+             dia do mês (monthly) ou None (daily)
+    
+    Returns:
+        CronTrigger ou None para tipo inválido
+    """
+    if schedule_type == 'daily':
+        # Executa todos os dias no horário especificado
+        return CronTrigger(hour=hour, minute=minute)
+    
+    if schedule_type == 'weekly':
+        # Executa uma vez por semana no dia especificado
+        return CronTrigger(day_of_week=day, hour=hour, minute=minute)
+    
+    if schedule_type == 'monthly':
+        # Executa uma vez por mês no dia especificado
+        return CronTrigger(day=day, hour=hour, minute=minute)
+    
+    return None
 
 
 class Scheduler:
@@ -22,7 +96,34 @@ class Scheduler:
         self.db_manager = db_manager
         self.scheduler = BackgroundScheduler()
         self.logger = logging.getLogger(__name__)
-        self.jobs = {}  # Dicionário para rastrear jobs: {id: job}
+        
+        # Execuções disparadas pelo tick (uma por operação agendada vencida)
+        self._dispatch_executor = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix='schedule'
+        )
+        
+        # Pool reutilizável para o fan-out por cliente (paralelismo limitado)
+        self._executor = ThreadPoolExecutor(
+            max_workers=db_manager.get_max_sync_workers(),
+            thread_name_prefix='sync'
+        )
+        
+        # Uma rodada por vez para cada tipo de operação
+        self._run_locks = {'ENVIAR': threading.Lock(), 'BUSCAR': threading.Lock()}
+        
+        # Cache das configurações de conexão: {tipo: (timestamp, config)}
+        self._cfg_cache = {'oracle': (0, None), 'oriontax': (0, None)}
+        self._cfg_lock = threading.RLock()
+        
+        # Logs de execução acumulados durante a rodada e gravados em lote
+        self._log_queue = queue.Queue()
+        
+        # Conexões Oracle/OrionTax reaproveitadas por thread do pool
+        self._tls = threading.local()
+        self._cached_clients = []
+        self._cached_clients_lock = threading.Lock()
+        atexit.register(self._close_cached_clients)
     
     def start(self):
         """Inicia o scheduler"""
@@ -30,36 +131,60 @@ class Scheduler:
             self.scheduler.start()
             self.logger.info("Scheduler iniciado")
             
-            # Carregar agendamentos do banco
+            # Um único job verifica a cada minuto os agendamentos vencidos
+            self.scheduler.add_job(
+                func=self._tick,
+                trigger=CronTrigger(second=0),
+                id='master_tick',
+                name='Agendamentos',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=60
+            )
+            
+            # Recalcular a próxima execução dos agendamentos do banco
             self.load_schedules()
             
         except Exception as e:
-            self.logger.error(f"Erro ao iniciar scheduler: {e}")
+            self.logger.error("Erro ao iniciar scheduler: %s", e)
     
     def stop(self):
         """Para o scheduler"""
         try:
             self.scheduler.shutdown(wait=False)
+            self._dispatch_executor.shutdown(wait=False)
+            self._executor.shutdown(wait=False)
+            self._close_cached_clients()
+            _build_trigger.cache_clear()
+            
+            # Garantir que os logs de execução pendentes sejam gravados
+            # (os da rodada em andamento ainda estão em self._log_queue)
+            self._flush_logs()
+            self.db_manager.flush_logs(timeout=5)
             self.logger.info("Scheduler parado")
         except Exception as e:
-            self.logger.error(f"Erro ao parar scheduler: {e}")
+            self.logger.error("Erro ao parar scheduler: %s", e)
     
     def load_schedules(self):
-        """Carrega todos os agendamentos do banco de dados"""
+        """Recalcula a próxima execução de todos os agendamentos do banco"""
         try:
             schedules = self.db_manager.get_all_schedules()
             
             for schedule in schedules:
-                self.add_job(schedule)
+                self.add_job(_split_schedule_time(schedule))
             
-            self.logger.info(f"{len(schedules)} agendamentos carregados")
+            self.logger.info("%s agendamentos carregados", len(schedules))
             
         except Exception as e:
-            self.logger.error(f"Erro ao carregar agendamentos: {e}")
+            self.logger.error("Erro ao carregar agendamentos: %s", e)
     
     def add_job(self, schedule: dict):
         """
-        Adiciona um job ao scheduler
+        Registra um agendamento gravando sua próxima execução no banco
+        
+        O disparo é feito pelo tick (_tick), que consulta apenas os
+        agendamentos vencidos; nenhum job é mantido por agendamento.
         
         Args:
             schedule: Dict com dados do agendamento
@@ -72,60 +197,42 @@ class Scheduler:
         """
         try:
             if not schedule['is_active']:
-                self.logger.info(f"Agendamento {schedule['id']} está inativo")
+                self.db_manager.set_schedule_next_run(schedule['id'], None)
+                self.logger.info("Agendamento %s está inativo", schedule['id'])
                 return
             
-            # Remover job existente se houver
-            if schedule['id'] in self.jobs:
-                self.remove_job(schedule['id'])
-            
             # Criar trigger baseado no tipo de agendamento
-            trigger = self._create_trigger(schedule)
+            trigger = self._create_trigger(_split_schedule_time(schedule))
             
             if trigger is None:
-                self.logger.error(f"Não foi possível criar trigger para agendamento {schedule['id']}")
+                self.logger.error("Não foi possível criar trigger para agendamento %s", schedule['id'])
                 return
             
-            # Adicionar job ao scheduler
-            job = self.scheduler.add_job(
-                func=self._execute_sync,
-                trigger=trigger,
-                args=[schedule['operation_type']],
-                id=f"schedule_{schedule['id']}",
-                name=f"{schedule['operation_type']}",
-                replace_existing=True
-            )
-            
-            # Armazenar referência do job
-            self.jobs[schedule['id']] = job
+            next_run = self._next_run(trigger, datetime.now().astimezone())
+            self.db_manager.set_schedule_next_run(schedule['id'], next_run)
             
-            self.logger.info(f"Job adicionado: {schedule['id']} - {schedule['operation_type']}")
+            self.logger.info(
+                "Job adicionado: %s - %s (próxima execução: %s)",
+                schedule['id'], schedule['operation_type'], next_run
+            )
             
         except Exception as e:
-            self.logger.error(f"Erro ao adicionar job: {e}")
-            import traceback
+            self.logger.error("Erro ao adicionar job: %s", e)
             self.logger.error(traceback.format_exc())
     
     def remove_job(self, schedule_id: int):
         """
-        Remove um job do scheduler
+        Remove um agendamento da fila de execução
         
         Args:
             schedule_id: ID do agendamento
         """
         try:
-            job_id = f"schedule_{schedule_id}"
-            
-            if job_id in [job.id for job in self.scheduler.get_jobs()]:
-                self.scheduler.remove_job(job_id)
-                self.logger.info(f"Job removido: {schedule_id}")
-            
-            # Remover do dicionário de jobs
-            if schedule_id in self.jobs:
-                del self.jobs[schedule_id]
+            self.db_manager.set_schedule_next_run(schedule_id, None)
+            self.logger.info("Job removido: %s", schedule_id)
                 
         except Exception as e:
-            self.logger.error(f"Erro ao remover job: {e}")
+            self.logger.error("Erro ao remover job: %s", e)
     
     def update_job(self, schedule: dict):
         """
@@ -135,70 +242,73 @@ class Scheduler:
             schedule: Dict com dados atualizados do agendamento
         """
         try:
-            # Remover job antigo
-            self.remove_job(schedule['id'])
-            
-            # Adicionar job atualizado
-            self.add_job(schedule)
+            # Recalcula a próxima execução (ou limpa, se inativo)
+            self.add_job(_split_schedule_time(schedule))
             
-            self.logger.info(f"Job atualizado: {schedule['id']}")
+            self.logger.info("Job atualizado: %s", schedule['id'])
             
         except Exception as e:
-            self.logger.error(f"Erro ao atualizar job: {e}")
+            self.logger.error("Erro ao atualizar job: %s", e)
     
     def _create_trigger(self, schedule: dict):
         """
         Cria um CronTrigger baseado no tipo de agendamento
         
         Args:
-            schedule: Dict com dados do agendamento
+            schedule: Dict com dados do agendamento, já normalizado por
+                      _split_schedule_time (chaves '_hour' e '_minute')
             
         Returns:
             CronTrigger ou None
         """
+        schedule_type = schedule['schedule_type']
+        day = schedule['schedule_day'] if schedule_type != 'daily' else None
+        
+        trigger = _build_trigger(schedule_type, schedule['_hour'], schedule['_minute'], day)
+        
+        if trigger is None:
+            self.logger.error("Tipo de agendamento inválido: %s", schedule_type)
+        
+        return trigger
+    
+    def _next_run(self, trigger, now: datetime):
+        """
+        Calcula a próxima execução do trigger a partir de 'now'
+        
+        Returns:
+            Data/hora local no formato NEXT_RUN_FORMAT ou None
+        """
+        next_fire = trigger.get_next_fire_time(None, now)
+        if next_fire is None:
+            return None
+        return next_fire.astimezone().strftime(NEXT_RUN_FORMAT)
+    
+    def _tick(self):
+        """
+        Executado a cada minuto: dispara os agendamentos vencidos e
+        grava a próxima execução de cada um
+        """
         try:
-            schedule_time = schedule['schedule_time']  # "HH:MM"
-            hour, minute = schedule_time.split(':')
-            hour = int(hour)
-            minute = int(minute)
-            
-            schedule_type = schedule['schedule_type']
-            
-            if schedule_type == 'daily':
-                # Executa todos os dias no horário especificado
-                trigger = CronTrigger(
-                    hour=hour,
-                    minute=minute
-                )
-                
-            elif schedule_type == 'weekly':
-                # Executa uma vez por semana no dia especificado
-                # 0 = Segunda, 1 = Terça, ..., 6 = Domingo
-                day_of_week = schedule['schedule_day']
-                trigger = CronTrigger(
-                    day_of_week=day_of_week,
-                    hour=hour,
-                    minute=minute
-                )
+            now = datetime.now().astimezone()
+            due = self.db_manager.get_due_schedules(now.strftime(NEXT_RUN_FORMAT))
+            
+            for schedule in due:
+                try:
+                    trigger = self._create_trigger(_split_schedule_time(schedule))
+                    next_run = self._next_run(trigger, now) if trigger else None
+                except Exception as e:
+                    self.logger.error("Erro ao criar trigger do agendamento %s: %s", schedule['id'], e)
+                    next_run = None
+                self.db_manager.set_schedule_next_run(schedule['id'], next_run)
                 
-            elif schedule_type == 'monthly':
-                # Executa uma vez por mês no dia especificado
-                day = schedule['schedule_day']
-                trigger = CronTrigger(
-                    day=day,
-                    hour=hour,
-                    minute=minute
+                self.logger.info(
+                    "Agendamento %s vencido - %s (próxima execução: %s)",
+                    schedule['id'], schedule['operation_type'], next_run
                 )
+                self._dispatch_executor.submit(self._execute_sync, schedule['operation_type'])
                 
-            else:
-                self.logger.error(f"Tipo de agendamento inválido: {schedule_type}")
-                return None
-            
-            return trigger
-            
         except Exception as e:
-            self.logger.error(f"Erro ao criar trigger: {e}")
-            return None
+            self.logger.error("Erro ao verificar agendamentos: %s", e)
     
     def _execute_sync(self, operation_type: str):
         """
@@ -208,14 +318,20 @@ class Scheduler:
         Args:
             operation_type: 'ENVIAR' ou 'BUSCAR'
         """
+        # Evita duas rodadas simultâneas da mesma operação
+        lock = self._run_locks[operation_type]
+        if not lock.acquire(blocking=False):
+            self.logger.warning("Sincronização %s anterior ainda em andamento; ignorando", operation_type)
+            return
+        
         try:
-            self.logger.info(f"========================================")
-            self.logger.info(f"Executando sincronização agendada: {operation_type}")
-            self.logger.info(f"========================================")
+            self.logger.info("========================================")
+            self.logger.info("Executando sincronização agendada: %s", operation_type)
+            self.logger.info("========================================")
             
-            # ✅ Buscar configurações (THREAD-SAFE)
-            oracle_config = self.db_manager.get_oracle_config_threadsafe()
-            oriontax_config = self.db_manager.get_oriontax_config_threadsafe()
+            # ✅ Buscar configurações (THREAD-SAFE, com cache)
+            oracle_config = self._get_cfg('oracle')
+            oriontax_config = self._get_cfg('oriontax')
             
             if not oracle_config:
                 self.logger.error("Configuração Oracle não encontrada")
@@ -232,30 +348,196 @@ class Scheduler:
                 self.logger.warning("Nenhum cliente cadastrado")
                 return
             
-            # ✅ Executar para CADA cliente
+            # ✅ Executar para CADA cliente (pool com paralelismo limitado)
+            futures = []
             for cliente in clientes:
                 cnpj = cliente['cnpj']
                 nome = cliente['nome']
                 
-                self.logger.info(f"Processando cliente: {nome} (CNPJ: {cnpj})")
+                self.logger.info("Processando cliente: %s (CNPJ: %s)", nome, cnpj)
                 
-                # Executar em thread separada para não bloquear
-                thread = threading.Thread(
-                    target=self._execute_sync_for_client,
-                    args=(operation_type, oracle_config, oriontax_config, cnpj, nome)
-                )
-                thread.daemon = True
-                thread.start()
+                futures.append(self._executor.submit(
+                    self._execute_sync_for_client,
+                    operation_type, oracle_config, oriontax_config, cnpj, nome
+                ))
+            
+            self.logger.info("Sincronização agendada iniciada para %s cliente(s)", len(clientes))
+            
+            # Aguardar todos os clientes (erros já são tratados por cliente)
+            for future in as_completed(futures):
+                future.result()
+            
+            # Logs de todos os clientes entregues à thread de escrita do
+            # DatabaseManager como um único lote (gravado numa só transação)
+            self._flush_logs()
             
             # Registrar última execução (THREAD-SAFE)
             self.db_manager.update_schedule_last_run(operation_type)
             
-            self.logger.info(f"Sincronização agendada iniciada para {len(clientes)} cliente(s)")
+            self.logger.info("Sincronização agendada concluída para %s cliente(s)", len(clientes))
             
         except Exception as e:
-            self.logger.error(f"Erro ao executar sincronização: {e}")
-            import traceback
+            self.logger.error("Erro ao executar sincronização: %s", e)
             self.logger.error(traceback.format_exc())
+        
+        finally:
+            lock.release()
+    
+    def _get_cfg(self, kind: str):
+        """
+        Retorna a configuração de conexão, relendo do banco apenas quando
+        o cache expira (CONFIG_CACHE_TTL) ou foi invalidado
+        
+        Args:
+            kind: 'oracle' ou 'oriontax'
+        """
+        with self._cfg_lock:
+            timestamp, config = self._cfg_cache[kind]
+            
+            if config is None or time.monotonic() - timestamp >= CONFIG_CACHE_TTL:
+                if kind == 'oracle':
+                    config = self.db_manager.get_oracle_config_threadsafe()
+                else:
+                    config = self.db_manager.get_oriontax_config_threadsafe()
+                self._cfg_cache[kind] = (time.monotonic(), config)
+            
+            return config
+    
+    def invalidate_cfg(self):
+        """Descarta as configurações em cache (chamar após salvar configurações)"""
+        with self._cfg_lock:
+            self._cfg_cache = {'oracle': (0, None), 'oriontax': (0, None)}
+    
+    def _queue_log(self, tipo_operacao: str, status: str, mensagem: str = None,
+                   registros: int = 0, tempo: float = 0, error_details: str = None):
+        """Enfileira um log de execução para gravação em lote ao final da rodada"""
+        self._log_queue.put({
+            'tipo_operacao': tipo_operacao,
+            'status': status,
+            'mensagem': mensagem,
+            'registros': registros,
+            'tempo': tempo,
+            'error_details': error_details,
+        })
+    
+    def _flush_logs(self):
+        """Entrega ao DatabaseManager, como um único lote, todos os logs enfileirados"""
+        rows = []
+        while True:
+            try:
+                rows.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            self.db_manager.add_logs_bulk_threadsafe(rows)
+        except Exception as e:
+            self.logger.error("Erro ao gravar logs de execução: %s", e)
+    
+    # ------------------------------------------------------------------
+    # CONEXÕES REUTILIZÁVEIS (uma por thread do pool)
+    # ------------------------------------------------------------------
+
+    def _get_cached_client(self, attr: str, client_cls, config: dict):
+        """
+        Retorna um cliente conectado guardado na thread atual, reconectando
+        se a configuração mudou ou se a conexão caiu.
+        
+        Args:
+            attr: Nome do atributo em self._tls ('oracle' ou 'oriontax')
+            client_cls: Classe do cliente (OracleClient / OrionTaxClient)
+            config: Configuração da conexão
+        """
+        config_key = repr(sorted(config.items()))
+        cached = getattr(self._tls, attr, None)
+        
+        if cached is not None:
+            cached_key, client = cached
+            if cached_key == config_key and client.is_alive():
+                return client
+            
+            # Configuração alterada ou conexão perdida: descartar
+            client.disconnect()
+            with self._cached_clients_lock:
+                if client in self._cached_clients:
+                    self._cached_clients.remove(client)
+        
+        client = client_cls(config)
+        client.connect()
+        
+        setattr(self._tls, attr, (config_key, client))
+        with self._cached_clients_lock:
+            self._cached_clients.append(client)
+        
+        return client
+    
+    def _get_oracle(self, oracle_config: dict):
+        """Retorna o OracleClient conectado da thread atual"""
+        return self._get_cached_client('oracle', OracleClient, oracle_config)
+    
+    def _get_oriontax(self, oriontax_config: dict):
+        """Retorna o OrionTaxClient conectado da thread atual"""
+        return self._get_cached_client('oriontax', OrionTaxClient, oriontax_config)
+    
+    def _close_cached_clients(self):
+        """Fecha todas as conexões mantidas pelas threads do pool"""
+        with self._cached_clients_lock:
+            clients, self._cached_clients = self._cached_clients, []
+        
+        for client in clients:
+            client.disconnect()
+    
+    def _pipelined(self, source):
+        """
+        Lê 'source' em uma thread produtora, entregando os itens por uma
+        fila limitada (PIPELINE_DEPTH). Assim a leitura da próxima tabela
+        acontece enquanto a anterior é gravada no destino.
+        
+        Erros da leitura são relançados no consumidor. Se o consumidor
+        parar antes do fim (erro ou close()), a produtora é encerrada.
+        
+        Args:
+            source: Iterável de tuplas (chave, DataFrame)
+        """
+        buffer = queue.Queue(maxsize=PIPELINE_DEPTH)
+        stop = threading.Event()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            try:
+                for item in source:
+                    if not put(item):
+                        return
+                put(_END_OF_STREAM)
+            except Exception as e:
+                put(e)
+        
+        producer = threading.Thread(
+            target=produce,
+            name=f'{threading.current_thread().name}-leitura',
+            daemon=True
+        )
+        producer.start()
+        
+        try:
+            while True:
+                item = buffer.get()
+                if item is _END_OF_STREAM:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
     
     def _execute_sync_for_client(self, operation_type: str, oracle_config: dict, 
                                  oriontax_config: dict, cnpj: str, nome_cliente: str):
@@ -270,45 +552,39 @@ class Scheduler:
             cnpj: CNPJ do cliente
             nome_cliente: Nome do cliente
         """
-        from datetime import datetime
-        from core.oracle_client import OracleClient
-        from core.oriontax_client import OrionTaxClient
-        
         try:
-            start_time = datetime.now()
+            start = perf_counter()
             
             if operation_type == 'ENVIAR':
                 # ✅ ENVIAR: Oracle → PostgreSQL (OrionTax)
                 
-                self.logger.info(f'[{nome_cliente}] Conectando ao Oracle...')
-                oracle_client = OracleClient(oracle_config)
-                oracle_client.connect()
-                
-                self.logger.info(f'[{nome_cliente}] Lendo VIEWs do Oracle (CNPJ: {cnpj})...')
-                dataframes = oracle_client.read_views_to_dataframes()
-                
-                total_records = sum(len(df) for df in dataframes.values())
-                self.logger.info(f'[{nome_cliente}] ✓ {total_records} registros lidos do Oracle')
-                
-                oracle_client.disconnect()
+                self.logger.info('[%s] Conectando ao Oracle e ao OrionTax...', nome_cliente)
+                oracle_client = self._get_oracle(oracle_config)
+                oriontax_client = self._get_oriontax(oriontax_config)
                 
-                self.logger.info(f'[{nome_cliente}] Conectando ao OrionTax...')
-                oriontax_client = OrionTaxClient(oriontax_config)
-                oriontax_client.connect()
-                
-                self.logger.info(f'[{nome_cliente}] Enviando dados para OrionTax...')
-                success, message = oriontax_client.write_dataframes_to_views(cnpj, dataframes)
+                # Cada VIEW é gravada assim que lida e descartada em seguida;
+                # a leitura da próxima ocorre em paralelo à gravação
+                self.logger.info('[%s] Enviando VIEWs do Oracle para OrionTax (CNPJ: %s)...', nome_cliente, cnpj)
+                counter = {'registros': 0}
+                pipeline = self._pipelined(oracle_client.read_views_iter())
+                try:
+                    success, message = oriontax_client.write_views_stream(
+                        cnpj, _count_records(pipeline, counter)
+                    )
+                finally:
+                    pipeline.close()
                 
-                oriontax_client.disconnect()
+                total_records = counter['registros']
+                self.logger.info('[%s] ✓ %s registros lidos do Oracle', nome_cliente, total_records)
                 
-                tempo = (datetime.now() - start_time).total_seconds()
+                tempo = perf_counter() - start
                 
                 if success:
-                    self.logger.info(f'[{nome_cliente}] ✓ Dados enviados com sucesso! ({tempo:.2f}s)')
-                    self.logger.info(f'[{nome_cliente}] {message}')
+                    self.logger.info('[%s] ✓ Dados enviados com sucesso! (%.2fs)', nome_cliente, tempo)
+                    self.logger.info('[%s] %s', nome_cliente, message)
                     
-                    # ✅ Registrar no log do banco (THREAD-SAFE)
-                    self.db_manager.add_log_threadsafe(
+                    # ✅ Enfileirar log (gravado em lote ao final da rodada)
+                    self._queue_log(
                         tipo_operacao='ENVIAR',
                         status='SUCESSO',
                         mensagem=f'Cliente: {nome_cliente} - {message}',
@@ -316,9 +592,9 @@ class Scheduler:
                         tempo=tempo
                     )
                 else:
-                    self.logger.error(f'[{nome_cliente}] ✗ Erro ao enviar: {message}')
+                    self.logger.error('[%s] ✗ Erro ao enviar: %s', nome_cliente, message)
                     
-                    self.db_manager.add_log_threadsafe(
+                    self._queue_log(
                         tipo_operacao='ENVIAR',
                         status='ERRO',
                         mensagem=f'Cliente: {nome_cliente}',
@@ -328,44 +604,58 @@ class Scheduler:
             elif operation_type == 'BUSCAR':
                 # ✅ BUSCAR: PostgreSQL (OrionTax) → Oracle
                 
-                self.logger.info(f'[{nome_cliente}] Conectando ao OrionTax...')
-                oriontax_client = OrionTaxClient(oriontax_config)
-                oriontax_client.connect()
-                
-                self.logger.info(f'[{nome_cliente}] Lendo tabelas TMP do OrionTax (CNPJ: {cnpj})...')
-                dataframes = oriontax_client.read_tmp_tables_to_dataframes(cnpj)
+                self.logger.info('[%s] Conectando ao OrionTax e ao Oracle...', nome_cliente)
+                oriontax_client = self._get_oriontax(oriontax_config)
+                oracle_client = self._get_oracle(oracle_config)
                 
-                total_records = sum(len(df) for df in dataframes.values())
-                self.logger.info(f'[{nome_cliente}] ✓ {total_records} registros lidos do OrionTax')
-                
-                oriontax_client.disconnect()
-                
-                self.logger.info(f'[{nome_cliente}] Conectando ao Oracle...')
-                oracle_client = OracleClient(oracle_config)
-                oracle_client.connect()
-                
-                self.logger.info(f'[{nome_cliente}] Gravando dados no Oracle...')
-                success, message = oracle_client.write_dataframes_to_tmp_tables(dataframes)
+                # Cada tabela TMP é gravada assim que lida e descartada em seguida;
+                # a leitura da próxima ocorre em paralelo à gravação
+                self.logger.info('[%s] Gravando tabelas TMP do OrionTax no Oracle (CNPJ: %s)...', nome_cliente, cnpj)
+                counter = {'registros': 0}
+                pipeline = self._pipelined(oriontax_client.read_tmp_tables_iter(cnpj))
+                try:
+                    success, message = oracle_client.write_tmp_tables_stream(
+                        _count_records(pipeline, counter)
+                    )
+                finally:
+                    pipeline.close()
                 
-                oracle_client.disconnect()
+                total_records = counter['registros']
+                self.logger.info('[%s] ✓ %s registros lidos do OrionTax', nome_cliente, total_records)
                 
-                tempo = (datetime.now() - start_time).total_seconds()
+                tempo = perf_counter() - start
                 
                 if success:
-                    self.logger.info(f'[{nome_cliente}] ✓ Dados recebidos com sucesso! ({tempo:.2f}s)')
-                    self.logger.info(f'[{nome_cliente}] {message}')
+                    self.logger.info('[%s] ✓ Dados recebidos com sucesso! (%.2fs)', nome_cliente, tempo)
+                    self.logger.info('[%s] %s', nome_cliente, message)
                     
-                    self.db_manager.add_log_threadsafe(
-                        tipo_operacao='BUSCAR',
-                        status='SUCESSO',
-                        mensagem=f'Cliente: {nome_cliente} - {message}',
-                        registros=total_records,
-                        tempo=tempo
-                    )
+                    rejected = oracle_client.rejected_rows
+                    if rejected:
+                        # Linhas recusadas pelo Oracle não abortam a carga, mas não podem
+                        # aparecer como SUCESSO no histórico (status só aceita SUCESSO/ERRO)
+                        self.logger.warning('[%s] ⚠️  %s registros rejeitados pelo Oracle',
+                                            nome_cliente, rejected)
+                        
+                        self._queue_log(
+                            tipo_operacao='BUSCAR',
+                            status='ERRO',
+                            mensagem=f'Cliente: {nome_cliente} - carga parcial: {rejected} registros rejeitados',
+                            registros=total_records,
+                            tempo=tempo,
+                            error_details=message
+                        )
+                    else:
+                        self._queue_log(
+                            tipo_operacao='BUSCAR',
+                            status='SUCESSO',
+                            mensagem=f'Cliente: {nome_cliente} - {message}',
+                            registros=total_records,
+                            tempo=tempo
+                        )
                 else:
-                    self.logger.error(f'[{nome_cliente}] ✗ Erro ao buscar: {message}')
+                    self.logger.error('[%s] ✗ Erro ao buscar: %s', nome_cliente, message)
                     
-                    self.db_manager.add_log_threadsafe(
+                    self._queue_log(
                         tipo_operacao='BUSCAR',
                         status='ERRO',
                         mensagem=f'Cliente: {nome_cliente}',
@@ -373,11 +663,10 @@ class Scheduler:
                     )
         
         except Exception as e:
-            import traceback
             error_msg = f'Erro: {str(e)}\n\n{traceback.format_exc()}'
-            self.logger.error(f'[{nome_cliente}] {error_msg}')
+            self.logger.error('[%s] %s', nome_cliente, error_msg)
             
-            self.db_manager.add_log_threadsafe(
+            self._queue_log(
                 tipo_operacao=operation_type,
                 status='ERRO',
                 mensagem=f'Cliente: {nome_cliente}',
@@ -407,37 +696,42 @@ class Scheduler:
                 id='heartbeat',
                 name='Heartbeat',
                 replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=60,
             )
-            self.logger.info(f"Heartbeat iniciado — intervalo: {interval_minutes} minuto(s)")
+            self.logger.info("Heartbeat iniciado — intervalo: %s minuto(s)", interval_minutes)
         except Exception as e:
-            self.logger.error(f"Erro ao iniciar heartbeat: {e}")
+            self.logger.error("Erro ao iniciar heartbeat: %s", e)
 
     def stop_heartbeat(self):
         """Remove o job de heartbeat do scheduler, se existir."""
         try:
-            job_ids = [job.id for job in self.scheduler.get_jobs()]
-            if 'heartbeat' in job_ids:
+            if self.scheduler.get_job('heartbeat') is not None:
                 self.scheduler.remove_job('heartbeat')
                 self.logger.info("Heartbeat parado")
         except Exception as e:
-            self.logger.error(f"Erro ao parar heartbeat: {e}")
+            self.logger.error("Erro ao parar heartbeat: %s", e)
+
+    def job_count(self) -> int:
+        """Quantidade de jobs que get_jobs geraria (uma contagem no banco, sem montar os dicts)"""
+        return self.db_manager.count_scheduled()
 
     def get_jobs(self):
         """
-        Retorna lista de jobs ativos
+        Gera os agendamentos ativos com a próxima execução (sob demanda)
         
-        Returns:
-            Lista de dicts com informações dos jobs
+        Yields:
+            Dicts com informações dos jobs
         """
-        jobs = []
-        
-        for job in self.scheduler.get_jobs():
-            next_run = job.next_run_time
-            
-            jobs.append({
-                'id': job.id,
-                'name': job.name,
-                'next_run': next_run.strftime('%d/%m/%Y %H:%M:%S') if next_run else 'N/A'
-            })
-        
-        return jobs
\ No newline at end of file
+        for schedule in self.db_manager.get_all_schedules():
+            next_run = schedule.get('next_run')
+            if not schedule['is_active'] or not next_run:
+                continue
+            
+            # 'YYYY-MM-DD HH:MM:SS' → 'DD/MM/YYYY HH:MM:SS' sem parse de data
+            yield {
+                'id': f"schedule_{schedule['id']}",
+                'name': schedule['operation_type'],
+                'next_run': f"{next_run[8:10]}/{next_run[5:7]}/{next_run[:4]} {next_run[11:19]}"
+            }
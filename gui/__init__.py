@@ -1,11 +1,30 @@
 """
 Módulo de Interface Gráfica
+
+Os diálogos são importados sob demanda (PEP 562): importar o pacote não
+carrega PyQt5 nem os módulos de tela até que uma classe seja acessada.
 """
-from .login import LoginDialog
-from .main_window import MainWindow
-from .settings import DatabaseConfigDialog, OracleConfigDialog, OrionTaxConfigDialog
-from .schedule import ScheduleDialog
-from .client_dialog import ClientDialog
+import importlib
+
+_lazy = {
+    'LoginDialog': ('gui.login', 'LoginDialog'),
+    'MainWindow': ('gui.main_window', 'MainWindow'),
+    'DatabaseConfigDialog': ('gui.settings', 'DatabaseConfigDialog'),
+    'OracleConfigDialog': ('gui.settings', 'OracleConfigDialog'),
+    'OrionTaxConfigDialog': ('gui.settings', 'OrionTaxConfigDialog'),
+    'ScheduleDialog': ('gui.schedule', 'ScheduleDialog'),
+    'ClientDialog': ('gui.client_dialog', 'ClientDialog'),
+}
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module_name, attr = _lazy[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value  # próximos acessos não passam por aqui
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'LoginDialog',
@@ -15,4 +34,4 @@ __all__ = [
     'OrionTaxConfigDialog',
     'ScheduleDialog',
     'ClientDialog'
-]
\ No newline at end of file
+]
@@ -1,6 +1,8 @@
 """
 Diálogo de Gerenciamento de Clientes
 """
+import re
+
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QPushButton, QMessageBox, QGroupBox,
                              QFormLayout)
@@ -8,6 +10,44 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from config.database import db_manager
 
+# Remove tudo que não for dígito (CNPJ formatado → só números)
+_NON_DIGIT = re.compile(r'\D')
+
+# Estilo do diálogo (definido uma única vez, no carregamento do módulo)
+CLIENT_DIALOG_QSS = """
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLineEdit {
+        padding: 8px;
+        border: 1px solid #bdc3c7;
+        border-radius: 3px;
+    }
+    QLineEdit:focus {
+        border: 2px solid #3498db;
+    }
+    QPushButton {
+        padding: 8px 20px;
+        background-color: #27ae60;
+        color: white;
+        border: none;
+        border-radius: 3px;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #229954;
+    }
+"""
+
 
 class ClientDialog(QDialog):
     """Diálogo para Adicionar/Editar Cliente"""
@@ -79,39 +119,7 @@ class ClientDialog(QDialog):
     
     def apply_styles(self):
         """Aplica estilos"""
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #bdc3c7;
-                border-radius: 3px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3498db;
-            }
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
+        self.setStyleSheet(CLIENT_DIALOG_QSS)
     
     def load_cliente(self):
         """Carrega dados do cliente para edição"""
@@ -133,13 +141,13 @@ class ClientDialog(QDialog):
             True se válido
         """
         # Limpar CNPJ
-        cnpj_limpo = ''.join(filter(str.isdigit, cnpj))
+        cnpj_limpo = _NON_DIGIT.sub('', cnpj)
         
         if len(cnpj_limpo) != 14:
             return False
         
         # Validação básica: não pode ter todos os dígitos iguais
-        if cnpj_limpo == cnpj_limpo[0] * 14:
+        if len(set(cnpj_limpo)) == 1:
             return False
         
         return True
@@ -1,11 +1,60 @@
 """
 Tela de Login do Sistema OrionTax Sync
 """
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QLineEdit, QPushButton, QMessageBox, QFrame,
-                             QSpacerItem, QSizePolicy)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QIcon, QFont, QPalette, QColor
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QLineEdit,
+                             QPushButton, QFrame)
+from PyQt5.QtCore import (Qt, pyqtSignal, pyqtSlot, QObject, QRunnable, QThreadPool,
+                          QTimer)
+from PyQt5.QtGui import QFont
+import logging
+
+
+# Espera máxima (s) entre tentativas após falhas consecutivas
+MAX_BACKOFF_SECONDS = 30
+
+
+class WorkerSignals(QObject):
+    """Sinais dos workers do login (QRunnable não é QObject)"""
+    
+    finished = pyqtSignal(object)  # resultado do worker
+
+
+class AuthWorker(QRunnable):
+    """Executa a autenticação (consulta + verificação do hash) no QThreadPool"""
+    
+    def __init__(self, db_manager, username: str, password: str):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.db_manager = db_manager
+        self.username = username
+        self.password = password
+    
+    def run(self):
+        """Autentica e devolve o resultado (dict do usuário, None ou Exception)"""
+        try:
+            result = self.db_manager.authenticate_user_threadsafe(self.username, self.password)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Erro ao autenticar: {e}")
+            result = e
+        self.signals.finished.emit(result)
+
+
+class PrefetchWorker(QRunnable):
+    """Carrega os dados do usuário no cache de autenticação enquanto a senha é digitada"""
+    
+    def __init__(self, db_manager, username: str):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.db_manager = db_manager
+        self.username = username
+    
+    def run(self):
+        """Pré-carrega o usuário (falhas são ignoradas: o login consulta o banco)"""
+        try:
+            self.db_manager.prefetch_user(self.username)
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"Pré-carga do usuário falhou: {e}")
+        self.signals.finished.emit(None)
 
 
 class LoginDialog(QDialog):
@@ -13,6 +62,57 @@ class LoginDialog(QDialog):
     
     login_successful = pyqtSignal(dict)  # Emite dados do usuário ao logar
     
+    # Estilo do diálogo (seletores restritos a #loginDialog para poder ser
+    # instalado uma única vez na QApplication)
+    _STYLESHEET = """
+        QDialog#loginDialog {
+            background-color: #ecf0f1;
+        }
+        #loginDialog QLineEdit {
+            padding: 12px 15px;
+            border: 2px solid #bdc3c7;
+            border-radius: 6px;
+            background-color: white;
+            color: #2c3e50;
+            font-size: 14px;
+        }
+        #loginDialog QLineEdit:focus {
+            border: 2px solid #3498db;
+            background-color: #ffffff;
+        }
+        #loginDialog QLineEdit::placeholder {
+            color: #95a5a6;
+        }
+        #loginDialog QPushButton {
+            background-color: #3498db;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            font-size: 16px;
+            font-weight: bold;
+            padding: 5px;
+        }
+        #loginDialog QPushButton:hover {
+            background-color: #2980b9;
+        }
+        #loginDialog QPushButton:pressed {
+            background-color: #21618c;
+        }
+    """
+    _stylesheet_installed = False
+    
+    @classmethod
+    def install_stylesheet(cls, app):
+        """
+        Instala o estilo do login na QApplication (chamar uma vez na inicialização)
+        
+        Com o estilo global, os diálogos criados depois não precisam de setStyleSheet.
+        """
+        if cls._stylesheet_installed:
+            return
+        app.setStyleSheet(app.styleSheet() + cls._STYLESHEET)
+        cls._stylesheet_installed = True
+    
     def __init__(self, db_manager, parent=None):  # ✅ Receber db_manager
         """
         Inicializa o diálogo de login
@@ -25,9 +125,18 @@ class LoginDialog(QDialog):
         self.db_manager = db_manager  # ✅ Armazenar db_manager
         self.user_data = None
         self.username = None  # ✅ Adicionar atributo username
+        self._auth_worker = None
+        self._prefetch_worker = None  # mantido até o fim (sinais vivos)
+        self._attempt_in_flight = False
+        self._backoff_active = False
+        self._fail_count = 0
         
+        self.setObjectName('loginDialog')
         self.init_ui()
-        self.apply_styles()
+        
+        # Estilos no próximo ciclo do event loop: a janela é pintada antes
+        if not self._stylesheet_installed:
+            QTimer.singleShot(0, self.apply_styles)
     
     def init_ui(self):
         """Inicializa a interface"""
@@ -94,8 +203,18 @@ class LoginDialog(QDialog):
         self.password_input.setMinimumHeight(45)
         layout.addWidget(self.password_input)
         
+        # Mensagem de erro inline (sem diálogo modal)
+        self.error_label = QLabel('')
+        self.error_label.setStyleSheet('color: #c0392b; font-size: 12px;')
+        self.error_label.setWordWrap(True)
+        self.error_label.hide()
+        layout.addWidget(self.error_label)
+        
         # Conectar eventos
         self.username_input.returnPressed.connect(self.password_input.setFocus)
+        self.username_input.editingFinished.connect(self._prewarm)
+        self.username_input.textChanged.connect(self.error_label.hide)
+        self.password_input.textChanged.connect(self.error_label.hide)
         self.password_input.returnPressed.connect(self.login)
         
         # Espaço antes do botão
@@ -119,62 +238,101 @@ class LoginDialog(QDialog):
         # Focar no campo usuário
         self.username_input.setFocus()
 
+    def reset_fields(self):
+        """Limpa o formulário para reaproveitar o diálogo em um novo login"""
+        self.user_data = None
+        self.username = None
+        self.username_input.clear()
+        self.password_input.clear()
+        self.error_label.clear()
+        self.error_label.hide()
+        self.username_input.setFocus()
+
     def apply_styles(self):
         """Aplica estilos CSS"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #ecf0f1;
-            }
-            QLineEdit {
-                padding: 12px 15px;
-                border: 2px solid #bdc3c7;
-                border-radius: 6px;
-                background-color: white;
-                color: #2c3e50;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3498db;
-                background-color: #ffffff;
-            }
-            QLineEdit::placeholder {
-                color: #95a5a6;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
+    
+    def _prewarm(self):
+        """Busca o usuário em segundo plano assim que o campo usuário é concluído"""
+        username = self.username_input.text().strip()
+        if not username:
+            return
+        
+        if self._prefetch_worker is not None:
+            return
+        
+        # Threads do pool global são reaproveitadas (sem criar uma QThread por evento)
+        self._prefetch_worker = PrefetchWorker(self.db_manager, username)
+        self._prefetch_worker.signals.finished.connect(self._on_prefetch_done, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._prefetch_worker)
+    
+    @pyqtSlot(object)
+    def _on_prefetch_done(self, _):
+        """Libera nova pré-carga"""
+        self._prefetch_worker = None
     
     def login(self):
-        """Realiza o login"""
+        """Realiza o login (autenticação em thread separada)"""
+        # Ignorar Enter/cliques durante uma tentativa ou na espera após falhas
+        if self._attempt_in_flight or self._backoff_active:
+            return
+        
         username = self.username_input.text().strip()
         password = self.password_input.text()
         
         if not username or not password:
-            QMessageBox.warning(self, "Aviso", "Preencha todos os campos")
+            self._show_error("Preencha todos os campos")
             return
         
-        # ✅ Usar self.db_manager (recebido no construtor)
-        user = self.db_manager.authenticate_user(username, password)
+        # Bloquear novas tentativas enquanto a autenticação estiver em andamento
+        self._attempt_in_flight = True
+        self.login_button.setEnabled(False)
+        self.setCursor(Qt.WaitCursor)
+        
+        self._auth_worker = AuthWorker(self.db_manager, username, password)
+        self._auth_worker.signals.finished.connect(self._on_auth_done, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._auth_worker)
+    
+    @pyqtSlot(object)
+    def _on_auth_done(self, user):
+        """Trata o resultado da autenticação (executado na thread da interface)"""
+        self._auth_worker = None
+        self._attempt_in_flight = False
+        self.unsetCursor()
+        
+        if isinstance(user, Exception):
+            self.login_button.setEnabled(True)
+            self._show_error(f"Erro ao autenticar: {user}")
+            return
         
         if user:
+            self._fail_count = 0
+            self.login_button.setEnabled(True)
             self.user_data = user
             self.username = user['username']  # ✅ Definir username
             self.login_successful.emit(user)
             self.accept()
         else:
-            QMessageBox.critical(self, "Erro", "Usuário ou senha inválidos")
+            self._start_backoff()
             self.password_input.clear()
-            self.password_input.setFocus()
\ No newline at end of file
+            self.password_input.setFocus()
+            self._show_error("Usuário ou senha inválidos")
+    
+    def _show_error(self, message: str):
+        """Mostra a mensagem de erro abaixo dos campos"""
+        self.error_label.setText(message)
+        self.error_label.show()
+    
+    def _start_backoff(self):
+        """Bloqueia novas tentativas por um tempo exponencial (1s, 2s, 4s... até 30s)"""
+        self._fail_count += 1
+        self._backoff_active = True
+        self.login_button.setEnabled(False)
+        
+        delay = min(2 ** (self._fail_count - 1), MAX_BACKOFF_SECONDS)
+        QTimer.singleShot(delay * 1000, self._end_backoff)
+    
+    def _end_backoff(self):
+        """Libera novas tentativas após a espera"""
+        self._backoff_active = False
+        self.login_button.setEnabled(True)
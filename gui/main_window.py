@@ -4,113 +4,406 @@ Janela Principal do Sistema OrionTax Sync
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QTextEdit, QGroupBox,
                              QMessageBox, QStatusBar, QProgressBar, QTabWidget,
-                             QTableWidget, QTableWidgetItem, QHeaderView,
+                             QHeaderView, QLineEdit,
                              QAction, QMenu, QMenuBar, QComboBox, QDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QIcon, QFont, QColor
-from datetime import datetime, timezone
+from PyQt5.QtCore import (Qt, QThread, QObject, QRunnable, QThreadPool,
+                          pyqtSignal, pyqtSlot, QTimer)
+from PyQt5.QtGui import QIcon, QFont, QColor, QCursor, QPixmap, QPainter
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+import html
+import mmap
+import threading
 import traceback
 import logging
 
+from core.oracle_client import create_db_client
+from core.oriontax_client import OrionTaxClient
+from utils.logger import resolve_log_dir
+from version import APP_VERSION
+
 # from config.database import db_manager
-from gui.settings import OracleConfigDialog, OrionTaxConfigDialog, HeartbeatConfigDialog
 from gui.client_dialog import ClientDialog
+from gui.change_password import ChangePasswordDialog
 from gui.schedule import ScheduleDialog
+from gui.table_models import (ClientsTableModel, LogsTableModel, SchedulesTableModel,
+                              frozen, make_table_view, selected_record)
+
+# Intervalo (ms) para agrupar mensagens do console em uma única atualização
+CONSOLE_FLUSH_MS = 50
+
+# Limite de blocos do console (as mensagens mais antigas são descartadas)
+CONSOLE_MAX_BLOCKS = 2000
+
+# Visualizador de log: arquivos maiores mostram só o final (bytes)
+LOG_VIEW_TAIL_BYTES = 256 * 1024
+
+# Intervalo do keepalive das conexões mantidas entre operações
+KEEPALIVE_MS = 60_000
+
+# Logs exibidos na aba de logs (os mais recentes)
+LOGS_LIMIT = 100
+
+# Ícones dos botões: emoji renderizado uma vez em pixmap (emoji → QIcon)
+ICON_SIZE = 24
+_EMOJI_ICONS = {}
+
+
+def emoji_icon(emoji: str) -> QIcon:
+    """Renderiza o emoji em um QPixmap uma única vez e devolve o QIcon em cache"""
+    icon = _EMOJI_ICONS.get(emoji)
+    if icon is None:
+        pixmap = QPixmap(ICON_SIZE, ICON_SIZE)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        font = QFont('Segoe UI Emoji')
+        font.setPixelSize(ICON_SIZE - 6)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, emoji)
+        painter.end()
+        
+        icon = _EMOJI_ICONS[emoji] = QIcon(pixmap)
+    return icon
+
+
+def icon_button(emoji: str, text: str) -> QPushButton:
+    """Botão com o emoji como ícone (sem reprocessar o emoji a cada repintura)"""
+    button = QPushButton(text)
+    button.setIcon(emoji_icon(emoji))
+    return button
+
+
+def read_log_tail(path: Path, max_bytes: int = LOG_VIEW_TAIL_BYTES):
+    """
+    Lê o final do arquivo de log via mmap (sem carregar o arquivo inteiro)
+    
+    Returns:
+        Tuple (texto, truncado)
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return '', False  # Arquivo vazio
+        
+        with mm:
+            if len(mm) <= max_bytes:
+                return mm[:].decode('utf-8', errors='replace'), False
+            
+            tail = mm[-max_bytes:]
+    
+    # Começar na primeira linha completa
+    tail = tail[tail.find(b'\n') + 1:]
+    return tail.decode('utf-8', errors='replace'), True
+
+
+class LogFileSignals(QObject):
+    """Sinais do LogFileLoader"""
+    
+    loaded = pyqtSignal(str)
+
+
+class LogFileLoader(QRunnable):
+    """Lê o arquivo de log completo no QThreadPool"""
+    
+    def __init__(self, path: Path):
+        super().__init__()
+        self.signals = LogFileSignals()
+        self.path = path
+    
+    def run(self):
+        """Lê e entrega o conteúdo pelo sinal loaded"""
+        try:
+            with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+        except Exception as e:
+            content = f"Erro ao ler arquivo: {e}"
+        self.signals.loaded.emit(content)
+
+
+class DashboardSignals(QObject):
+    """Sinais do DashboardLoader"""
+    
+    loaded = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+
+class DashboardLoader(QRunnable):
+    """Lê o snapshot do painel no QThreadPool (sem bloquear a interface)"""
+    
+    def __init__(self, db_manager):
+        super().__init__()
+        self.signals = DashboardSignals()
+        self.db_manager = db_manager
+    
+    def run(self):
+        """Lê e entrega o snapshot pelo sinal loaded"""
+        try:
+            snapshot = self.db_manager.get_dashboard_snapshot_threadsafe()
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Erro ao carregar dados iniciais: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(snapshot)
+
+
+class SharedClient:
+    """
+    Cliente de banco mantido entre operações manuais (evita connect/auth a
+    cada clique). Uma operação por vez usa a conexão; reconecta se a
+    configuração mudou ou se a conexão caiu.
+    """
+    
+    def __init__(self, factory):
+        self.factory = factory  # config → cliente (create_db_client / OrionTaxClient)
+        self.client = None
+        self._config_key = None
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def acquire(self, config: dict):
+        """Entrega o cliente conectado, com uso exclusivo durante o bloco"""
+        with self._lock:
+            config_key = repr(sorted(config.items()))
+            if self.client is None or config_key != self._config_key:
+                if self.client is not None:
+                    self.client.disconnect()
+                self.client = self.factory(config)
+                self._config_key = config_key
+            
+            self.client.ensure_connected()
+            yield self.client
+    
+    def keepalive(self):
+        """Mantém a conexão ociosa viva (SELECT 1/ping); ignora se estiver em uso"""
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self.client is not None and self.client.connection is not None:
+                self.client.ensure_connected()
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Keepalive falhou: {e}")
+        finally:
+            self._lock.release()
+    
+    def close(self):
+        """Fecha a conexão mantida"""
+        with self._lock:
+            if self.client is not None:
+                self.client.disconnect()
+                self.client = None
 
 
-class WorkerThread(QThread):
-    """Thread para executar operações em background"""
+class KeepaliveRunnable(QRunnable):
+    """Executa o keepalive das conexões compartilhadas no QThreadPool"""
     
-    finished = pyqtSignal(bool, str, dict)  # success, message, stats
+    def __init__(self, shared_clients):
+        super().__init__()
+        self.shared_clients = shared_clients
+    
+    def run(self):
+        for shared in self.shared_clients:
+            shared.keepalive()
+
+
+class ConnTestSignals(QObject):
+    """Sinais do ConnTestRunnable"""
+    
+    finished = pyqtSignal(str, bool, str)  # target, success, message
+
+
+class ConnTestRunnable(QRunnable):
+    """Teste de conexão no QThreadPool (o handshake não trava a interface)"""
+    
+    def __init__(self, target: str, client_factory, config: dict):
+        super().__init__()
+        self.signals = ConnTestSignals()
+        self.target = target  # 'ORACLE' ou 'ORIONTAX'
+        self.client_factory = client_factory
+        self.config = config
+    
+    def run(self):
+        """Executa test_connection e entrega o resultado pelo sinal finished"""
+        try:
+            success, message = self.client_factory(self.config).test_connection()
+        except Exception as e:
+            success, message = False, str(e)
+        self.signals.finished.emit(self.target, success, message)
+
+
+class SyncSignals(QObject):
+    """Sinais do SyncRunnable (QRunnable não é QObject)"""
+    
+    finished = pyqtSignal(str, bool, str, dict)  # operation_type, success, message, stats
     progress = pyqtSignal(str)  # message
+
+
+class SyncRunnable(QRunnable):
+    """Operação em background executada no QThreadPool (threads reaproveitadas)"""
     
-    def __init__(self, operation_type: str, oracle_config: dict, oriontax_config: dict, cnpj: str, parent=None):
-        super().__init__(parent)
+    def __init__(self, operation_type: str, oracle_config: dict, oriontax_config: dict, cnpj: str,
+                 oracle_shared: SharedClient, oriontax_shared: SharedClient):
+        super().__init__()
+        self.signals = SyncSignals()
+        self.oracle_shared = oracle_shared
+        self.oriontax_shared = oriontax_shared
         self.operation_type = operation_type  # 'ENVIAR' ou 'BUSCAR'
         self.oracle_config = oracle_config
         self.oriontax_config = oriontax_config
         self.cnpj = cnpj
     
+    @pyqtSlot()
     def run(self):
         """Executa a operação"""
-        from datetime import datetime
-        from core.oracle_client import create_db_client
-        from core.oriontax_client import OrionTaxClient
-
         try:
             start_time = datetime.now()
 
             if self.operation_type == 'ENVIAR':
                 # ENVIAR: BD Intersolid VIEWs → PostgreSQL VIEWs
 
-                self.progress.emit('Conectando ao BD Intersolid...')
-                oracle_client = create_db_client(self.oracle_config)
-                oracle_client.connect()
-
-                self.progress.emit(f'Lendo VIEWs do BD Intersolid (CNPJ: {self.cnpj})...')
-                dataframes = oracle_client.read_views_to_dataframes()
+                self.signals.progress.emit('Conectando ao BD Intersolid...')
+                with self.oracle_shared.acquire(self.oracle_config) as oracle_client:
+                    self.signals.progress.emit(f'Lendo VIEWs do BD Intersolid (CNPJ: {self.cnpj})...')
+                    dataframes = oracle_client.read_views_to_dataframes()
 
                 total_records = sum(len(df) for df in dataframes.values())
-                self.progress.emit(f'✓ {total_records} registros lidos do BD Intersolid')
-
-                oracle_client.disconnect()
+                self.signals.progress.emit(f'✓ {total_records} registros lidos do BD Intersolid')
                 
-                self.progress.emit('Conectando ao OrionTax...')
-                oriontax_client = OrionTaxClient(self.oriontax_config)
-                oriontax_client.connect()
-                
-                self.progress.emit('Enviando dados para OrionTax...')
-                success, message = oriontax_client.write_dataframes_to_views(self.cnpj, dataframes)
-                
-                oriontax_client.disconnect()
+                self.signals.progress.emit('Conectando ao OrionTax...')
+                with self.oriontax_shared.acquire(self.oriontax_config) as oriontax_client:
+                    self.signals.progress.emit('Enviando dados para OrionTax...')
+                    success, message = oriontax_client.write_dataframes_to_views(self.cnpj, dataframes)
                 
                 stats = {
                     'registros': total_records,
                     'tempo': (datetime.now() - start_time).total_seconds()
                 }
                 
-                self.finished.emit(True, f'✓ Dados enviados com sucesso!\n{message}', stats)
+                self.signals.finished.emit(self.operation_type, True, f'✓ Dados enviados com sucesso!\n{message}', stats)
                 
             elif self.operation_type == 'BUSCAR':
                 # BUSCAR: PostgreSQL TMPs → Oracle TMPs
                 
-                self.progress.emit('Conectando ao OrionTax...')
-                oriontax_client = OrionTaxClient(self.oriontax_config)
-                oriontax_client.connect()
-                
-                self.progress.emit(f'Lendo tabelas TMP do OrionTax (CNPJ: {self.cnpj})...')
-                dataframes = oriontax_client.read_tmp_tables_to_dataframes(self.cnpj)
+                self.signals.progress.emit('Conectando ao OrionTax...')
+                with self.oriontax_shared.acquire(self.oriontax_config) as oriontax_client:
+                    self.signals.progress.emit(f'Lendo tabelas TMP do OrionTax (CNPJ: {self.cnpj})...')
+                    dataframes = oriontax_client.read_tmp_tables_to_dataframes(self.cnpj)
                 
                 total_records = sum(len(df) for df in dataframes.values())
-                self.progress.emit(f'✓ {total_records} registros lidos do OrionTax')
+                self.signals.progress.emit(f'✓ {total_records} registros lidos do OrionTax')
                 
-                oriontax_client.disconnect()
-                
-                self.progress.emit('Conectando ao BD Intersolid...')
-                oracle_client = create_db_client(self.oracle_config)
-                oracle_client.connect()
-
-                self.progress.emit('Gravando dados no BD Intersolid...')
-                success, message = oracle_client.write_dataframes_to_tmp_tables(dataframes)
-                
-                oracle_client.disconnect()
+                self.signals.progress.emit('Conectando ao BD Intersolid...')
+                with self.oracle_shared.acquire(self.oracle_config) as oracle_client:
+                    self.signals.progress.emit('Gravando dados no BD Intersolid...')
+                    success, message = oracle_client.write_dataframes_to_tmp_tables(dataframes)
+                    rejected = oracle_client.rejected_rows
                 
                 stats = {
                     'registros': total_records,
+                    'rejeitados': rejected,
                     'tempo': (datetime.now() - start_time).total_seconds()
                 }
                 
-                self.finished.emit(True, f'✓ Dados recebidos com sucesso!\n{message}', stats)
+                self.signals.finished.emit(self.operation_type, True, f'✓ Dados recebidos com sucesso!\n{message}', stats)
         
         except Exception as e:
-            import traceback
             error_msg = f'Erro: {str(e)}\n\n{traceback.format_exc()}'
-            self.finished.emit(False, error_msg, {})
+            self.signals.finished.emit(self.operation_type, False, error_msg, {})
 
 
 class MainWindow(QMainWindow):
     """Janela Principal do Sistema"""
     
+    # Cores dos níveis de log no console
+    _COLORS = MappingProxyType({
+        'INFO': '#3498db',
+        'SUCCESS': '#27ae60',
+        'WARNING': '#f39c12',
+        'ERROR': '#e74c3c'
+    })
+    
+    # Rótulos usados nas mensagens do teste de conexão
+    _CONN_TEST_LABELS = MappingProxyType({'ORACLE': 'BD Intersolid', 'ORIONTAX': 'OrionTax'})
+    
+    # Estilos (montados uma única vez, na definição da classe)
+    _STATUS_OK_CSS = 'color: #27ae60; font-weight: bold;'
+    _STATUS_ERROR_CSS = 'color: #e74c3c; font-weight: bold;'
+    
+    _USER_BTN_STYLE = """
+        QPushButton {
+            background-color: transparent;
+            color: #3498db;
+            border: none;
+            font-size: 13px;
+            text-decoration: underline;
+            padding: 5px;
+        }
+        QPushButton:hover {
+            color: #2980b9;
+        }
+    """
+    
+    _CONSOLE_STYLE = """
+        QTextEdit {
+            background-color: #2c3e50;
+            color: #ecf0f1;
+            font-family: 'Courier New', monospace;
+            font-size: 11px;
+            padding: 10px;
+        }
+    """
+    
+    _STYLES_CSS = """
+        QDialog {
+            background-color: #ecf0f1;
+        }
+        QLineEdit {
+            padding: 10px 15px;
+            border: 2px solid #bdc3c7;
+            border-radius: 5px;
+            background-color: white;
+            color: #2c3e50;                    /* ✅ Texto preto */
+            font-size: 14px;
+        }
+        QLineEdit:focus {
+            border: 2px solid #3498db;
+        }
+        QLineEdit::placeholder {
+            color: #95a5a6;                    /* ✅ Placeholder cinza claro */
+        }
+        QPushButton {
+            background-color: #3498db;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            font-size: 16px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #2980b9;
+        }
+        QPushButton:pressed {
+            background-color: #21618c;
+        }
+    """
+    
+    # Fontes, cores e cursor compartilhados (criados uma vez, após a QApplication)
+    _TITLE_FONT = None
+    _STATUS_FONT = None
+    _POINTER = None
+    _STATUS_COLORS = None
+    
+    # Linha do console: [hora] [nível] mensagem
+    _LOG_TPL = (
+        '<span style="color: #95a5a6;">[{ts}]</span> '
+        '<span style="color: {c}; font-weight: bold;">[{lvl}]</span> '
+        '<span style="color: #ecf0f1;">{msg}</span>'
+    )
+    
     def __init__(self, db_manager, scheduler, app_instance):
         """
         Inicializa a janela principal
@@ -121,19 +414,53 @@ class MainWindow(QMainWindow):
             app_instance: Instância do OrionTaxSyncApp (para minimizar)
         """
         super().__init__()
+        self._init_shared_resources()
         
         self.db_manager = db_manager  # ✅ Armazenar db_manager
         self.scheduler = scheduler  # ✅ Armazenar scheduler
         self.app_instance = app_instance  # ✅ Armazenar app_instance
         self.logger = logging.getLogger(__name__)
-        self.worker_thread = None
+        
+        # Pool de threads para as operações manuais (ENVIAR e BUSCAR podem rodar juntas)
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(max(2, QThread.idealThreadCount()))
+        self._running_operations = {}  # operation_type → SyncRunnable
+        self._running_tests = {}  # 'ORACLE'/'ORIONTAX' → ConnTestRunnable
+        
+        # Agendamentos em memória (id → dict), mantidos em dia a cada alteração
+        self._schedules_cache = {}
+        
+        # Conexões mantidas entre operações (connect/auth uma vez só)
+        self.oracle_shared = SharedClient(create_db_client)
+        self.oriontax_shared = SharedClient(OrionTaxClient)
+        self._keepalive_timer = QTimer(self)
+        self._keepalive_timer.timeout.connect(self._keepalive_connections)
+        self._keepalive_timer.start(KEEPALIVE_MS)
+        
+        # Mensagens do console aguardando a próxima atualização em lote
+        self._console_pending = deque()
+        self._console_flush_scheduled = False
         
         # ✅ Buscar dados do usuário logado (opcional, se precisar)
         self.user_data = {'username': 'admin', 'nome_completo': 'Administrador'}
         
         self.init_ui()
         self.load_initial_data()
-        self.setup_status_timer()
+    
+    @classmethod
+    def _init_shared_resources(cls):
+        """Cria fontes, cores e cursor compartilhados na primeira janela"""
+        if cls._TITLE_FONT is not None:
+            return
+        
+        cls._TITLE_FONT = QFont('Arial', 18, QFont.Bold)
+        cls._STATUS_FONT = QFont('Arial', 10, QFont.Bold)
+        cls._POINTER = QCursor(Qt.PointingHandCursor)
+        cls._STATUS_COLORS = {
+            'SUCESSO': QColor('#27ae60'),
+            'ERRO': QColor('#e74c3c'),
+            'OUTRO': QColor('#f39c12'),
+        }
     
     def init_ui(self):
         """Inicializa a interface"""
@@ -173,6 +500,14 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
         
+        # Indicador de carregamento dos dados iniciais
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setMaximumWidth(120)
+        self.loading_bar.setRange(0, 0)  # Indeterminate
+        self.loading_bar.setFormat('Carregando...')
+        self.loading_bar.setVisible(False)
+        self.status_bar.addPermanentWidget(self.loading_bar)
+        
         self.status_label = QLabel('Pronto')
         self.status_bar.addWidget(self.status_label)
         
@@ -183,20 +518,44 @@ class MainWindow(QMainWindow):
         """Cria barra de menu"""
         menubar = self.menuBar()
         
+        # Menus populados na primeira abertura (aboutToShow)
+        self._built_menus = set()
+        
         # Menu Arquivo
         file_menu = menubar.addMenu('Arquivo')
         
-        exit_action = QAction('Sair', self)
-        exit_action.setShortcut('Ctrl+Q')
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        # Sair: criado já, o atalho Ctrl+Q precisa funcionar antes de abrir o menu
+        self._exit_action = QAction('Sair', self)
+        self._exit_action.setShortcut('Ctrl+Q')
+        self._exit_action.triggered.connect(self.close)
+        self.addAction(self._exit_action)
+        file_menu.aboutToShow.connect(self._populate_file_menu)
         
         # Menu Ajuda
         help_menu = menubar.addMenu('Ajuda')
+        help_menu.aboutToShow.connect(self._populate_help_menu)
+    
+    @pyqtSlot()
+    def _populate_file_menu(self):
+        """Monta o menu Arquivo na primeira abertura"""
+        menu = self.sender()
+        if 'file' in self._built_menus:
+            return
+        self._built_menus.add('file')
+        
+        menu.addAction(self._exit_action)
+    
+    @pyqtSlot()
+    def _populate_help_menu(self):
+        """Monta o menu Ajuda na primeira abertura"""
+        menu = self.sender()
+        if 'help' in self._built_menus:
+            return
+        self._built_menus.add('help')
         
         about_action = QAction('Sobre', self)
         about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        menu.addAction(about_action)
     
     def create_header(self) -> QHBoxLayout:
         """Cria cabeçalho"""
@@ -204,40 +563,25 @@ class MainWindow(QMainWindow):
         
         # Título
         title = QLabel('OrionTax Sync')
-        title_font = QFont('Arial', 18, QFont.Bold)
-        title.setFont(title_font)
+        title.setFont(MainWindow._TITLE_FONT)
         # title.setStyleSheet('color: #2c3e50;')
         layout.addWidget(title)
         
         layout.addStretch()
         
         # ✅ Info do usuário (CLICÁVEL)
-        from PyQt5.QtCore import Qt
         
         self.user_button = QPushButton(f"👤 {self.user_data.get('nome_completo', self.user_data['username'])}")
-        self.user_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #3498db;
-                border: none;
-                font-size: 13px;
-                text-decoration: underline;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                color: #2980b9;
-            }
-        """)
-        self.user_button.setCursor(Qt.PointingHandCursor)
+        self.user_button.setStyleSheet(self._USER_BTN_STYLE)
+        self.user_button.setCursor(MainWindow._POINTER)
         self.user_button.clicked.connect(self.open_change_password)
         layout.addWidget(self.user_button)
         
         return layout
     
+    @pyqtSlot()
     def open_change_password(self):
         """Abre diálogo de alteração de senha"""
-        from gui.change_password import ChangePasswordDialog
-        
         dialog = ChangePasswordDialog(
             db_manager=self.db_manager,
             username=self.user_data['username'],
@@ -263,8 +607,8 @@ class MainWindow(QMainWindow):
         self.client_combo.setMinimumWidth(300)
         client_layout.addWidget(self.client_combo)
         
-        refresh_clients_button = QPushButton('🔄 Atualizar')
-        refresh_clients_button.clicked.connect(self.load_clients)
+        refresh_clients_button = icon_button('🔄', 'Atualizar')
+        refresh_clients_button.clicked.connect(self.refresh_clients)
         client_layout.addWidget(refresh_clients_button)
         
         client_layout.addStretch()
@@ -288,16 +632,16 @@ class MainWindow(QMainWindow):
         operations_group = QGroupBox('Operações Manuais')
         operations_layout = QHBoxLayout()
         
-        self.send_button = QPushButton('📤 Enviar Dados para OrionTax')
+        self.send_button = icon_button('📤', 'Enviar Dados para OrionTax')
         self.send_button.setMinimumHeight(60)
-        self.send_button.setCursor(Qt.PointingHandCursor)
-        self.send_button.clicked.connect(lambda: self.execute_operation('ENVIAR'))
+        self.send_button.setCursor(MainWindow._POINTER)
+        self.send_button.clicked.connect(self._on_send)
         operations_layout.addWidget(self.send_button)
         
-        self.receive_button = QPushButton('📥 Buscar Dados da OrionTax')
+        self.receive_button = icon_button('📥', 'Buscar Dados da OrionTax')
         self.receive_button.setMinimumHeight(60)
-        self.receive_button.setCursor(Qt.PointingHandCursor)
-        self.receive_button.clicked.connect(lambda: self.execute_operation('BUSCAR'))
+        self.receive_button.setCursor(MainWindow._POINTER)
+        self.receive_button.clicked.connect(self._on_receive)
         operations_layout.addWidget(self.receive_button)
         
         operations_group.setLayout(operations_layout)
@@ -310,20 +654,13 @@ class MainWindow(QMainWindow):
         self.console = QTextEdit()
         self.console.setReadOnly(True)
         self.console.setMinimumHeight(250)
-        self.console.setStyleSheet("""
-            QTextEdit {
-                background-color: #2c3e50;
-                color: #ecf0f1;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-                padding: 10px;
-            }
-        """)
+        self.console.document().setMaximumBlockCount(CONSOLE_MAX_BLOCKS)
+        self.console.setStyleSheet(self._CONSOLE_STYLE)
         console_layout.addWidget(self.console)
         
         # Botão limpar console
         clear_button = QPushButton('Limpar Console')
-        clear_button.clicked.connect(self.console.clear)
+        clear_button.clicked.connect(self._clear_console)
         console_layout.addWidget(clear_button)
         
         console_group.setLayout(console_layout)
@@ -353,15 +690,15 @@ class MainWindow(QMainWindow):
         # Botões Oracle
         oracle_buttons = QHBoxLayout()
         
-        config_oracle_button = QPushButton('⚙️ Configurar BD Intersolid')
+        config_oracle_button = icon_button('⚙️', 'Configurar BD Intersolid')
         config_oracle_button.setMinimumHeight(40)
         config_oracle_button.clicked.connect(self.open_oracle_config)
         oracle_buttons.addWidget(config_oracle_button)
         
-        test_oracle_button = QPushButton('🔍 Testar Conexão com Intersolid')
-        test_oracle_button.setMinimumHeight(40)
-        test_oracle_button.clicked.connect(self.test_oracle_connection)
-        oracle_buttons.addWidget(test_oracle_button)
+        self.test_oracle_button = icon_button('🔍', 'Testar Conexão com Intersolid')
+        self.test_oracle_button.setMinimumHeight(40)
+        self.test_oracle_button.clicked.connect(self.test_oracle_connection)
+        oracle_buttons.addWidget(self.test_oracle_button)
         
         oracle_layout.addLayout(oracle_buttons)
         oracle_group.setLayout(oracle_layout)
@@ -381,15 +718,15 @@ class MainWindow(QMainWindow):
         # Botões OrionTax
         oriontax_buttons = QHBoxLayout()
         
-        config_oriontax_button = QPushButton('⚙️ Configurar OrionTax')
+        config_oriontax_button = icon_button('⚙️', 'Configurar OrionTax')
         config_oriontax_button.setMinimumHeight(40)
         config_oriontax_button.clicked.connect(self.open_oriontax_config)
         oriontax_buttons.addWidget(config_oriontax_button)
         
-        test_oriontax_button = QPushButton('🔍 Testar Conexão OrionTax')
-        test_oriontax_button.setMinimumHeight(40)
-        test_oriontax_button.clicked.connect(self.test_oriontax_connection)
-        oriontax_buttons.addWidget(test_oriontax_button)
+        self.test_oriontax_button = icon_button('🔍', 'Testar Conexão OrionTax')
+        self.test_oriontax_button.setMinimumHeight(40)
+        self.test_oriontax_button.clicked.connect(self.test_oriontax_connection)
+        oriontax_buttons.addWidget(self.test_oriontax_button)
         
         oriontax_layout.addLayout(oriontax_buttons)
         oriontax_group.setLayout(oriontax_layout)
@@ -408,7 +745,7 @@ class MainWindow(QMainWindow):
 
         heartbeat_buttons = QHBoxLayout()
 
-        config_heartbeat_button = QPushButton('⚙️ Configurar Heartbeat')
+        config_heartbeat_button = icon_button('⚙️', 'Configurar Heartbeat')
         config_heartbeat_button.setMinimumHeight(40)
         config_heartbeat_button.clicked.connect(self.open_heartbeat_config)
         heartbeat_buttons.addWidget(config_heartbeat_button)
@@ -426,39 +763,35 @@ class MainWindow(QMainWindow):
         # Botões de ação
         clients_buttons = QHBoxLayout()
         
-        add_client_button = QPushButton('➕ Adicionar Cliente')
+        add_client_button = icon_button('➕', 'Adicionar Cliente')
         add_client_button.clicked.connect(self.add_client)
         clients_buttons.addWidget(add_client_button)
         
-        edit_client_button = QPushButton('✏️ Editar Cliente')
+        edit_client_button = icon_button('✏️', 'Editar Cliente')
         edit_client_button.clicked.connect(self.edit_client)
         clients_buttons.addWidget(edit_client_button)
         
-        delete_client_button = QPushButton('🗑️ Excluir Cliente')
+        delete_client_button = icon_button('🗑️', 'Excluir Cliente')
         delete_client_button.clicked.connect(self.delete_client)
         clients_buttons.addWidget(delete_client_button)
         
         clients_buttons.addStretch()
         
-        refresh_button = QPushButton('🔄 Atualizar')
-        refresh_button.clicked.connect(self.load_clients_table)
+        refresh_button = icon_button('🔄', 'Atualizar')
+        refresh_button.clicked.connect(self.refresh_clients)
         clients_buttons.addWidget(refresh_button)
         
         clients_layout.addLayout(clients_buttons)
         
-        # Tabela de clientes
-        self.clients_table = QTableWidget()
-        self.clients_table.setColumnCount(3)
-        self.clients_table.setHorizontalHeaderLabels(['ID', 'Nome', 'CNPJ'])
+        # Tabela de clientes (modelo + proxy de ordenação)
+        self.clients_model = ClientsTableModel(self.db_manager.format_cnpj, self)
+        self.clients_table = make_table_view(self.clients_model)
         
         header = self.clients_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         
-        self.clients_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.clients_table.setAlternatingRowColors(True)
-        
         clients_layout.addWidget(self.clients_table)
         
         clients_group.setLayout(clients_layout)
@@ -476,51 +809,51 @@ class MainWindow(QMainWindow):
         # Botões
         buttons_layout = QHBoxLayout()
         
-        refresh_button = QPushButton('🔄 Atualizar Logs')
+        refresh_button = icon_button('🔄', 'Atualizar Logs')
         refresh_button.clicked.connect(self.load_logs)
         buttons_layout.addWidget(refresh_button)
         
         # ✅ ADICIONAR BOTÃO VER ARQUIVO DE LOG
-        view_log_file_button = QPushButton('📄 Ver Arquivo de Log')
+        view_log_file_button = icon_button('📄', 'Ver Arquivo de Log')
         view_log_file_button.clicked.connect(self.view_log_file)
         buttons_layout.addWidget(view_log_file_button)
         
         buttons_layout.addStretch()
         
+        # Filtro aplicado pelo proxy, sem consultar o banco
+        self.logs_filter_input = QLineEdit()
+        self.logs_filter_input.setPlaceholderText('Filtrar logs...')
+        self.logs_filter_input.setClearButtonEnabled(True)
+        self.logs_filter_input.setMaximumWidth(250)
+        buttons_layout.addWidget(self.logs_filter_input)
+        
         layout.addLayout(buttons_layout)
         
-        # Tabela de logs
-        self.logs_table = QTableWidget()
-        self.logs_table.setColumnCount(6)
-        self.logs_table.setHorizontalHeaderLabels([
-            'Data/Hora', 'Operação', 'Status', 'Mensagem', 'Registros', 'Tempo (s)'
-        ])
+        # Tabela de logs (modelo + proxy de ordenação/filtro)
+        self.logs_model = LogsTableModel(MainWindow._STATUS_COLORS, MainWindow._STATUS_FONT, self)
+        self.logs_table = make_table_view(self.logs_model)
+        self.logs_filter_input.textChanged.connect(self.logs_table.model().setFilterFixedString)
         
         # Ajustar colunas
+        # Interactive: largura ajustada uma vez por carga completa, não a cada célula
         header = self.logs_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        
-        self.logs_table.setAlternatingRowColors(True)
-        self.logs_table.setSelectionBehavior(QTableWidget.SelectRows)
+        header.setSectionResizeMode(4, QHeaderView.Interactive)
+        header.setSectionResizeMode(5, QHeaderView.Interactive)
         
         layout.addWidget(self.logs_table)
         
         widget.setLayout(layout)
         return widget
     
+    @pyqtSlot()
     def view_log_file(self):
         """Abre janela para visualizar arquivo de log"""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton
-        from pathlib import Path
-        from datetime import datetime
-        
-        # Caminho do log de hoje
-        log_dir = Path(__file__).parent.parent / 'logs'
+        # Caminho do log de hoje (mesma pasta usada pelos handlers de log)
+        log_dir = resolve_log_dir()
         log_filename = log_dir / f'oriontax_{datetime.now().strftime("%Y%m%d")}.log'
         
         if not log_filename.exists():
@@ -537,21 +870,13 @@ class MainWindow(QMainWindow):
         # TextEdit para mostrar log
         text_edit = QTextEdit()
         text_edit.setReadOnly(True)
-        text_edit.setStyleSheet("""
-            QTextEdit {
-                background-color: #2c3e50;
-                color: #ecf0f1;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-                padding: 10px;
-            }
-        """)
-        
-        # Ler arquivo
+        text_edit.setStyleSheet(self._CONSOLE_STYLE)
+        
+        # Ler arquivo (arquivos grandes: apenas o final)
+        truncated = False
         try:
-            with open(log_filename, 'r', encoding='utf-8') as f:
-                content = f.read()
-                text_edit.setPlainText(content)
+            content, truncated = read_log_tail(log_filename)
+            text_edit.setPlainText(content)
                 
             # Scroll para o final
             scrollbar = text_edit.verticalScrollBar()
@@ -562,6 +887,20 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(text_edit)
         
+        # Arquivo truncado: carregar o restante em background sob demanda
+        if truncated:
+            load_full_button = QPushButton("Carregar arquivo completo")
+            
+            def load_full_file():
+                load_full_button.setEnabled(False)
+                loader = LogFileLoader(log_filename)
+                loader.signals.loaded.connect(text_edit.setPlainText)
+                loader.signals.loaded.connect(load_full_button.hide)
+                self.pool.start(loader)
+            
+            load_full_button.clicked.connect(load_full_file)
+            layout.addWidget(load_full_button)
+        
         # Botão fechar
         close_button = QPushButton("Fechar")
         close_button.clicked.connect(dialog.close)
@@ -578,45 +917,40 @@ class MainWindow(QMainWindow):
         # Botões
         buttons_layout = QHBoxLayout()
         
-        add_button = QPushButton('➕ Adicionar Agendamento')
+        add_button = icon_button('➕', 'Adicionar Agendamento')
         add_button.clicked.connect(self.add_schedule)
         buttons_layout.addWidget(add_button)
         
         # ✅ ADICIONAR BOTÃO EDITAR
-        edit_button = QPushButton('✏️ Editar Agendamento')
+        edit_button = icon_button('✏️', 'Editar Agendamento')
         edit_button.clicked.connect(self.edit_schedule)
         buttons_layout.addWidget(edit_button)
         
         # ✅ ADICIONAR BOTÃO EXCLUIR
-        delete_button = QPushButton('🗑️ Excluir Agendamento')
+        delete_button = icon_button('🗑️', 'Excluir Agendamento')
         delete_button.clicked.connect(self.delete_schedule)
         buttons_layout.addWidget(delete_button)        
         
         buttons_layout.addStretch()
         
-        refresh_button = QPushButton('🔄 Atualizar')
+        refresh_button = icon_button('🔄', 'Atualizar')
         refresh_button.clicked.connect(self.load_schedules)
         buttons_layout.addWidget(refresh_button)
         
         layout.addLayout(buttons_layout)
         
-        # Tabela de agendamentos
-        self.schedule_table = QTableWidget()
-        self.schedule_table.setColumnCount(6)  # ✅ Adicionar coluna ID
-        self.schedule_table.setHorizontalHeaderLabels([
-            'ID', 'Operação', 'Frequência', 'Dias', 'Horário', 'Status'  # ✅ Adicionar ID
-        ])
+        # Tabela de agendamentos (modelo + proxy de ordenação)
+        self.schedule_model = SchedulesTableModel(MainWindow._STATUS_COLORS, MainWindow._STATUS_FONT, self)
+        self.schedule_table = make_table_view(self.schedule_model)
         
+        # Interactive: largura ajustada uma vez por carga, não a cada célula
         header = self.schedule_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # ID
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Operação
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Frequência
+        header.setSectionResizeMode(0, QHeaderView.Interactive)  # ID
+        header.setSectionResizeMode(1, QHeaderView.Interactive)  # Operação
+        header.setSectionResizeMode(2, QHeaderView.Interactive)  # Frequência
         header.setSectionResizeMode(3, QHeaderView.Stretch)  # Dias
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Horário
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # Status
-        
-        self.schedule_table.setAlternatingRowColors(True)
-        self.schedule_table.setSelectionBehavior(QTableWidget.SelectRows)
+        header.setSectionResizeMode(4, QHeaderView.Interactive)  # Horário
+        header.setSectionResizeMode(5, QHeaderView.Interactive)  # Status
         
         # ✅ CONECTAR DUPLO CLIQUE
         self.schedule_table.doubleClicked.connect(self.edit_schedule)        
@@ -627,40 +961,9 @@ class MainWindow(QMainWindow):
         return widget
     
     def apply_styles(self):
-        """Aplica estilos CSS"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #ecf0f1;
-            }
-            QLineEdit {
-                padding: 10px 15px;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                background-color: white;
-                color: #2c3e50;                    /* ✅ Texto preto */
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3498db;
-            }
-            QLineEdit::placeholder {
-                color: #95a5a6;                    /* ✅ Placeholder cinza claro */
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        """Aplica estilos CSS (sem reprocessar se já estiver aplicado)"""
+        if self.styleSheet() != self._STYLES_CSS:
+            self.setStyleSheet(self._STYLES_CSS)
 
 
 
@@ -669,32 +972,59 @@ class MainWindow(QMainWindow):
         """Adiciona mensagem ao console"""
         timestamp = datetime.now().strftime('%H:%M:%S')
         
-        color_map = {
-            'INFO': '#3498db',
-            'SUCCESS': '#27ae60',
-            'WARNING': '#f39c12',
-            'ERROR': '#e74c3c'
-        }
+        color = MainWindow._COLORS.get(level, '#ecf0f1')
         
-        color = color_map.get(level, '#ecf0f1')
+        line = self._LOG_TPL.format(ts=timestamp, c=color, lvl=level, msg=html.escape(message))
         
-        html = f'<span style="color: #95a5a6;">[{timestamp}]</span> '
-        html += f'<span style="color: {color}; font-weight: bold;">[{level}]</span> '
-        html += f'<span style="color: #ecf0f1;">{message}</span>'
+        # Agrupar: uma atualização do documento a cada CONSOLE_FLUSH_MS
+        self._console_pending.append(line)
+        if not self._console_flush_scheduled:
+            self._console_flush_scheduled = True
+            QTimer.singleShot(CONSOLE_FLUSH_MS, self._flush_console)
+    
+    @pyqtSlot()
+    def _flush_console(self):
+        """Escreve no console as mensagens acumuladas"""
+        self._console_flush_scheduled = False
+        if not self._console_pending:
+            return
         
-        self.console.append(html)
+        html_batch = '<br>'.join(self._console_pending)
+        self._console_pending.clear()
+        self.console.append(html_batch)
         
         # Auto-scroll
         scrollbar = self.console.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    @pyqtSlot()
+    def _clear_console(self):
+        """Limpa o console (incluindo mensagens ainda não exibidas)"""
+        self._console_pending.clear()
+        self.console.clear()
+    
     def load_initial_data(self):
-        """Carrega dados iniciais"""
-        self.check_connection_status()
-        self.load_clients()
-        self.load_clients_table()
-        self.load_logs()
-        self.load_schedules()
+        """Carrega dados iniciais em background (a janela abre sem esperar o SQLite)"""
+        self.loading_bar.setVisible(True)
+        
+        # Uma única leitura (transação) para todos os painéis
+        loader = DashboardLoader(self.db_manager)
+        loader.signals.loaded.connect(self._apply_dashboard, Qt.QueuedConnection)
+        loader.signals.failed.connect(self._on_dashboard_failed, Qt.QueuedConnection)
+        self._dashboard_loader = loader  # manter os sinais vivos até a entrega
+        self.pool.start(loader)
+    
+    @pyqtSlot(dict)
+    def _apply_dashboard(self, snapshot: dict):
+        """Preenche os painéis com o snapshot lido pelo DashboardLoader"""
+        self._dashboard_loader = None
+        self.loading_bar.setVisible(False)
+        
+        self.check_connection_status(snapshot)
+        self.load_clients(snapshot['clientes'])
+        self.load_clients_table(snapshot['clientes'])
+        self.load_logs(snapshot['logs'])
+        self.load_schedules(snapshot['schedules'])
         self.log_message('Sistema iniciado', 'SUCCESS')
 
         # Atualiza logs automaticamente a cada 30s (agendamentos rodam em background)
@@ -702,43 +1032,65 @@ class MainWindow(QMainWindow):
         self._log_refresh_timer.timeout.connect(self.load_logs)
         self._log_refresh_timer.start(30_000)
     
-    def check_connection_status(self):
-        """Verifica status das conexões"""
+    @pyqtSlot(str)
+    def _on_dashboard_failed(self, error: str):
+        """Falha na leitura inicial: mostra no console e segue sem os dados"""
+        self._dashboard_loader = None
+        self.loading_bar.setVisible(False)
+        self.log_message(f'Erro ao carregar dados: {error}', 'ERROR')
+    
+    @pyqtSlot()
+    def check_connection_status(self, snapshot: dict = None):
+        """Verifica status das conexões (snapshot: dados já lidos por get_dashboard_snapshot)"""
+        # Sem snapshot: configurações do cache do DatabaseManager
+        if snapshot is not None:
+            oracle_config = snapshot['oracle_cfg']
+            oriontax_config = snapshot['oriontax_cfg']
+        else:
+            oracle_config = self.db_manager.get_oracle_config()
+            oriontax_config = self.db_manager.get_oriontax_config()
+        
         # ✅ Oracle
-        oracle_config = self.db_manager.get_oracle_config()  # ✅ Adicionar self.
         if oracle_config:
-            self.oracle_status_label.setText(f"✓ BD Intersolid: {oracle_config['nome_conexao']} ({oracle_config['host']})")
-            self.oracle_status_label.setStyleSheet('color: #27ae60; font-weight: bold;')
-            
-            self.oracle_config_status.setText(f"✓ Configurado: {oracle_config['nome_conexao']} - {oracle_config['host']}:{oracle_config['port']}")
-            self.oracle_config_status.setStyleSheet('color: #27ae60; font-weight: bold;')
+            self._set_status(self.oracle_status_label, True,
+                             f"✓ BD Intersolid: {oracle_config['nome_conexao']} ({oracle_config['host']})")
+            self._set_status(self.oracle_config_status, True,
+                             f"✓ Configurado: {oracle_config['nome_conexao']} - {oracle_config['host']}:{oracle_config['port']}")
         else:
-            self.oracle_status_label.setText('✗ BD Intersolid: Não configurado')
-            self.oracle_status_label.setStyleSheet('color: #e74c3c; font-weight: bold;')
-            
-            self.oracle_config_status.setText('✗ Não configurado')
-            self.oracle_config_status.setStyleSheet('color: #e74c3c; font-weight: bold;')
+            self._set_status(self.oracle_status_label, False, '✗ BD Intersolid: Não configurado')
+            self._set_status(self.oracle_config_status, False, '✗ Não configurado')
         
         # ✅ OrionTax
-        oriontax_config = self.db_manager.get_oriontax_config()  # ✅ Adicionar self.
         if oriontax_config:
-            self.oriontax_status_label.setText(f"✓ OrionTax: {oriontax_config['host']}:{oriontax_config['port']}")
-            self.oriontax_status_label.setStyleSheet('color: #27ae60; font-weight: bold;')
-            
-            self.oriontax_config_status.setText(f"✓ Configurado: {oriontax_config['host']}:{oriontax_config['port']} / {oriontax_config['database_name']}")
-            self.oriontax_config_status.setStyleSheet('color: #27ae60; font-weight: bold;')
+            self._set_status(self.oriontax_status_label, True,
+                             f"✓ OrionTax: {oriontax_config['host']}:{oriontax_config['port']}")
+            self._set_status(self.oriontax_config_status, True,
+                             f"✓ Configurado: {oriontax_config['host']}:{oriontax_config['port']} / {oriontax_config['database_name']}")
         else:
-            self.oriontax_status_label.setText('✗ OrionTax: Não configurado')
-            self.oriontax_status_label.setStyleSheet('color: #e74c3c; font-weight: bold;')
-            
-            self.oriontax_config_status.setText('✗ Não configurado')
-            self.oriontax_config_status.setStyleSheet('color: #e74c3c; font-weight: bold;')
+            self._set_status(self.oriontax_status_label, False, '✗ OrionTax: Não configurado')
+            self._set_status(self.oriontax_config_status, False, '✗ Não configurado')
+    
+    def _set_status(self, label: QLabel, ok: bool, text: str):
+        """Texto e cor de um indicador de status (estilo reaplicado só se mudou)"""
+        label.setText(text)
+        css = self._STATUS_OK_CSS if ok else self._STATUS_ERROR_CSS
+        if label.styleSheet() != css:
+            label.setStyleSheet(css)
+    
+    @pyqtSlot()
+    def refresh_clients(self):
+        """Recarrega combo e tabela de clientes com uma única consulta"""
+        clientes = self.db_manager.get_all_clientes()
+        self.load_clients(clientes)
+        self.load_clients_table(clientes)
     
-    def load_clients(self):
+    @pyqtSlot()
+    def load_clients(self, clientes: list = None):
         """Carrega clientes no combo"""
         self.client_combo.clear()
         
-        clientes = self.db_manager.get_all_clientes()  # ✅ Adicionar self.
+        if clientes is None:
+            clientes = self.db_manager.get_all_clientes()  # ✅ Adicionar self.
         
         if not clientes:
             self.client_combo.addItem('Nenhum cliente cadastrado', None)
@@ -749,34 +1101,31 @@ class MainWindow(QMainWindow):
             display_text = f"{cliente['nome']} - {cnpj_formatado}"
             self.client_combo.addItem(display_text, cliente)
     
-    def load_clients_table(self):
+    @pyqtSlot()
+    def load_clients_table(self, clientes: list = None):
         """Carrega clientes na tabela"""
-        clientes = self.db_manager.get_all_clientes()  # ✅ Adicionar self.
+        if clientes is None:
+            clientes = self.db_manager.get_all_clientes()  # ✅ Adicionar self.
         
-        self.clients_table.setRowCount(len(clientes))
-        
-        for row, cliente in enumerate(clientes):
-            # ID
-            self.clients_table.setItem(row, 0, QTableWidgetItem(str(cliente['id'])))
-            
-            # Nome
-            self.clients_table.setItem(row, 1, QTableWidgetItem(cliente['nome']))
-            
-            # CNPJ formatado
-            cnpj_formatado = self.db_manager.format_cnpj(cliente['cnpj'])  # ✅ Adicionar self.
-            self.clients_table.setItem(row, 2, QTableWidgetItem(cnpj_formatado))
+        # O modelo guarda os dicts; o texto das células é montado sob demanda
+        with frozen(self.clients_table):
+            self.clients_model.set_rows(clientes)
     
+    def _selected_client(self):
+        """Cliente da linha selecionada na tabela (ou None)"""
+        return selected_record(self.clients_table)
+    
+    @pyqtSlot()
     def delete_client(self):
         """Exclui cliente selecionado"""
-        selected_rows = self.clients_table.selectedItems()
+        cliente = self._selected_client()
         
-        if not selected_rows:
+        if cliente is None:
             QMessageBox.warning(self, 'Atenção', 'Selecione um cliente para excluir.')
             return
         
-        row = self.clients_table.currentRow()
-        cliente_id = int(self.clients_table.item(row, 0).text())
-        cliente_nome = self.clients_table.item(row, 1).text()
+        cliente_id = cliente['id']
+        cliente_nome = cliente['nome']
         
         reply = QMessageBox.question(
             self,
@@ -787,200 +1136,164 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             if self.db_manager.delete_cliente(cliente_id):  # ✅ Adicionar self.
-                self.load_clients()
-                self.load_clients_table()
+                self.refresh_clients()
                 self.log_message('Cliente excluído', 'SUCCESS')
             else:
                 QMessageBox.critical(self, 'Erro', 'Erro ao excluir cliente.')
     
+    @pyqtSlot()
     def add_client(self):
         """Adiciona novo cliente"""
         dialog = ClientDialog(parent=self)
         if dialog.exec_():
-            self.load_clients()
-            self.load_clients_table()
+            self.refresh_clients()
             self.log_message('Cliente adicionado', 'SUCCESS')
     
+    @pyqtSlot()
     def edit_client(self):
         """Edita cliente selecionado"""
-        selected_rows = self.clients_table.selectedItems()
+        cliente = self._selected_client()
         
-        if not selected_rows:
+        if cliente is None:
             QMessageBox.warning(self, 'Atenção', 'Selecione um cliente para editar.')
             return
         
-        row = self.clients_table.currentRow()
-        cliente_id = int(self.clients_table.item(row, 0).text())
+        cliente_id = cliente['id']
         
         dialog = ClientDialog(cliente_id=cliente_id, parent=self)
         if dialog.exec_():
-            self.load_clients()
-            self.load_clients_table()
+            self.refresh_clients()
             self.log_message('Cliente atualizado', 'SUCCESS')
     
+    @pyqtSlot()
     def test_oracle_connection(self):
         """Testa conexão Oracle"""
-        oracle_config = self.db_manager.get_oracle_config()  # ✅ Adicionar self.
+        oracle_config = self.db_manager.get_oracle_config()
         
         if not oracle_config:
             QMessageBox.warning(self, 'Atenção', 'Configure a conexão BD Intersolid primeiro.')
             return
         
-        try:
-            from core.oracle_client import create_db_client
-
-            self.log_message('Testando conexão BD Intersolid...', 'INFO')
-
-            oracle_client = create_db_client(oracle_config)
-            success, message = oracle_client.test_connection()
-
-            if success:
-                QMessageBox.information(self, 'Sucesso', '✓ Conexão BD Intersolid bem-sucedida!')
-                self.log_message('✓ Conexão BD Intersolid OK', 'SUCCESS')
-            else:
-                QMessageBox.critical(self, 'Erro', f'Falha na conexão BD Intersolid:\n\n{message}')
-                self.log_message(f'✗ Erro BD Intersolid: {message}', 'ERROR')
-                
-        except Exception as e:
-            QMessageBox.critical(self, 'Erro', f'Erro ao testar conexão:\n\n{str(e)}')
-            self.log_message(f'✗ Erro: {str(e)}', 'ERROR')
+        self._start_connection_test('ORACLE', create_db_client, oracle_config)
     
+    @pyqtSlot()
     def test_oriontax_connection(self):
         """Testa conexão OrionTax"""
-        oriontax_config = self.db_manager.get_oriontax_config()  # ✅ Adicionar self.
+        oriontax_config = self.db_manager.get_oriontax_config()
         
         if not oriontax_config:
             QMessageBox.warning(self, 'Atenção', 'Configure a conexão OrionTax primeiro.')
             return
         
-        try:
-            from core.oriontax_client import OrionTaxClient
-            
-            self.log_message('Testando conexão OrionTax...', 'INFO')
-            
-            oriontax_client = OrionTaxClient(oriontax_config)
-            success, message = oriontax_client.test_connection()
-            
-            if success:
-                QMessageBox.information(self, 'Sucesso', '✓ Conexão OrionTax bem-sucedida!')
-                self.log_message('✓ Conexão OrionTax OK', 'SUCCESS')
-            else:
-                QMessageBox.critical(self, 'Erro', f'Falha na conexão OrionTax:\n\n{message}')
-                self.log_message(f'✗ Erro OrionTax: {message}', 'ERROR')
-                
-        except Exception as e:
-            QMessageBox.critical(self, 'Erro', f'Erro ao testar conexão:\n\n{str(e)}')
-            self.log_message(f'✗ Erro: {str(e)}', 'ERROR')
+        self._start_connection_test('ORIONTAX', OrionTaxClient, oriontax_config)
     
-    def load_logs(self):
-        """Carrega logs na tabela"""
-        logs = self.db_manager.get_logs_recentes(100)  # ✅ Adicionar self.
+    def _test_button(self, target: str) -> QPushButton:
+        """Botão de teste correspondente à conexão"""
+        return self.test_oracle_button if target == 'ORACLE' else self.test_oriontax_button
+    
+    def _start_connection_test(self, target: str, client_factory, config: dict):
+        """Dispara o teste no pool; o resultado chega em on_connection_tested"""
+        self.log_message(f'Testando conexão {self._CONN_TEST_LABELS[target]}...', 'INFO')
         
-        self.logs_table.setRowCount(len(logs))
+        self._test_button(target).setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate
         
-        for row, log in enumerate(logs):
-            # Data/Hora — SQLite armazena em UTC, converter para horário local
-            dt_utc = datetime.fromisoformat(log['created_at']).replace(tzinfo=timezone.utc)
-            dt_local = dt_utc.astimezone(tz=None)
-            self.logs_table.setItem(row, 0, QTableWidgetItem(dt_local.strftime('%d/%m/%Y %H:%M:%S')))
-            
-            # Operação
-            self.logs_table.setItem(row, 1, QTableWidgetItem(log['tipo_operacao']))
-            
-            # Status
-            status_item = QTableWidgetItem(log['status'])
-            if log['status'] == 'SUCESSO':
-                status_item.setForeground(QColor('#27ae60'))
-            elif log['status'] == 'ERRO':
-                status_item.setForeground(QColor('#e74c3c'))
-            else:
-                status_item.setForeground(QColor('#f39c12'))
-            status_item.setFont(QFont('Arial', 10, QFont.Bold))
-            self.logs_table.setItem(row, 2, status_item)
-            
-            # Mensagem
-            self.logs_table.setItem(row, 3, QTableWidgetItem(log['mensagem'] or ''))
-            
-            # Registros
-            self.logs_table.setItem(row, 4, QTableWidgetItem(str(log['registros_processados'])))
-            
-            # Tempo
-            tempo = log['tempo_execucao_segundos'] or 0
-            self.logs_table.setItem(row, 5, QTableWidgetItem(f"{tempo:.2f}"))
+        runnable = ConnTestRunnable(target, client_factory, config)
+        runnable.signals.finished.connect(self.on_connection_tested, Qt.QueuedConnection)
+        self._running_tests[target] = runnable
+        self.pool.start(runnable)
     
-    def load_schedules(self):
-        """Carrega agendamentos na tabela"""
-        schedules = self.db_manager.get_all_schedules()
-        
-        self.schedule_table.setRowCount(len(schedules))
+    @pyqtSlot(str, bool, str)
+    def on_connection_tested(self, target: str, success: bool, message: str):
+        """Resultado do teste de conexão"""
+        self._running_tests.pop(target, None)
+        self._test_button(target).setEnabled(True)
+        self._update_progress_bar()
+        
+        label = self._CONN_TEST_LABELS[target]
+        if success:
+            QMessageBox.information(self, 'Sucesso', f'✓ Conexão {label} bem-sucedida!')
+            self.log_message(f'✓ Conexão {label} OK', 'SUCCESS')
+        else:
+            QMessageBox.critical(self, 'Erro', f'Falha na conexão {label}:\n\n{message}')
+            self.log_message(f'✗ Erro {label}: {message}', 'ERROR')
+    
+    def _update_progress_bar(self):
+        """Esconde a barra de progresso quando nada mais estiver em andamento"""
+        if not self._running_operations and not self._running_tests:
+            self.progress_bar.setVisible(False)
+    
+    @pyqtSlot()
+    def load_logs(self, logs: list = None):
+        """
+        Carrega logs na tabela
         
-        for row, schedule in enumerate(schedules):
-            # ✅ ID (coluna 0 - oculta visualmente mas acessível)
-            id_item = QTableWidgetItem(str(schedule['id']))
-            self.schedule_table.setItem(row, 0, id_item)
-            
-            # Operação (coluna 1)
-            self.schedule_table.setItem(row, 1, QTableWidgetItem(schedule['operation_type']))
-            
-            # Tipo (coluna 2)
-            tipo_map = {
-                'daily': 'Diário',
-                'weekly': 'Semanal',
-                'monthly': 'Mensal'
-            }
-            tipo_text = tipo_map.get(schedule['schedule_type'], schedule['schedule_type'])
-            self.schedule_table.setItem(row, 2, QTableWidgetItem(tipo_text))
-            
-            # Dia (coluna 3)
-            if schedule['schedule_day'] is not None:
-                if schedule['schedule_type'] == 'weekly':
-                    dias_map = {0: 'Seg', 1: 'Ter', 2: 'Qua', 3: 'Qui', 4: 'Sex', 5: 'Sáb', 6: 'Dom'}
-                    dia_text = dias_map.get(schedule['schedule_day'], str(schedule['schedule_day']))
-                else:
-                    dia_text = f"Dia {schedule['schedule_day']}"
-            else:
-                dia_text = '-'
-            self.schedule_table.setItem(row, 3, QTableWidgetItem(dia_text))
-            
-            # Horário (coluna 4)
-            self.schedule_table.setItem(row, 4, QTableWidgetItem(schedule['schedule_time']))
-            
-            # Status (coluna 5)
-            status_item = QTableWidgetItem('Ativo' if schedule['is_active'] else 'Inativo')
-            status_item.setForeground(QColor('#27ae60' if schedule['is_active'] else '#e74c3c'))
-            status_item.setFont(QFont('Arial', 10, QFont.Bold))
-            self.schedule_table.setItem(row, 5, status_item)
-            
+        Sem 'logs', busca só os registros novos desde o último carregado e os
+        insere no topo, descartando os mais antigos além de LOGS_LIMIT (a
+        primeira carga traz os LOGS_LIMIT mais recentes).
+        """
+        if logs is None:
+            last_id = self.logs_model.last_id()
+            if last_id is not None:
+                new_logs = self.db_manager.get_logs_since(last_id, LOGS_LIMIT)
+                self.logs_model.prepend_rows(new_logs, limit=LOGS_LIMIT)
+                self.update_status()
+                return
+            logs = self.db_manager.get_logs_recentes(LOGS_LIMIT)  # ✅ Adicionar self.
+        
+        with frozen(self.logs_table):
+            self.logs_model.set_rows(logs)
+            self.logs_table.resizeColumnsToContents()  # uma vez por carga
+        self.update_status()
+    
+    @pyqtSlot()
+    def load_schedules(self, schedules: list = None):
+        """Carrega agendamentos do banco (ou da lista dada) para o cache e a tabela"""
+        if schedules is None:
+            schedules = self.db_manager.get_all_schedules()
+        
+        self._schedules_cache = {schedule['id']: schedule for schedule in schedules}
+        self._show_schedules()
+    
+    def _show_schedules(self):
+        """Preenche a tabela a partir do cache (sem consultar o banco)"""
+        schedules = sorted(self._schedules_cache.values(), key=lambda s: s['id'])
+        
+        with frozen(self.schedule_table):
+            self.schedule_model.set_rows(schedules)
+            self.schedule_table.resizeColumnsToContents()  # uma vez por carga
+        self.update_status()
+    
+    @pyqtSlot()
     def add_schedule(self):
         """Adiciona novo agendamento"""
         dialog = ScheduleDialog(self, self.db_manager)
         
         if dialog.exec_() == QDialog.Accepted:
-            schedule_id = dialog.schedule_id
+            # Agendamento gravado pelo diálogo (sem nova consulta)
+            schedule = dialog.saved_schedule
             
-            # Buscar agendamento e adicionar ao scheduler
-            schedule = self.db_manager.get_schedule(schedule_id)
+            self.scheduler.add_job(schedule)
+            self._schedules_cache[schedule['id']] = schedule
             
-            if schedule:
-                self.scheduler.add_job(schedule)
-            
-            self.load_schedules()
+            self._show_schedules()
             self.log_message('Agendamento adicionado', 'SUCCESS')
             QMessageBox.information(self, "Sucesso", "Agendamento criado!")
     
+    @pyqtSlot()
     def edit_schedule(self):
         """Edita agendamento selecionado"""
-        current_row = self.schedule_table.currentRow()
+        selected = selected_record(self.schedule_table)
         
-        if current_row < 0:
+        if selected is None:
             QMessageBox.warning(self, "Aviso", "Selecione um agendamento para editar")
             return
         
-        # ✅ Pegar ID da coluna 0
-        schedule_id = int(self.schedule_table.item(current_row, 0).text())
+        schedule_id = selected['id']
         
-        # Buscar dados do agendamento
-        schedule = self.db_manager.get_schedule(schedule_id)
+        # Dados do agendamento (cache carregado com a tabela)
+        schedule = self._schedules_cache.get(schedule_id)
         
         if not schedule:
             QMessageBox.warning(self, "Erro", "Agendamento não encontrado")
@@ -990,31 +1303,31 @@ class MainWindow(QMainWindow):
         dialog = ScheduleDialog(self, self.db_manager, schedule)
         
         if dialog.exec_() == QDialog.Accepted:
-            # ✅ Buscar agendamento atualizado
-            updated_schedule = self.db_manager.get_schedule(schedule_id)
+            # ✅ Agendamento atualizado, como gravado pelo diálogo
+            updated_schedule = dialog.saved_schedule
             
-            if updated_schedule:
-                # ✅ ATUALIZAR SCHEDULER DINAMICAMENTE
-                self.scheduler.update_job(updated_schedule)
+            # ✅ ATUALIZAR SCHEDULER DINAMICAMENTE
+            self.scheduler.update_job(updated_schedule)
+            self._schedules_cache[schedule_id] = updated_schedule
             
-            self.load_schedules()
+            self._show_schedules()
             self.log_message('Agendamento atualizado', 'SUCCESS')
             QMessageBox.information(self, "Sucesso", "Agendamento atualizado!")
     
+    @pyqtSlot()
     def delete_schedule(self):
         """Remove agendamento selecionado"""
-        current_row = self.schedule_table.currentRow()
+        selected = selected_record(self.schedule_table)
         
-        if current_row < 0:
+        if selected is None:
             QMessageBox.warning(self, "Aviso", "Selecione um agendamento para remover")
             return
         
-        # ✅ Pegar ID da coluna 0
-        schedule_id = int(self.schedule_table.item(current_row, 0).text())
+        schedule_id = selected['id']
         
         # Pegar operação e horário para mostrar na confirmação
-        operacao = self.schedule_table.item(current_row, 1).text()
-        horario = self.schedule_table.item(current_row, 4).text()
+        operacao = selected['operation_type']
+        horario = selected['schedule_time']
         
         reply = QMessageBox.question(
             self,
@@ -1029,27 +1342,36 @@ class MainWindow(QMainWindow):
             
             # Remover do banco
             self.db_manager.delete_schedule(schedule_id)
+            self._schedules_cache.pop(schedule_id, None)
             
-            self.load_schedules()
+            self._show_schedules()
             self.log_message('Agendamento removido', 'SUCCESS')
             QMessageBox.information(self, "Sucesso", "Agendamento removido!")          
     
-    def setup_status_timer(self):
-        """Configura timer para atualizar status"""
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(60000)  # A cada 1 minuto
-    
     def update_status(self):
-        """Atualiza status na barra"""
+        """Atualiza status na barra (chamado quando os dados exibidos são recarregados)"""
         now = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
         self.status_label.setText(f'Última atualização: {now}')
     
+    @pyqtSlot()
+    def _on_send(self):
+        """Botão Enviar"""
+        self.execute_operation('ENVIAR')
+    
+    @pyqtSlot()
+    def _on_receive(self):
+        """Botão Buscar"""
+        self.execute_operation('BUSCAR')
+    
     def execute_operation(self, operation_type: str):
         """Executa operação (enviar ou buscar)"""
+        if operation_type in self._running_operations:
+            QMessageBox.warning(self, 'Aguarde', f'A operação {operation_type} já está em execução.')
+            return
+        
         # Validar configurações
         oracle_config = self.db_manager.get_oracle_config()
-        oriontax_config = self.db_manager.get_oriontax_config() 
+        oriontax_config = self.db_manager.get_oriontax_config()
         
         if not oracle_config:
             QMessageBox.warning(
@@ -1095,9 +1417,8 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.No:
             return
         
-        # Desabilitar botões
-        self.send_button.setEnabled(False)
-        self.receive_button.setEnabled(False)
+        # Desabilitar botão da operação
+        self._operation_button(operation_type).setEnabled(False)
         
         # Mostrar progress bar
         self.progress_bar.setVisible(True)
@@ -1106,24 +1427,44 @@ class MainWindow(QMainWindow):
         # Log
         self.log_message(f'Iniciando operação: {operation_type} (CNPJ: {cnpj_formatado})', 'INFO')
         
-        # Criar e iniciar thread
-        self.worker_thread = WorkerThread(operation_type, oracle_config, oriontax_config, cnpj)
-        self.worker_thread.progress.connect(self.on_worker_progress)
-        self.worker_thread.finished.connect(self.on_worker_finished)
-        self.worker_thread.start()
+        # Criar e enfileirar no pool
+        runnable = SyncRunnable(operation_type, oracle_config, oriontax_config, cnpj,
+                                self.oracle_shared, self.oriontax_shared)
+        runnable.signals.progress.connect(self.on_worker_progress, Qt.QueuedConnection)
+        runnable.signals.finished.connect(self.on_worker_finished, Qt.QueuedConnection)
+        self._running_operations[operation_type] = runnable
+        self.pool.start(runnable)
     
+    @pyqtSlot()
+    def _keepalive_connections(self):
+        """SELECT 1 periódico nas conexões ociosas, fora da thread da interface"""
+        self.pool.start(KeepaliveRunnable((self.oracle_shared, self.oriontax_shared)))
+    
+    def close_connections(self):
+        """Fecha as conexões mantidas (chamado ao encerrar a aplicação)"""
+        self._keepalive_timer.stop()
+        self.oracle_shared.close()
+        self.oriontax_shared.close()
+    
+    def _operation_button(self, operation_type: str) -> QPushButton:
+        """Botão correspondente à operação"""
+        return self.send_button if operation_type == 'ENVIAR' else self.receive_button
+    
+    @pyqtSlot(str)
     def on_worker_progress(self, message: str):
         """Callback de progresso da thread"""
         self.log_message(message, 'INFO')
     
-    def on_worker_finished(self, success: bool, message: str, stats: dict):
-        """Callback de conclusão da thread"""
-        # Reabilitar botões
-        self.send_button.setEnabled(True)
-        self.receive_button.setEnabled(True)
+    @pyqtSlot(str, bool, str, dict)
+    def on_worker_finished(self, operation_type: str, success: bool, message: str, stats: dict):
+        """Callback de conclusão da operação"""
+        self._running_operations.pop(operation_type, None)
         
-        # Esconder progress bar
-        self.progress_bar.setVisible(False)
+        # Reabilitar botão
+        self._operation_button(operation_type).setEnabled(True)
+        
+        # Esconder progress bar quando não houver outra operação em andamento
+        self._update_progress_bar()
         
         if success:
             self.log_message(message, 'SUCCESS')
@@ -1138,30 +1479,51 @@ class MainWindow(QMainWindow):
                     'INFO'
                 )
             
-            QMessageBox.information(self, 'Sucesso', message)
+            if stats.get('rejeitados'):
+                self.log_message(f"Registros rejeitados: {stats['rejeitados']}", 'WARNING')
+                QMessageBox.warning(self, 'Atenção', message)
+            else:
+                QMessageBox.information(self, 'Sucesso', message)
         else:
             self.log_message(message, 'ERROR')
             QMessageBox.critical(self, 'Erro', message)
         
-        # Recarregar logs
+        # Só os logs novos, inseridos no topo (sem recarregar a tabela)
         self.load_logs()
     
+    @pyqtSlot()
     def open_oracle_config(self):
         """Abre diálogo de configuração Oracle"""
-        dialog = OracleConfigDialog(self)
+        from gui.settings import OracleConfigDialog  # carregado na primeira abertura
+
+        dialog = OracleConfigDialog(self, self.db_manager)
+        dialog.config_saved.connect(self._on_config_saved, Qt.QueuedConnection)
         if dialog.exec_():
-            self.check_connection_status()
             self.log_message('Configuração BD Intersolid atualizada', 'SUCCESS')
     
+    @pyqtSlot()
     def open_oriontax_config(self):
         """Abre diálogo de configuração OrionTax"""
-        dialog = OrionTaxConfigDialog(self)
+        from gui.settings import OrionTaxConfigDialog  # carregado na primeira abertura
+
+        dialog = OrionTaxConfigDialog(self, self.db_manager)
+        dialog.config_saved.connect(self._on_config_saved, Qt.QueuedConnection)
         if dialog.exec_():
-            self.check_connection_status()
             self.log_message('Configuração OrionTax atualizada', 'SUCCESS')
+    
+    @pyqtSlot()
+    def _on_config_saved(self):
+        """Configuração de conexão alterada: descartar caches e atualizar status"""
+        # O diálogo gravou por self.db_manager, que já descartou o próprio cache
+        if self.scheduler:
+            self.scheduler.invalidate_cfg()
+        self.check_connection_status()
 
+    @pyqtSlot()
     def open_heartbeat_config(self):
         """Abre diálogo de configuração do Heartbeat"""
+        from gui.settings import HeartbeatConfigDialog  # carregado na primeira abertura
+
         dialog = HeartbeatConfigDialog(self, scheduler=self.scheduler)
         if dialog.exec_():
             interval = self.db_manager.get_heartbeat_interval()
@@ -1184,6 +1546,19 @@ class MainWindow(QMainWindow):
     #         self.load_schedules()
     #         self.log_message('Agendamento adicionado', 'SUCCESS')
     
+    def showEvent(self, event):
+        """Retoma as atualizações periódicas ao reabrir a janela"""
+        super().showEvent(event)
+        if hasattr(self, '_log_refresh_timer') and not self._log_refresh_timer.isActive():
+            self.load_logs()
+            self._log_refresh_timer.start()
+    
+    def hideEvent(self, event):
+        """Janela na bandeja: pausa as atualizações periódicas (sem consultas à toa)"""
+        super().hideEvent(event)
+        if hasattr(self, '_log_refresh_timer'):
+            self._log_refresh_timer.stop()
+    
     def closeEvent(self, event):
         """
         ✅ Intercepta evento de fechar janela
@@ -1192,9 +1567,9 @@ class MainWindow(QMainWindow):
         event.ignore()  # Ignora o fechamento
         self.app_instance.minimize_to_tray()  # Minimiza para tray
     
+    @pyqtSlot()
     def show_about(self):
         """Mostra diálogo sobre"""
-        from version import APP_VERSION
         QMessageBox.about(
             self,
             'Sobre OrionTax Sync',
@@ -26,6 +26,7 @@ class ScheduleDialog(QDialog):
         self.db_manager = db_manager
         self.schedule = schedule  # Armazenar agendamento para edição
         self.schedule_id = None
+        self.saved_schedule = None  # dict gravado (formato de get_schedule)
         self.logger = logging.getLogger(__name__)
         
         self.setWindowTitle("Novo Agendamento" if not schedule else "Editar Agendamento")
@@ -179,10 +180,9 @@ class ScheduleDialog(QDialog):
         elif schedule_type == 'monthly':
             self.monthly_radio.setChecked(True)
         
-        # Horário
-        hour, minute = self.schedule['schedule_time'].split(':')
-        time = QTime(int(hour), int(minute))
-        self.time_edit.setTime(time)
+        # Horário ('HH:MM'; partition aceita também 'H:MM' de registros antigos)
+        hour, _, minute = self.schedule['schedule_time'].partition(':')
+        self.time_edit.setTime(QTime(int(hour), int(minute[:2])))
         
         # Dia (se aplicável)
         if schedule_type == 'weekly' and self.schedule.get('schedule_day') is not None:
@@ -220,24 +220,26 @@ class ScheduleDialog(QDialog):
         try:
             # ✅ Se está editando, fazer UPDATE (SEM client_id)
             if self.schedule:
-                self.db_manager.update_schedule(
+                self.saved_schedule = self.db_manager.update_and_return_schedule(
                     schedule_id=self.schedule['id'],
                     operation_type=operation,
                     schedule_type=schedule_type,
                     schedule_time=schedule_time,
                     schedule_day=schedule_day,
-                    is_active=is_active
+                    is_active=is_active,
+                    last_run=self.schedule.get('last_run'),
+                    next_run=self.schedule.get('next_run')
                 )
-                self.schedule_id = self.schedule['id']
             else:
                 # ✅ Criar novo (SEM client_id)
-                self.schedule_id = self.db_manager.create_schedule(
+                self.saved_schedule = self.db_manager.create_and_return_schedule(
                     operation_type=operation,
                     schedule_type=schedule_type,
                     schedule_time=schedule_time,
                     schedule_day=schedule_day,
                     is_active=is_active
                 )
+            self.schedule_id = self.saved_schedule['id']
             
             self.accept()
             
@@ -5,20 +5,279 @@ import os
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QPushButton, QSpinBox, QCheckBox,
                              QGroupBox, QFormLayout, QMessageBox, QComboBox,
-                             QTimeEdit, QListWidget, QFileDialog, QWidget)
-from PyQt5.QtCore import Qt, QTime
-from PyQt5.QtGui import QFont
-from config.database import db_manager
-import json
+                             QWidget)
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from config.database import db_manager as _default_db_manager
+from core.oracle_client import OracleClient
+import psycopg2
+
+# Estilos dos diálogos: um único modelo; só a cor dos botões muda entre eles
+_DIALOG_QSS_TEMPLATE = """
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLineEdit, QSpinBox, QComboBox {
+        padding: 8px;
+        border: 1px solid #bdc3c7;
+        border-radius: 3px;
+    }
+    QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
+        border: 2px solid #3498db;
+    }
+    QPushButton {
+        padding: 8px 20px;
+        background-color: %(primary)s;
+        color: white;
+        border: none;
+        border-radius: 3px;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: %(hover)s;
+    }
+"""
 
+# Formatados uma única vez, no carregamento do módulo
+DB_CONFIG_QSS = _DIALOG_QSS_TEMPLATE % {'primary': '#3498db', 'hover': '#2980b9'}
+ORIONTAX_CONFIG_QSS = _DIALOG_QSS_TEMPLATE % {'primary': '#27ae60', 'hover': '#229954'}
+HEARTBEAT_CONFIG_QSS = ORIONTAX_CONFIG_QSS
 
-class DatabaseConfigDialog(QDialog):
-    """Diálogo de Configuração de Banco de Dados (Oracle ou Firebird)"""
 
-    def __init__(self, parent=None):
+class _ConnTestSignals(QObject):
+    """Sinais do _ConnTestRunnable"""
+
+    finished = pyqtSignal(bool, str)  # success, message
+
+
+class _ConnTestRunnable(QRunnable):
+    """Teste de conexão dos diálogos no QThreadPool (o handshake não trava a interface)"""
+
+    def __init__(self, probe):
+        super().__init__()
+        self.signals = _ConnTestSignals()
+        self.probe = probe  # callable sem argumentos que retorna (success, message)
+
+    def run(self):
+        """Executa o teste e entrega o resultado pelo sinal finished"""
+        try:
+            success, message = self.probe()
+        except Exception as e:
+            success, message = False, str(e)
+        self.signals.finished.emit(success, message)
+
+
+class _BaseConfigDialog(QDialog):
+    """
+    Base dos diálogos de conexão (BD Intersolid e OrionTax)
+
+    Reúne o que os dois têm em comum: interface montada na primeira
+    exibição, botões, estilo, validação dos campos obrigatórios, teste de
+    conexão em background e retorno do save. As subclasses definem QSS,
+    _REQUIRED, init_ui, load_config, test_connection e save_config.
+    """
+
+    config_saved = pyqtSignal()  # Emitido após salvar com sucesso
+
+    QSS = DB_CONFIG_QSS
+    # Linhas do formulário, na ordem de exibição:
+    # (atributo, rótulo, placeholder, classe do widget ou nome do método que
+    # monta a linha, opções). Opção 'label' guarda o QLabel no atributo
+    # indicado (para ocultar a linha junto com o campo).
+    _FIELDS = ()
+    # Campos obrigatórios, na ordem em que são verificados:
+    # (atributo do QLineEdit, mensagem, ignorar espaços?)
+    _REQUIRED = ()
+
+    def __init__(self, parent=None, db_manager=None):
+        """
+        Args:
+            parent: Widget pai
+            db_manager: DatabaseManager da janela principal (padrão: o global),
+                        para que o save descarte o cache de configuração de quem lê
+        """
         super().__init__(parent)
-        self.init_ui()
-        self.load_config()
+        self.db_manager = db_manager if db_manager is not None else _default_db_manager
+        self._ui_built = False  # Interface montada no primeiro showEvent
+        self._vals = {}  # Texto dos campos sem espaços nas pontas (ver _track_inputs)
+        self._test_runnable = None
+        self._test_db_label = ''
+
+    def showEvent(self, event):
+        """Monta a interface na primeira exibição; a leitura do banco fica para o próximo ciclo do event loop"""
+        super().showEvent(event)
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+            self.adjustSize()
+            QTimer.singleShot(0, self.load_config)
+
+    def apply_styles(self):
+        """Aplica estilos"""
+        self.setStyleSheet(self.QSS)
+
+    def _build_buttons(self, layout: QVBoxLayout):
+        """Botões Testar Conexão / Salvar / Cancelar"""
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+
+        self.test_button = QPushButton('Testar Conexão')
+        self.test_button.clicked.connect(self.test_connection)
+        buttons_layout.addWidget(self.test_button)
+
+        save_button = QPushButton('Salvar')
+        save_button.clicked.connect(self.save_config)
+        save_button.setDefault(True)
+        buttons_layout.addWidget(save_button)
+
+        cancel_button = QPushButton('Cancelar')
+        cancel_button.clicked.connect(self.reject)
+        buttons_layout.addWidget(cancel_button)
+
+        layout.addLayout(buttons_layout)
+
+    def _build_form(self, form: QFormLayout):
+        """Cria os widgets de _FIELDS (como atributos do diálogo) e as linhas do formulário"""
+        for attr, label, placeholder, factory, opts in self._FIELDS:
+            widget = getattr(self, factory)() if isinstance(factory, str) else factory()
+            setattr(self, attr, widget)
+
+            if placeholder:
+                widget.setPlaceholderText(placeholder)
+            if opts.get('password'):
+                widget.setEchoMode(QLineEdit.Password)
+            if 'range' in opts:
+                widget.setRange(*opts['range'])
+            if 'value' in opts:
+                widget.setValue(opts['value'])
+            if 'items' in opts:
+                widget.addItems(opts['items'])
+            if 'text' in opts:
+                widget.setText(opts['text'])
+            if 'checked' in opts:
+                widget.setChecked(opts['checked'])
+
+            if 'label' in opts:
+                label_widget = QLabel(label)
+                setattr(self, opts['label'], label_widget)
+                form.addRow(label_widget, widget)
+            else:
+                form.addRow(label, widget)
+
+    def _track_inputs(self, *attrs):
+        """
+        Mantém em self._vals o texto de cada QLineEdit já sem espaços nas pontas
+
+        textChanged (e não textEdited) para pegar também o setText do load_config;
+        validação, teste e save leem o dict em vez de ir ao widget a cada campo.
+        """
+        for attr in attrs:
+            widget = getattr(self, attr)
+            self._vals[attr] = widget.text().strip()
+            widget.textChanged.connect(lambda text, key=attr: self._vals.__setitem__(key, text.strip()))
+
+    def _value(self, attr: str) -> str:
+        """Texto do campo sem espaços nas pontas"""
+        return self._vals.get(attr, '')
+
+    def _required_fields(self):
+        """Campos obrigatórios para o estado atual do formulário"""
+        return self._REQUIRED
+
+    def validate_fields(self) -> bool:
+        """Valida campos obrigatórios (aviso e foco no primeiro campo vazio)"""
+        for attr, message, strip in self._required_fields():
+            widget = getattr(self, attr)
+            if not (self._value(attr) if strip else widget.text()):
+                QMessageBox.warning(self, 'Atenção', message)
+                widget.setFocus()
+                return False
+        return True
+
+    def _start_test(self, probe, db_label: str):
+        """Dispara o teste no QThreadPool; o resultado chega em _on_test_done"""
+        self._test_db_label = db_label
+        self.test_button.setEnabled(False)
+        self.test_button.setText('Testando...')
+
+        runnable = _ConnTestRunnable(probe)
+        runnable.signals.finished.connect(self._on_test_done)
+        self._test_runnable = runnable  # mantém os sinais vivos até a entrega
+        QThreadPool.globalInstance().start(runnable)
+
+    @pyqtSlot(bool, str)
+    def _on_test_done(self, success: bool, message: str):
+        """Resultado do teste de conexão (thread principal)"""
+        self._test_runnable = None
+        self.test_button.setEnabled(True)
+        self.test_button.setText('Testar Conexão')
+
+        if success:
+            QMessageBox.information(self, 'Sucesso', f'✓ {message}')
+        else:
+            QMessageBox.critical(
+                self, 'Erro de Conexão',
+                f'Não foi possível conectar ao {self._test_db_label}:\n\n{message}'
+            )
+
+    def _finish_save(self, success: bool):
+        """Avisa o resultado do save e fecha o diálogo se deu certo"""
+        if success:
+            self.config_saved.emit()
+            QMessageBox.information(self, 'Sucesso', 'Configuração salva com sucesso!')
+            self.accept()
+        else:
+            QMessageBox.critical(self, 'Erro', 'Erro ao salvar configuração.')
+
+
+class DatabaseConfigDialog(_BaseConfigDialog):
+    """Diálogo de Configuração de Banco de Dados (Oracle ou Firebird)"""
+
+    QSS = DB_CONFIG_QSS
+    _FIELDS = (
+        ('db_type_combo', 'Tipo de Banco:', None, QComboBox, {'items': ('Oracle', 'Firebird 2.5')}),
+        ('nome_input', 'Nome da Conexão:', 'Ex: Producao, Homologacao', QLineEdit, {}),
+        ('host_input', 'Host:', '192.168.1.100 ou servidor.empresa.com', QLineEdit, {}),
+        ('port_input', 'Porta:', None, QSpinBox, {'range': (1, 65535), 'value': 1521}),
+        # Oracle
+        ('service_input', 'Service Name:', 'ORCL, XE, etc', QLineEdit, {'label': 'service_label'}),
+        # Firebird
+        ('db_path_container', 'Database:', None, '_build_db_path_row', {'label': 'db_path_label'}),
+        ('charset_input', 'Charset:', 'WIN1252, UTF8, NONE (padrão: WIN1252)', QLineEdit,
+         {'label': 'charset_label'}),
+        ('username_input', 'Usuário:', 'usuario', QLineEdit, {}),
+        ('password_input', 'Senha:', '••••••••', QLineEdit, {'password': True}),
+        # Oracle
+        ('instant_client_container', 'Instant Client:', None, '_build_instant_client_row',
+         {'label': 'instant_client_label'}),
+    )
+    _REQUIRED_ORACLE = (
+        ('nome_input', 'Informe o nome da conexão.', True),
+        ('host_input', 'Informe o host.', True),
+        ('service_input', 'Informe o service name.', True),
+        ('username_input', 'Informe o usuário.', True),
+        ('password_input', 'Informe a senha.', False),
+    )
+    _REQUIRED_FIREBIRD = (
+        ('nome_input', 'Informe o nome da conexão.', True),
+        ('host_input', 'Informe o host.', True),
+        ('db_path_input', 'Informe o caminho do banco de dados (.fdb).', True),
+        ('username_input', 'Informe o usuário.', True),
+        ('password_input', 'Informe a senha.', False),
+    )
+
+    def __init__(self, parent=None, db_manager=None):
+        super().__init__(parent, db_manager)
+        self._dir_dialog = None  # QFileDialog do Instant Client (criado no primeiro uso)
+        self._file_dialog = None  # QFileDialog do arquivo .fdb (criado no primeiro uso)
 
     def init_ui(self):
         """Inicializa a interface"""
@@ -31,36 +290,25 @@ class DatabaseConfigDialog(QDialog):
         group = QGroupBox('Dados de Conexão')
         form = QFormLayout()
         form.setSpacing(10)
-
-        # Tipo de Banco de Dados
-        self.db_type_combo = QComboBox()
-        self.db_type_combo.addItems(['Oracle', 'Firebird 2.5'])
+        self._build_form(form)
         self.db_type_combo.currentTextChanged.connect(self.on_db_type_changed)
-        form.addRow('Tipo de Banco:', self.db_type_combo)
-
-        # Nome da Conexão
-        self.nome_input = QLineEdit()
-        self.nome_input.setPlaceholderText('Ex: Producao, Homologacao')
-        form.addRow('Nome da Conexão:', self.nome_input)
-
-        # Host
-        self.host_input = QLineEdit()
-        self.host_input.setPlaceholderText('192.168.1.100 ou servidor.empresa.com')
-        form.addRow('Host:', self.host_input)
-
-        # Port
-        self.port_input = QSpinBox()
-        self.port_input.setRange(1, 65535)
-        self.port_input.setValue(1521)
-        form.addRow('Porta:', self.port_input)
-
-        # Service Name (Oracle)
-        self.service_input = QLineEdit()
-        self.service_input.setPlaceholderText('ORCL, XE, etc')
-        self.service_label = QLabel('Service Name:')
-        form.addRow(self.service_label, self.service_input)
-
-        # Database Path (Firebird)
+
+        self._track_inputs('nome_input', 'host_input', 'service_input', 'db_path_input',
+                           'charset_input', 'username_input', 'instant_client_input')
+
+        group.setLayout(form)
+        layout.addWidget(group)
+
+        self._build_buttons(layout)
+        self.setLayout(layout)
+
+        self.apply_styles()
+
+        # Inicializa visibilidade dos campos conforme tipo padrão
+        self.on_db_type_changed('Oracle')
+
+    def _build_db_path_row(self) -> QWidget:
+        """Caminho do .fdb com botão de procurar (Firebird)"""
         db_path_container = QWidget()
         db_path_layout = QHBoxLayout(db_path_container)
         db_path_layout.setContentsMargins(0, 0, 0, 0)
@@ -72,28 +320,10 @@ class DatabaseConfigDialog(QDialog):
         browse_db_button.clicked.connect(self.browse_database_file)
         db_path_layout.addWidget(self.db_path_input)
         db_path_layout.addWidget(browse_db_button)
-        self.db_path_label = QLabel('Database:')
-        form.addRow(self.db_path_label, db_path_container)
-        self.db_path_container = db_path_container
-
-        # Charset (Firebird)
-        self.charset_input = QLineEdit()
-        self.charset_input.setPlaceholderText('WIN1252, UTF8, NONE (padrão: WIN1252)')
-        self.charset_label = QLabel('Charset:')
-        form.addRow(self.charset_label, self.charset_input)
-
-        # Username
-        self.username_input = QLineEdit()
-        self.username_input.setPlaceholderText('usuario')
-        form.addRow('Usuário:', self.username_input)
-
-        # Password
-        self.password_input = QLineEdit()
-        self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setPlaceholderText('••••••••')
-        form.addRow('Senha:', self.password_input)
-
-        # Instant Client Path (Oracle)
+        return db_path_container
+
+    def _build_instant_client_row(self) -> QWidget:
+        """Diretório do Instant Client com botão de procurar e explicação (Oracle)"""
         instant_client_container = QWidget()
         ic_outer = QVBoxLayout(instant_client_container)
         ic_outer.setContentsMargins(0, 0, 0, 0)
@@ -115,37 +345,7 @@ class DatabaseConfigDialog(QDialog):
         instant_client_info.setWordWrap(True)
         ic_outer.addWidget(instant_client_info)
 
-        self.instant_client_label = QLabel('Instant Client:')
-        form.addRow(self.instant_client_label, instant_client_container)
-        self.instant_client_container = instant_client_container
-
-        group.setLayout(form)
-        layout.addWidget(group)
-
-        # Botões
-        buttons_layout = QHBoxLayout()
-        buttons_layout.addStretch()
-
-        test_button = QPushButton('Testar Conexão')
-        test_button.clicked.connect(self.test_connection)
-        buttons_layout.addWidget(test_button)
-
-        save_button = QPushButton('Salvar')
-        save_button.clicked.connect(self.save_config)
-        save_button.setDefault(True)
-        buttons_layout.addWidget(save_button)
-
-        cancel_button = QPushButton('Cancelar')
-        cancel_button.clicked.connect(self.reject)
-        buttons_layout.addWidget(cancel_button)
-
-        layout.addLayout(buttons_layout)
-        self.setLayout(layout)
-
-        self.apply_styles()
-
-        # Inicializa visibilidade dos campos conforme tipo padrão
-        self.on_db_type_changed('Oracle')
+        return instant_client_container
 
     def on_db_type_changed(self, db_type: str):
         """Mostra/oculta campos conforme o tipo de banco selecionado"""
@@ -176,67 +376,39 @@ class DatabaseConfigDialog(QDialog):
         else:
             self.username_input.setPlaceholderText('usuario_oracle')
 
-    def apply_styles(self):
-        """Aplica estilos"""
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QSpinBox, QComboBox {
-                padding: 8px;
-                border: 1px solid #bdc3c7;
-                border-radius: 3px;
-            }
-            QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
-                border: 2px solid #3498db;
-            }
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-
     def browse_instant_client(self):
         """Abre diálogo para selecionar diretório do Instant Client"""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            'Selecionar Diretório do Oracle Instant Client',
-            os.path.expanduser('~'),
-            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
-        )
-        if directory:
-            self.instant_client_input.setText(directory)
+        from PyQt5.QtWidgets import QFileDialog  # só quando o usuário procura um caminho
+
+        # Criado no primeiro clique e reaproveitado (mantém a última pasta visitada)
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(
+                self, 'Selecionar Diretório do Oracle Instant Client', os.path.expanduser('~')
+            )
+            self._dir_dialog.setFileMode(QFileDialog.Directory)
+            self._dir_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+            self._dir_dialog.setOption(QFileDialog.DontResolveSymlinks, True)
+
+        if self._dir_dialog.exec_() == QDialog.Accepted:
+            self.instant_client_input.setText(self._dir_dialog.selectedFiles()[0])
 
     def browse_database_file(self):
         """Abre diálogo para selecionar arquivo .fdb do Firebird"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            'Selecionar Banco de Dados Firebird',
-            os.path.expanduser('~'),
-            'Firebird Database (*.fdb *.gdb);;Todos os arquivos (*.*)'
-        )
-        if file_path:
-            self.db_path_input.setText(file_path)
+        from PyQt5.QtWidgets import QFileDialog
+
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(
+                self, 'Selecionar Banco de Dados Firebird', os.path.expanduser('~'),
+                'Firebird Database (*.fdb *.gdb);;Todos os arquivos (*.*)'
+            )
+            self._file_dialog.setFileMode(QFileDialog.ExistingFile)
+
+        if self._file_dialog.exec_() == QDialog.Accepted:
+            self.db_path_input.setText(self._file_dialog.selectedFiles()[0])
 
     def load_config(self):
         """Carrega configuração existente"""
-        config = db_manager.get_oracle_config()
+        config = self.db_manager.get_oracle_config()
         if config:
             self.nome_input.setText(config.get('nome_conexao', ''))
             self.host_input.setText(config.get('host', ''))
@@ -254,112 +426,54 @@ class DatabaseConfigDialog(QDialog):
                 self.instant_client_input.setText(config.get('instant_client_path', '') or '')
             # Senha não é carregada por segurança
 
-    def validate_fields(self) -> bool:
-        """Valida campos obrigatórios"""
-        if not self.nome_input.text().strip():
-            QMessageBox.warning(self, 'Atenção', 'Informe o nome da conexão.')
-            self.nome_input.setFocus()
-            return False
-
-        if not self.host_input.text().strip():
-            QMessageBox.warning(self, 'Atenção', 'Informe o host.')
-            self.host_input.setFocus()
-            return False
-
-        is_firebird = self.db_type_combo.currentText() == 'Firebird 2.5'
-
-        if is_firebird:
-            if not self.db_path_input.text().strip():
-                QMessageBox.warning(self, 'Atenção', 'Informe o caminho do banco de dados (.fdb).')
-                self.db_path_input.setFocus()
-                return False
-        else:
-            if not self.service_input.text().strip():
-                QMessageBox.warning(self, 'Atenção', 'Informe o service name.')
-                self.service_input.setFocus()
-                return False
-
-        if not self.username_input.text().strip():
-            QMessageBox.warning(self, 'Atenção', 'Informe o usuário.')
-            self.username_input.setFocus()
-            return False
-
-        if not self.password_input.text():
-            QMessageBox.warning(self, 'Atenção', 'Informe a senha.')
-            self.password_input.setFocus()
-            return False
-
-        return True
+    def _required_fields(self):
+        """Campos obrigatórios conforme o tipo de banco selecionado"""
+        if self.db_type_combo.currentText() == 'Firebird 2.5':
+            return self._REQUIRED_FIREBIRD
+        return self._REQUIRED_ORACLE
 
     def test_connection(self):
-        """Testa conexão conforme o tipo de banco selecionado"""
+        """Testa conexão conforme o tipo de banco selecionado (em background)"""
         if not self.validate_fields():
             return
 
         if self.db_type_combo.currentText() == 'Firebird 2.5':
-            self._test_firebird_connection()
-        else:
-            self._test_oracle_connection()
-
-    def _test_oracle_connection(self):
-        """Testa conexão Oracle"""
-        try:
-            from core.oracle_client import OracleClient
+            try:
+                import firebirdsql
+            except ImportError:
+                QMessageBox.critical(
+                    self, 'Biblioteca não encontrada',
+                    'A biblioteca "firebirdsql" não está instalada.\n\nInstale com:\n  pip install firebirdsql'
+                )
+                return
 
+            params = {
+                'host': self._value('host_input'),
+                'database': self._value('db_path_input'),
+                'user': self._value('username_input'),
+                'password': self.password_input.text(),
+                'port': self.port_input.value(),
+                'charset': self._value('charset_input') or 'WIN1252',
+                'auth_plugin_name': 'Legacy_Auth',
+            }
+            self._start_test(lambda: self._probe_firebird(firebirdsql, params), 'Firebird')
+        else:
             temp_config = {
-                'host': self.host_input.text().strip(),
+                'host': self._value('host_input'),
                 'port': self.port_input.value(),
-                'service_name': self.service_input.text().strip(),
-                'username': self.username_input.text().strip(),
+                'service_name': self._value('service_input'),
+                'username': self._value('username_input'),
                 'password': self.password_input.text(),
-                'instant_client_path': self.instant_client_input.text().strip() or None
+                'instant_client_path': self._value('instant_client_input') or None
             }
+            self._start_test(lambda: OracleClient(temp_config).test_connection(), 'Oracle')
 
-            oracle_client = OracleClient(temp_config)
-            success, message = oracle_client.test_connection()
-
-            if success:
-                QMessageBox.information(self, 'Sucesso', f'✓ {message}')
-            else:
-                QMessageBox.critical(
-                    self, 'Erro de Conexão',
-                    f'Não foi possível conectar ao Oracle:\n\n{message}'
-                )
-        except Exception as e:
-            QMessageBox.critical(
-                self, 'Erro de Conexão',
-                f'Não foi possível conectar ao Oracle:\n\n{str(e)}'
-            )
-
-    def _test_firebird_connection(self):
-        """Testa conexão Firebird"""
-        try:
-            import firebirdsql
-        except ImportError:
-            QMessageBox.critical(
-                self, 'Biblioteca não encontrada',
-                'A biblioteca "firebirdsql" não está instalada.\n\nInstale com:\n  pip install firebirdsql'
-            )
-            return
-
-        try:
-            charset = self.charset_input.text().strip() or 'WIN1252'
-            con = firebirdsql.connect(
-                host=self.host_input.text().strip(),
-                database=self.db_path_input.text().strip(),
-                user=self.username_input.text().strip(),
-                password=self.password_input.text(),
-                port=self.port_input.value(),
-                charset=charset,
-                auth_plugin_name='Legacy_Auth',
-            )
-            con.close()
-            QMessageBox.information(self, 'Sucesso', '✓ Conexão ao Firebird realizada com sucesso!')
-        except Exception as e:
-            QMessageBox.critical(
-                self, 'Erro de Conexão',
-                f'Não foi possível conectar ao Firebird:\n\n{str(e)}'
-            )
+    @staticmethod
+    def _probe_firebird(firebirdsql, params: dict):
+        """Abre e fecha uma conexão Firebird (roda no QThreadPool)"""
+        con = firebirdsql.connect(**params)
+        con.close()
+        return True, 'Conexão ao Firebird realizada com sucesso!'
 
     def save_config(self):
         """Salva configuração"""
@@ -372,44 +486,50 @@ class DatabaseConfigDialog(QDialog):
         if is_firebird:
             service_name = ''
             instant_client_path = None
-            database_path = self.db_path_input.text().strip()
-            charset = self.charset_input.text().strip() or 'WIN1252'
+            database_path = self._value('db_path_input')
+            charset = self._value('charset_input') or 'WIN1252'
         else:
-            service_name = self.service_input.text().strip()
-            instant_client_path = self.instant_client_input.text().strip() or None
+            service_name = self._value('service_input')
+            instant_client_path = self._value('instant_client_input') or None
             database_path = None
             charset = None
 
-        success = db_manager.save_oracle_config(
-            nome_conexao=self.nome_input.text().strip(),
-            host=self.host_input.text().strip(),
+        success = self.db_manager.save_oracle_config(
+            nome_conexao=self._value('nome_input'),
+            host=self._value('host_input'),
             port=self.port_input.value(),
             service_name=service_name,
-            username=self.username_input.text().strip(),
+            username=self._value('username_input'),
             password=self.password_input.text(),
             instant_client_path=instant_client_path,
             db_type=db_type,
             database_path=database_path,
             charset=charset
         )
-
-        if success:
-            QMessageBox.information(self, 'Sucesso', 'Configuração salva com sucesso!')
-            self.accept()
-        else:
-            QMessageBox.critical(self, 'Erro', 'Erro ao salvar configuração.')
+        self._finish_save(success)
 
 
 # Alias para compatibilidade com código existente
 OracleConfigDialog = DatabaseConfigDialog
 
-class OrionTaxConfigDialog(QDialog):
+class OrionTaxConfigDialog(_BaseConfigDialog):
     """Diálogo de Configuração OrionTax (PostgreSQL)"""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.init_ui()
-        self.load_config()
+    QSS = ORIONTAX_CONFIG_QSS
+    _FIELDS = (
+        ('host_input', 'Host:', 'oriontax.servidor.com ou IP', QLineEdit, {}),
+        ('port_input', 'Porta:', None, QSpinBox, {'range': (1, 65535), 'value': 5432}),
+        ('database_input', 'Banco de Dados:', 'oriontax', QLineEdit, {}),
+        ('username_input', 'Usuário:', 'oriontax_user', QLineEdit, {}),
+        ('password_input', 'Senha:', '••••••••', QLineEdit, {'password': True}),
+        ('ssl_checkbox', 'Segurança:', None, QCheckBox, {'text': 'Usar SSL/TLS', 'checked': True}),
+    )
+    _REQUIRED = (
+        ('host_input', 'Informe o host.', True),
+        ('database_input', 'Informe o banco de dados.', True),
+        ('username_input', 'Informe o usuário.', True),
+        ('password_input', 'Informe a senha.', False),
+    )
     
     def init_ui(self):
         """Inicializa a interface"""
@@ -423,103 +543,21 @@ class OrionTaxConfigDialog(QDialog):
         group = QGroupBox('Dados de Conexão OrionTax (PostgreSQL)')
         form = QFormLayout()
         form.setSpacing(10)
+        self._build_form(form)
         
-        # Host
-        self.host_input = QLineEdit()
-        self.host_input.setPlaceholderText('oriontax.servidor.com ou IP')
-        form.addRow('Host:', self.host_input)
-        
-        # Port
-        self.port_input = QSpinBox()
-        self.port_input.setRange(1, 65535)
-        self.port_input.setValue(5432)
-        form.addRow('Porta:', self.port_input)
-        
-        # Database
-        self.database_input = QLineEdit()
-        self.database_input.setPlaceholderText('oriontax')
-        form.addRow('Banco de Dados:', self.database_input)
-        
-        # Username
-        self.username_input = QLineEdit()
-        self.username_input.setPlaceholderText('oriontax_user')
-        form.addRow('Usuário:', self.username_input)
-        
-        # Password
-        self.password_input = QLineEdit()
-        self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setPlaceholderText('••••••••')
-        form.addRow('Senha:', self.password_input)
-        
-        # SSL
-        self.ssl_checkbox = QCheckBox('Usar SSL/TLS')
-        self.ssl_checkbox.setChecked(True)
-        form.addRow('Segurança:', self.ssl_checkbox)
+        self._track_inputs('host_input', 'database_input', 'username_input')
         
         group.setLayout(form)
         layout.addWidget(group)
         
-        # Botões
-        buttons_layout = QHBoxLayout()
-        buttons_layout.addStretch()
-        
-        test_button = QPushButton('Testar Conexão')
-        test_button.clicked.connect(self.test_connection)
-        buttons_layout.addWidget(test_button)
-        
-        save_button = QPushButton('Salvar')
-        save_button.clicked.connect(self.save_config)
-        save_button.setDefault(True)
-        buttons_layout.addWidget(save_button)
-        
-        cancel_button = QPushButton('Cancelar')
-        cancel_button.clicked.connect(self.reject)
-        buttons_layout.addWidget(cancel_button)
-        
-        layout.addLayout(buttons_layout)
+        self._build_buttons(layout)
         self.setLayout(layout)
         
         self.apply_styles()
     
-    def apply_styles(self):
-        """Aplica estilos"""
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QSpinBox {
-                padding: 8px;
-                border: 1px solid #bdc3c7;
-                border-radius: 3px;
-            }
-            QLineEdit:focus, QSpinBox:focus {
-                border: 2px solid #3498db;
-            }
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
-    
     def load_config(self):
         """Carrega configuração existente"""
-        config = db_manager.get_oriontax_config()
+        config = self.db_manager.get_oriontax_config()
         if config:
             self.host_input.setText(config.get('host', ''))
             self.port_input.setValue(config.get('port', 5432))
@@ -528,90 +566,43 @@ class OrionTaxConfigDialog(QDialog):
             self.ssl_checkbox.setChecked(config.get('use_ssl', True))
     
     def test_connection(self):
-        """Testa conexão PostgreSQL"""
+        """Testa conexão PostgreSQL (em background)"""
         if not self.validate_fields():
             return
         
-        try:
-            import psycopg2
-            
-            sslmode = 'require' if self.ssl_checkbox.isChecked() else 'disable'
-            
-            connection = psycopg2.connect(
-                host=self.host_input.text(),
-                port=self.port_input.value(),
-                database=self.database_input.text(),
-                user=self.username_input.text(),
-                password=self.password_input.text(),
-                sslmode=sslmode,
-                connect_timeout=10
-            )
-            
-            connection.close()
-            
-            QMessageBox.information(
-                self,
-                'Sucesso',
-                '✓ Conexão realizada com sucesso!'
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                'Erro de Conexão',
-                f'Não foi possível conectar ao OrionTax:\n\n{str(e)}'
-            )
+        params = {
+            'host': self._value('host_input'),
+            'port': self.port_input.value(),
+            'database': self._value('database_input'),
+            'user': self._value('username_input'),
+            'password': self.password_input.text(),
+            'sslmode': 'require' if self.ssl_checkbox.isChecked() else 'disable',
+            'connect_timeout': 10
+        }
+        
+        self._start_test(lambda: self._probe_postgres(params), 'OrionTax')
     
-    def validate_fields(self) -> bool:
-        """Valida campos"""
-        if not self.host_input.text().strip():
-            QMessageBox.warning(self, 'Atenção', 'Informe o host.')
-            self.host_input.setFocus()
-            return False
-        
-        if not self.database_input.text().strip():
-            QMessageBox.warning(self, 'Atenção', 'Informe o banco de dados.')
-            self.database_input.setFocus()
-            return False
-        
-        if not self.username_input.text().strip():
-            QMessageBox.warning(self, 'Atenção', 'Informe o usuário.')
-            self.username_input.setFocus()
-            return False
-        
-        if not self.password_input.text():
-            QMessageBox.warning(self, 'Atenção', 'Informe a senha.')
-            self.password_input.setFocus()
-            return False
-        
-        return True
+    @staticmethod
+    def _probe_postgres(params: dict):
+        """Abre e fecha uma conexão PostgreSQL (roda no QThreadPool)"""
+        connection = psycopg2.connect(**params)
+        connection.close()
+        return True, 'Conexão realizada com sucesso!'
     
     def save_config(self):
         """Salva configuração"""
         if not self.validate_fields():
             return
         
-        success = db_manager.save_oriontax_config(
-            host=self.host_input.text().strip(),
+        success = self.db_manager.save_oriontax_config(
+            host=self._value('host_input'),
             port=self.port_input.value(),
-            database_name=self.database_input.text().strip(),
-            username=self.username_input.text().strip(),
+            database_name=self._value('database_input'),
+            username=self._value('username_input'),
             password=self.password_input.text(),
             use_ssl=self.ssl_checkbox.isChecked()
         )
-        
-        if success:
-            QMessageBox.information(
-                self,
-                'Sucesso',
-                'Configuração salva com sucesso!'
-            )
-            self.accept()
-        else:
-            QMessageBox.critical(
-                self,
-                'Erro',
-                'Erro ao salvar configuração.'
-            )
+        self._finish_save(success)
 
 
 class HeartbeatConfigDialog(QDialog):
@@ -672,48 +663,16 @@ class HeartbeatConfigDialog(QDialog):
         layout.addLayout(buttons)
         self.setLayout(layout)
 
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QSpinBox {
-                padding: 8px;
-                border: 1px solid #bdc3c7;
-                border-radius: 3px;
-            }
-            QSpinBox:focus {
-                border: 2px solid #3498db;
-            }
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
+        self.setStyleSheet(HEARTBEAT_CONFIG_QSS)
 
     def load_config(self):
-        interval = db_manager.get_heartbeat_interval()
+        interval = _default_db_manager.get_heartbeat_interval()
         self.interval_spin.setValue(interval)
 
     def save_config(self):
         interval = self.interval_spin.value()
 
-        if not db_manager.set_heartbeat_interval(interval):
+        if not _default_db_manager.set_heartbeat_interval(interval):
             QMessageBox.critical(self, 'Erro', 'Não foi possível salvar a configuração.')
             return
 
@@ -734,443 +693,3 @@ class HeartbeatConfigDialog(QDialog):
             f'Heartbeat configurado para enviar a cada {interval} minuto(s).'
         )
         self.accept()
-
-
-# class ScheduleDialog(QDialog):
-#     """Diálogo de Agendamento"""
-
-#     DIAS_SEMANA = {
-#         0: 'Segunda-feira',
-#         1: 'Terça-feira',
-#         2: 'Quarta-feira',
-#         3: 'Quinta-feira',
-#         4: 'Sexta-feira',
-#         5: 'Sábado',
-#         6: 'Domingo'
-#     }
-    
-#     def __init__(self, parent=None):
-#         super().__init__(parent)
-#         self.init_ui()
-    
-#     def init_ui(self):
-#         """Inicializa a interface"""
-#         self.setWindowTitle('Configuração Oracle')
-#         self.setMinimumWidth(500)
-        
-#         layout = QVBoxLayout()
-#         layout.setSpacing(15)
-        
-#         # GroupBox principal
-#         group = QGroupBox('Dados de Conexão Oracle')
-#         form = QFormLayout()
-#         form.setSpacing(10)
-        
-#         # Nome da Conexão
-#         self.nome_input = QLineEdit()
-#         self.nome_input.setPlaceholderText('Ex: Producao, Homologacao')
-#         form.addRow('Nome da Conexão:', self.nome_input)
-        
-#         # Host
-#         self.host_input = QLineEdit()
-#         self.host_input.setPlaceholderText('192.168.1.100 ou oracle.empresa.com')
-#         form.addRow('Host:', self.host_input)
-        
-#         # Port
-#         self.port_input = QSpinBox()
-#         self.port_input.setRange(1, 65535)
-#         self.port_input.setValue(1521)
-#         form.addRow('Porta:', self.port_input)
-        
-#         # Service Name
-#         self.service_input = QLineEdit()
-#         self.service_input.setPlaceholderText('ORCL, XE, etc')
-#         form.addRow('Service Name:', self.service_input)
-        
-#         # Username
-#         self.username_input = QLineEdit()
-#         self.username_input.setPlaceholderText('usuario_oracle')
-#         form.addRow('Usuário:', self.username_input)
-        
-#         # Password
-#         self.password_input = QLineEdit()
-#         self.password_input.setEchoMode(QLineEdit.Password)
-#         self.password_input.setPlaceholderText('••••••••')
-#         form.addRow('Senha:', self.password_input)
-        
-#         # ✅ NOVO: Instant Client Path (Opcional)
-#         instant_client_layout = QVBoxLayout()
-        
-#         self.instant_client_input = QLineEdit()
-#         self.instant_client_input.setPlaceholderText('/path/to/instantclient_19_20')
-#         instant_client_layout.addWidget(self.instant_client_input)
-        
-#         instant_client_info = QLabel('Deixe em branco para usar modo thin (Oracle 12.1+)')
-#         instant_client_info.setStyleSheet('color: #7f8c8d; font-size: 11px;')
-#         instant_client_layout.addWidget(instant_client_info)
-        
-#         # Botão para selecionar diretório
-#         browse_layout = QHBoxLayout()
-#         browse_button = QPushButton('📁 Procurar...')
-#         browse_button.clicked.connect(self.browse_instant_client)
-#         browse_layout.addWidget(browse_button)
-#         browse_layout.addStretch()
-#         instant_client_layout.addLayout(browse_layout)
-        
-#         form.addRow('Instant Client (Opcional):', instant_client_layout)
-        
-#         group.setLayout(form)
-#         layout.addWidget(group)
-        
-#         # Botões
-#         buttons_layout = QHBoxLayout()
-#         buttons_layout.addStretch()
-        
-#         test_button = QPushButton('Testar Conexão')
-#         test_button.clicked.connect(self.test_connection)
-#         buttons_layout.addWidget(test_button)
-        
-#         save_button = QPushButton('Salvar')
-#         save_button.clicked.connect(self.save_config)
-#         save_button.setDefault(True)
-#         buttons_layout.addWidget(save_button)
-        
-#         cancel_button = QPushButton('Cancelar')
-#         cancel_button.clicked.connect(self.reject)
-#         buttons_layout.addWidget(cancel_button)
-        
-#         layout.addLayout(buttons_layout)
-#         self.setLayout(layout)
-        
-#         self.apply_styles()
-    
-#     def browse_instant_client(self):
-#         """Abre diálogo para selecionar diretório do Instant Client"""
-#         from PyQt5.QtWidgets import QFileDialog
-        
-#         directory = QFileDialog.getExistingDirectory(
-#             self,
-#             'Selecionar Diretório do Oracle Instant Client',
-#             os.path.expanduser('~')
-#         )
-        
-#         if directory:
-#             self.instant_client_input.setText(directory)
-    
-#     def load_config(self):
-#         """Carrega configuração existente"""
-#         config = db_manager.get_oracle_config()
-#         if config:
-#             self.nome_input.setText(config.get('nome_conexao', ''))
-#             self.host_input.setText(config.get('host', ''))
-#             self.port_input.setValue(config.get('port', 1521))
-#             self.service_input.setText(config.get('service_name', ''))
-#             self.username_input.setText(config.get('username', ''))
-#             self.instant_client_input.setText(config.get('instant_client_path', ''))
-#             # Senha não é carregada por segurança
-    
-#     def test_connection(self):
-#         """Testa conexão Oracle"""
-#         if not self.validate_fields():
-#             return
-        
-#         try:
-#             import oracledb
-#             from core.oracle_client import OracleClient
-            
-#             # Preparar config temporária
-#             temp_config = {
-#                 'host': self.host_input.text(),
-#                 'port': self.port_input.value(),
-#                 'service_name': self.service_input.text(),
-#                 'username': self.username_input.text(),
-#                 'password': self.password_input.text(),
-#                 'instant_client_path': self.instant_client_input.text().strip() or None
-#             }
-            
-#             oracle_client = OracleClient(temp_config)
-#             success, message = oracle_client.test_connection()
-            
-#             if success:
-#                 QMessageBox.information(
-#                     self,
-#                     'Sucesso',
-#                     f'✓ {message}'
-#                 )
-#             else:
-#                 QMessageBox.critical(
-#                     self,
-#                     'Erro de Conexão',
-#                     f'Não foi possível conectar ao Oracle:\n\n{message}'
-#                 )
-#         except Exception as e:
-#             QMessageBox.critical(
-#                 self,
-#                 'Erro de Conexão',
-#                 f'Não foi possível conectar ao Oracle:\n\n{str(e)}'
-#             )
-    
-#     def save_config(self):
-#         """Salva configuração"""
-#         if not self.validate_fields():
-#             return
-        
-#         instant_client_path = self.instant_client_input.text().strip() or None
-        
-#         success = db_manager.save_oracle_config(
-#             nome_conexao=self.nome_input.text().strip(),
-#             host=self.host_input.text().strip(),
-#             port=self.port_input.value(),
-#             service_name=self.service_input.text().strip(),
-#             username=self.username_input.text().strip(),
-#             password=self.password_input.text(),
-#             instant_client_path=instant_client_path
-#         )
-        
-#         if success:
-#             QMessageBox.information(
-#                 self,
-#                 'Sucesso',
-#                 'Configuração salva com sucesso!'
-#             )
-#             self.accept()
-#         else:
-#             QMessageBox.critical(
-#                 self,
-#                 'Erro',
-#                 'Erro ao salvar configuração.'
-#             )
-    
-#     def apply_styles(self):
-#         """Aplica estilos"""
-#         self.setStyleSheet("""
-#             QGroupBox {
-#                 font-weight: bold;
-#                 border: 2px solid #bdc3c7;
-#                 border-radius: 5px;
-#                 margin-top: 10px;
-#                 padding-top: 10px;
-#             }
-#             QComboBox, QTimeEdit {
-#                 padding: 8px;
-#                 border: 1px solid #bdc3c7;
-#                 border-radius: 3px;
-#             }
-#             QPushButton {
-#                 padding: 8px 20px;
-#                 background-color: #9b59b6;
-#                 color: white;
-#                 border: none;
-#                 border-radius: 3px;
-#                 min-width: 100px;
-#             }
-#             QPushButton:hover {
-#                 background-color: #8e44ad;
-#             }
-#         """)
-    
-#     def on_frequency_changed(self, freq: str):
-#         """Atualiza interface conforme frequência"""
-#         if freq == 'Semanal':
-#             self.dias_list.setEnabled(True)
-#         else:
-#             self.dias_list.setEnabled(False)
-#             self.dias_list.clearSelection()
-    
-#     def save_schedule(self):
-#         """Salva agendamento"""
-#         tipo = 'ENVIAR' if self.tipo_combo.currentIndex() == 0 else 'BUSCAR'
-#         freq = self.freq_combo.currentText().upper()
-#         hora = self.time_edit.time().toString('HH:mm')
-        
-#         # Pegar dias selecionados
-#         dias_semana = []
-#         if freq == 'SEMANAL':
-#             for i in range(self.dias_list.count()):
-#                 if self.dias_list.item(i).isSelected():
-#                     dias_semana.append(i)
-            
-#             if not dias_semana:
-#                 QMessageBox.warning(
-#                     self,
-#                     'Atenção',
-#                     'Selecione pelo menos um dia da semana.'
-#                 )
-#                 return
-        
-#         success = db_manager.save_agendamento(tipo, freq, dias_semana, hora)
-        
-#         if success:
-#             QMessageBox.information(
-#                 self,
-#                 'Sucesso',
-#                 'Agendamento salvo com sucesso!'
-#             )
-#             self.accept()
-#         else:
-#             QMessageBox.critical(
-#                 self,
-#                 'Erro',
-#                 'Erro ao salvar agendamento.'
-#             )
-# class ScheduleDialog(QDialog):
-#     """Diálogo de Agendamento"""
-    
-#     DIAS_SEMANA = {
-#         0: 'Segunda-feira',
-#         1: 'Terça-feira',
-#         2: 'Quarta-feira',
-#         3: 'Quinta-feira',
-#         4: 'Sexta-feira',
-#         5: 'Sábado',
-#         6: 'Domingo'
-#     }
-    
-#     def __init__(self, parent=None):
-#         super().__init__(parent)
-#         self.init_ui()
-    
-#     def init_ui(self):
-#         """Inicializa a interface"""
-#         self.setWindowTitle('Configurar Agendamento')
-#         self.setMinimumWidth(450)
-        
-#         layout = QVBoxLayout()
-#         layout.setSpacing(15)
-        
-#         # Tipo de Operação
-#         op_group = QGroupBox('Tipo de Operação')
-#         op_layout = QVBoxLayout()
-        
-#         self.tipo_combo = QComboBox()
-#         self.tipo_combo.addItems(['Enviar dados para OrionTax', 'Buscar dados da OrionTax'])
-#         op_layout.addWidget(self.tipo_combo)
-        
-#         op_group.setLayout(op_layout)
-#         layout.addWidget(op_group)
-        
-#         # Frequência
-#         freq_group = QGroupBox('Frequência')
-#         freq_layout = QVBoxLayout()
-        
-#         self.freq_combo = QComboBox()
-#         self.freq_combo.addItems(['Diária', 'Semanal', 'Mensal'])
-#         self.freq_combo.currentTextChanged.connect(self.on_frequency_changed)
-#         freq_layout.addWidget(self.freq_combo)
-        
-#         # Lista de dias da semana
-#         self.dias_list = QListWidget()
-#         self.dias_list.setSelectionMode(QListWidget.MultiSelection)
-#         for dia_num, dia_nome in self.DIAS_SEMANA.items():
-#             self.dias_list.addItem(dia_nome)
-#         self.dias_list.setMaximumHeight(150)
-#         freq_layout.addWidget(self.dias_list)
-        
-#         freq_group.setLayout(freq_layout)
-#         layout.addWidget(freq_group)
-        
-#         # Horário
-#         hora_group = QGroupBox('Horário de Execução')
-#         hora_layout = QHBoxLayout()
-        
-#         self.time_edit = QTimeEdit()
-#         self.time_edit.setDisplayFormat('HH:mm')
-#         self.time_edit.setTime(QTime(8, 0))
-#         hora_layout.addWidget(QLabel('Hora:'))
-#         hora_layout.addWidget(self.time_edit)
-#         hora_layout.addStretch()
-        
-#         hora_group.setLayout(hora_layout)
-#         layout.addWidget(hora_group)
-        
-#         # Botões
-#         buttons_layout = QHBoxLayout()
-#         buttons_layout.addStretch()
-        
-#         save_button = QPushButton('Salvar')
-#         save_button.clicked.connect(self.save_schedule)
-#         save_button.setDefault(True)
-#         buttons_layout.addWidget(save_button)
-        
-#         cancel_button = QPushButton('Cancelar')
-#         cancel_button.clicked.connect(self.reject)
-#         buttons_layout.addWidget(cancel_button)
-        
-#         layout.addLayout(buttons_layout)
-#         self.setLayout(layout)
-        
-#         self.apply_styles()
-#         self.on_frequency_changed('Diária')
-    
-#     def apply_styles(self):
-#         """Aplica estilos"""
-#         self.setStyleSheet("""
-#             QGroupBox {
-#                 font-weight: bold;
-#                 border: 2px solid #bdc3c7;
-#                 border-radius: 5px;
-#                 margin-top: 10px;
-#                 padding-top: 10px;
-#             }
-#             QComboBox, QTimeEdit {
-#                 padding: 8px;
-#                 border: 1px solid #bdc3c7;
-#                 border-radius: 3px;
-#             }
-#             QPushButton {
-#                 padding: 8px 20px;
-#                 background-color: #9b59b6;
-#                 color: white;
-#                 border: none;
-#                 border-radius: 3px;
-#                 min-width: 100px;
-#             }
-#             QPushButton:hover {
-#                 background-color: #8e44ad;
-#             }
-#         """)
-    
-#     def on_frequency_changed(self, freq: str):
-#         """Atualiza interface conforme frequência"""
-#         if freq == 'Semanal':
-#             self.dias_list.setEnabled(True)
-#         else:
-#             self.dias_list.setEnabled(False)
-#             self.dias_list.clearSelection()
-    
-#     def save_schedule(self):
-#         """Salva agendamento"""
-#         tipo = 'ENVIAR' if self.tipo_combo.currentIndex() == 0 else 'BUSCAR'
-#         freq = self.freq_combo.currentText().upper()
-#         hora = self.time_edit.time().toString('HH:mm')
-        
-#         # Pegar dias selecionados
-#         dias_semana = []
-#         if freq == 'SEMANAL':
-#             for i in range(self.dias_list.count()):
-#                 if self.dias_list.item(i).isSelected():
-#                     dias_semana.append(i)
-            
-#             if not dias_semana:
-#                 QMessageBox.warning(
-#                     self,
-#                     'Atenção',
-#                     'Selecione pelo menos um dia da semana.'
-#                 )
-#                 return
-        
-#         success = db_manager.save_agendamento(tipo, freq, dias_semana, hora)
-        
-#         if success:
-#             QMessageBox.information(
-#                 self,
-#                 'Sucesso',
-#                 'Agendamento salvo com sucesso!'
-#             )
-#             self.accept()
-#         else:
-#             QMessageBox.critical(
-#                 self,
-#                 'Erro',
-#                 'Erro ao salvar agendamento.'
-#             )
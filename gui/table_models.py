@@ -0,0 +1,281 @@
+"""
+Modelos de tabela (model/view) da janela principal
+
+Os registros ficam como vieram do banco (lista de dicts); o texto de cada
+célula é montado em data() apenas para as células desenhadas, e guardado
+para as próximas repinturas (rolagem, hover, seleção). Ordenação e
+filtro ficam a cargo de um QSortFilterProxyModel (ver make_table_view).
+"""
+from contextlib import contextmanager
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtWidgets import QTableView
+
+# Linhas amostradas no ajuste de largura das colunas (padrão do Qt: 1000,
+# o que formataria todas as células e anularia o data() sob demanda)
+RESIZE_SAMPLE_ROWS = 50
+
+# Rótulos dos agendamentos
+_SCHEDULE_TIPO_MAP = {
+    'daily': 'Diário',
+    'weekly': 'Semanal',
+    'monthly': 'Mensal'
+}
+_WEEKDAY_MAP = {0: 'Seg', 1: 'Ter', 2: 'Qua', 3: 'Qui', 4: 'Sex', 5: 'Sáb', 6: 'Dom'}
+
+
+class RecordTableModel(QAbstractTableModel):
+    """Modelo base: uma linha por dict, uma coluna por item de HEADERS"""
+
+    HEADERS = ()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._cells = []  # texto já formatado por linha (None = ainda não desenhada)
+
+    # ------------------------------------------------------------------
+    # API do QAbstractTableModel
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        if role == Qt.EditRole:
+            # Chave de ordenação do proxy (números/datas em vez do texto formatado)
+            key = self.sort_key(self._rows[row], column)
+            if key is not None:
+                return key
+            role = Qt.DisplayRole
+        if role == Qt.DisplayRole:
+            cells = self._cells[row]
+            if cells is None:
+                cells = self._cells[row] = [None] * len(self.HEADERS)
+            text = cells[column]
+            if text is None:
+                text = cells[column] = self.display(self._rows[row], column)
+            return text
+        return self.style(self._rows[row], column, role)
+
+    # ------------------------------------------------------------------
+    # Implementado pelas subclasses
+    # ------------------------------------------------------------------
+
+    def display(self, record: dict, column: int) -> str:
+        """Texto da célula"""
+        raise NotImplementedError
+
+    def style(self, record: dict, column: int, role: int):
+        """Cor/fonte da célula (None = padrão da tabela)"""
+        return None
+
+    def sort_key(self, record: dict, column: int):
+        """Valor nativo para ordenar a coluna (None = ordenar pelo texto)"""
+        return None
+
+    # ------------------------------------------------------------------
+    # Dados
+    # ------------------------------------------------------------------
+
+    def set_rows(self, rows: list):
+        """Substitui todas as linhas (um único reset do modelo)"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._cells = [None] * len(self._rows)
+        self.endResetModel()
+
+    def prepend_rows(self, rows: list, limit: int = None):
+        """
+        Insere linhas no topo sem recarregar as existentes
+
+        Args:
+            rows: Novas linhas (já na ordem de exibição)
+            limit: Máximo de linhas mantidas; as do fim são descartadas
+        """
+        if not rows:
+            return
+
+        self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+        self._rows[:0] = rows
+        self._cells[:0] = [None] * len(rows)
+        self.endInsertRows()
+
+        if limit is not None and len(self._rows) > limit:
+            self.beginRemoveRows(QModelIndex(), limit, len(self._rows) - 1)
+            del self._rows[limit:]
+            del self._cells[limit:]
+            self.endRemoveRows()
+
+    def record(self, row: int) -> dict:
+        """Registro (dict) da linha do modelo"""
+        return self._rows[row]
+
+
+class ClientsTableModel(RecordTableModel):
+    """Clientes ativos"""
+
+    HEADERS = ('ID', 'Nome', 'CNPJ')
+
+    def __init__(self, format_cnpj, parent=None):
+        super().__init__(parent)
+        self.format_cnpj = format_cnpj
+
+    def display(self, record, column):
+        if column == 0:
+            return str(record['id'])
+        if column == 1:
+            return record['nome']
+        return self.format_cnpj(record['cnpj'])
+
+    def sort_key(self, record, column):
+        return record['id'] if column == 0 else None
+
+
+class LogsTableModel(RecordTableModel):
+    """Logs de execução, mais recentes primeiro"""
+
+    HEADERS = ('Data/Hora', 'Operação', 'Status', 'Mensagem', 'Registros', 'Tempo (s)')
+
+    def __init__(self, status_colors, status_font, parent=None):
+        super().__init__(parent)
+        self.status_colors = status_colors
+        self.status_font = status_font
+
+    def display(self, record, column):
+        if column == 0:
+            # Já convertido de UTC para horário local e formatado na consulta
+            return record['created_at_fmt']
+        if column == 1:
+            return record['tipo_operacao']
+        if column == 2:
+            return record['status']
+        if column == 3:
+            return record['mensagem'] or ''
+        if column == 4:
+            return str(record['registros_processados'])
+        return f"{record['tempo_execucao_segundos'] or 0:.2f}"
+
+    def sort_key(self, record, column):
+        if column == 0:
+            return record['created_at']  # ISO 8601: ordem de texto = ordem cronológica
+        if column == 4:
+            return record['registros_processados'] or 0
+        if column == 5:
+            return float(record['tempo_execucao_segundos'] or 0)
+        return None
+
+    def style(self, record, column, role):
+        if column != 2:
+            return None
+        if role == Qt.ForegroundRole:
+            return self.status_colors.get(record['status'], self.status_colors['OUTRO'])
+        if role == Qt.FontRole:
+            return self.status_font
+        return None
+
+    def last_id(self):
+        """Maior id carregado (None se a tabela estiver vazia)"""
+        return self._rows[0]['id'] if self._rows else None
+
+
+class SchedulesTableModel(RecordTableModel):
+    """Agendamentos"""
+
+    HEADERS = ('ID', 'Operação', 'Frequência', 'Dias', 'Horário', 'Status')
+
+    def __init__(self, status_colors, status_font, parent=None):
+        super().__init__(parent)
+        self.status_colors = status_colors
+        self.status_font = status_font
+
+    def display(self, record, column):
+        if column == 0:
+            return str(record['id'])
+        if column == 1:
+            return record['operation_type']
+        if column == 2:
+            return _SCHEDULE_TIPO_MAP.get(record['schedule_type'], record['schedule_type'])
+        if column == 3:
+            if record['schedule_day'] is None:
+                return '-'
+            if record['schedule_type'] == 'weekly':
+                return _WEEKDAY_MAP.get(record['schedule_day'], str(record['schedule_day']))
+            return f"Dia {record['schedule_day']}"
+        if column == 4:
+            return record['schedule_time']
+        return 'Ativo' if record['is_active'] else 'Inativo'
+
+    def sort_key(self, record, column):
+        if column == 0:
+            return record['id']
+        if column == 3:
+            return -1 if record['schedule_day'] is None else record['schedule_day']
+        return None
+
+    def style(self, record, column, role):
+        if column != 5:
+            return None
+        if role == Qt.ForegroundRole:
+            return self.status_colors['SUCESSO' if record['is_active'] else 'ERRO']
+        if role == Qt.FontRole:
+            return self.status_font
+        return None
+
+
+def make_table_view(model: RecordTableModel) -> QTableView:
+    """
+    QTableView sobre 'model' com um QSortFilterProxyModel (ordenação por
+    clique no cabeçalho e filtro de texto em todas as colunas)
+    """
+    proxy = QSortFilterProxyModel(model)
+    proxy.setSourceModel(model)
+    proxy.setSortRole(Qt.EditRole)  # ver RecordTableModel.sort_key
+    proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+    proxy.setFilterKeyColumn(-1)
+
+    view = QTableView()
+    view.setModel(proxy)
+    view.setSortingEnabled(True)
+    # Sem coluna de ordenação inicial: mantém a ordem vinda do banco
+    view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+    view.horizontalHeader().setResizeContentsPrecision(RESIZE_SAMPLE_ROWS)
+    view.setSelectionBehavior(QTableView.SelectRows)
+    view.setAlternatingRowColors(True)
+    return view
+
+
+@contextmanager
+def frozen(view: QTableView):
+    """Troca de dados + ajuste de colunas sem repinturas intermediárias"""
+    view.setUpdatesEnabled(False)
+    try:
+        yield view
+    finally:
+        view.setUpdatesEnabled(True)
+
+
+def selected_record(view: QTableView):
+    """Registro da linha selecionada na view (ou None)"""
+    selection = view.selectionModel()
+
+    if not selection.hasSelection():
+        return None
+
+    index = view.model().mapToSource(selection.currentIndex())
+    if not index.isValid():
+        return None
+
+    return index.model().record(index.row())
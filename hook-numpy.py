@@ -1,18 +1,22 @@
 """
 Hook personalizado para numpy
 """
-from PyInstaller.utils.hooks import collect_data_files, collect_submodules
+from PyInstaller.utils.hooks import collect_dynamic_libs, copy_metadata
 
-# Coletar dados
-datas = collect_data_files('numpy')
+# Só os metadados do pacote (versão); os demais arquivos de dados do numpy
+# são stubs .pyi, headers C e dados de teste
+datas = copy_metadata('numpy')
 
-# Coletar submódulos
-hiddenimports = collect_submodules('numpy')
+# Bibliotecas nativas (OpenBLAS/MKL) sem percorrer os submódulos Python
+binaries = collect_dynamic_libs('numpy')
 
-# Adicionar imports críticos
-hiddenimports += [
+# Somente os módulos de extensão que o PyInstaller não enxerga pelos imports
+# (o restante do numpy é encontrado pela análise normal; collect_submodules
+# traria testes, f2py e distutils para o pacote)
+hiddenimports = [
     'numpy.core._multiarray_umath',
     'numpy.core._multiarray_tests',
+    'numpy.core._dtype_ctypes',
     'numpy.random._common',
     'numpy.random._generator',
     'numpy.random._mt19937',
@@ -20,4 +24,11 @@ hiddenimports += [
     'numpy.random._pcg64',
     'numpy.random._sfc64',
     'numpy.random.bit_generator',
-]
\ No newline at end of file
+]
+
+# Testes e ferramentas de build do numpy (nunca usados em tempo de execução)
+excludedimports = [
+    'numpy.tests',
+    'numpy.f2py',
+    'numpy.distutils',
+]
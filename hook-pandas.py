@@ -1,10 +1,34 @@
 """
 Hook personalizado para pandas
 """
-from PyInstaller.utils.hooks import collect_data_files, collect_submodules
+from PyInstaller.utils.hooks import collect_submodules, copy_metadata
 
-# Coletar dados
-datas = collect_data_files('pandas')
 
-# Coletar submódulos
-hiddenimports = collect_submodules('pandas')
\ No newline at end of file
+def _not_tests(name):
+    return '.tests' not in name
+
+
+# Coletar dados: só os metadados do pacote. Os templates .tpl do Styler
+# (to_html / DataFrame.style) não são usados pela aplicação; o resto são
+# stubs e arquivos de teste
+datas = copy_metadata('pandas')
+
+# Coletar submódulos usados pela aplicação (DataFrame, read_sql, to_datetime,
+# to_numeric...) em vez do pacote inteiro
+hiddenimports = collect_submodules('pandas.core', filter=_not_tests)
+hiddenimports += collect_submodules('pandas.io.formats', filter=_not_tests)
+hiddenimports += collect_submodules('pandas._libs.tslibs')
+
+# Dependências opcionais e partes não usadas que o pandas importa sob demanda.
+# pandas.io.sas/stata/orc/html/xml/clipboards/spss/gbq ficam: pandas.io.api
+# os importa em todo "import pandas", e excluí-los quebraria o executável.
+excludedimports = [
+    'pandas.tests',
+    'pandas.plotting._matplotlib',
+    'matplotlib',
+    'scipy',
+    'bottleneck',
+    'numexpr',
+    'xarray',
+    'openpyxl',
+]
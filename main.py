@@ -4,26 +4,53 @@ OrionTax Sync - Sistema de Sincronização
 """
 import sys
 import logging
-from pathlib import Path
 from datetime import datetime
-from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction, QMessageBox
+from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction, QMessageBox, QStyle
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt, QSystemSemaphore, QSharedMemory
-from config.database import DatabaseManager
+from PyQt5.QtCore import (Qt, QSharedMemory, QObject, QRunnable, QThreadPool, QTimer,
+                          QEventLoop, pyqtSignal)
 from gui.login import LoginDialog
-from gui.main_window import MainWindow
-from core.scheduler import Scheduler
-from core.heartbeat import HeartbeatService
 from version import APP_VERSION
 
+# DatabaseManager, Scheduler/HeartbeatService (APScheduler, drivers, pandas)
+# e MainWindow são importados nos métodos que os usam: o login aparece sem
+# esperar a janela principal e seus módulos serem carregados
+
 logger = logging.getLogger(__name__)
 
+# QueueListener ativo (setup_logging pode ser chamado de novo sem duplicar threads)
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Grava o que resta na fila e para a thread de logging"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 def setup_logging():
-    """Configura sistema de logging (console + arquivo com rotação diária)"""
-    from logging.handlers import TimedRotatingFileHandler
+    """
+    Configura sistema de logging (console + arquivo com rotação diária)
+
+    Os handlers rodam numa thread própria (QueueListener): quem loga, inclusive
+    a thread da interface, só enfileira o registro e não espera o disco.
+
+    Pode ser chamado mais de uma vez: a configuração anterior é desfeita.
+
+    Returns:
+        QueueListener em execução (parado no atexit, após os últimos logs)
+    """
+    global _log_listener
+    import atexit
+    import queue
+    from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 
-    log_dir = Path(__file__).parent / 'logs'
-    log_dir.mkdir(exist_ok=True)
+    from utils.logger import resolve_log_dir
+
+    # Mesma pasta do OrionTaxLogger (resolvida e criada uma única vez)
+    log_dir = resolve_log_dir()
 
     # Arquivo base — o handler cria oriontax.log e rotaciona para
     # oriontax.log.YYYY-MM-DD à meia-noite, mantendo até 30 dias
@@ -36,24 +63,37 @@ def setup_logging():
     root = logging.getLogger()
     root.setLevel(logging.INFO)
 
-    # Remove handlers anteriores para evitar duplicatas
-    root.handlers.clear()
+    # Remove handlers (e a thread) de uma configuração anterior
+    _stop_log_listener()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root.addHandler(console_handler)
 
-    # Rotaciona à meia-noite, sufixo YYYY-MM-DD, mantém 30 arquivos
+    # Rotaciona à meia-noite, sufixo YYYY-MM-DD, mantém 30 arquivos;
+    # delay=True: o arquivo só é aberto no primeiro registro
     file_handler = TimedRotatingFileHandler(
         log_filename,
         when='midnight',
         interval=1,
         backupCount=30,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.suffix = '%Y-%m-%d'
     file_handler.setFormatter(formatter)
-    root.addHandler(file_handler)
+
+    log_queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+
+    _log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _log_listener.start()
+    # Esvazia a fila antes de o processo terminar (inclusive em sys.exit)
+    atexit.unregister(_stop_log_listener)
+    atexit.register(_stop_log_listener)
+    return _log_listener
 
 class SingleInstance:
     """Garante que apenas uma instância do aplicativo rode por vez"""
@@ -75,13 +115,45 @@ class SingleInstance:
         return self.is_running
 
 
+class InitSignals(QObject):
+    """Sinais do InitWorker (QRunnable não é QObject)"""
+    
+    finished = pyqtSignal(object)  # None ou a Exception da importação
+
+
+class InitWorker(QRunnable):
+    """
+    Importa os módulos do agendador no QThreadPool
+    
+    APScheduler, oracledb, psycopg2, pandas/numpy e psutil levam segundos para
+    carregar; importados aqui, o login aparece enquanto isso. Nenhum desses
+    módulos importa config.database (cuja instância global tem a conexão
+    SQLite presa à thread que a cria), então é seguro fazê-lo fora da thread
+    principal.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = InitSignals()
+    
+    def run(self):
+        try:
+            import core.scheduler  # noqa: F401
+            import core.heartbeat  # noqa: F401
+            error = None
+        except Exception as e:
+            error = e
+        self.signals.finished.emit(error)
+
+
 class OrionTaxSyncApp:
     """Aplicação principal com System Tray"""
     
     def __init__(self):
-        setup_logging()
+        self._log_listener = setup_logging()
         
         self.app = QApplication(sys.argv)
+        LoginDialog.install_stylesheet(self.app)
         
         # ✅ Verificar instância única
         self.single_instance = SingleInstance('OrionTaxSync')
@@ -99,43 +171,98 @@ class OrionTaxSyncApp:
         self.scheduler = None
         self.main_window = None
         self.tray_icon = None
+        self._login_dialog = None  # criado no primeiro login e reaproveitado
+        self._tray_icon_cache = None  # ver _default_icon
+        self._info_icon_cache = None  # ver _info_icon
         self.app_start_time = datetime.now()
+        
+        # Agendador inicializado em background (ver InitWorker)
+        self._init_worker = None
+        self._backend_ready = False
+        self._main_window_pending = False
+        # quit_application já chamado (ex.: login cancelado antes do agendador carregar)
+        self._quitting = False
 
         # Inicializar sistema
         self.init_database()
-        self.init_scheduler()
         self.init_tray()
+        self.start_backend()
         
         # SEMPRE MOSTRAR LOGIN AO INICIAR
         self.show_login()
     
     def init_database(self):
-        """Inicializa banco de dados"""
-        try:
-            logger.info("="*80)
-            logger.info("OrionTax Sync - Iniciando Sistema")
-            logger.info("="*80)
-            
-            logger.info("Conectando ao banco de dados...")
-            self.db_manager = DatabaseManager()
-            self.db_manager.connect()
-            logger.info("✓ Banco de dados conectado")
-            
-        except Exception as e:
-            logger.error(f"Erro ao inicializar banco: {e}")
-            sys.exit(1)
+        """Inicializa banco de dados (o usuário pode tentar novamente em caso de falha)"""
+        logger.info("="*80)
+        logger.info("OrionTax Sync - Iniciando Sistema")
+        logger.info("="*80)
+        
+        while True:
+            try:
+                logger.info("Conectando ao banco de dados...")
+                from config.database import DatabaseManager
+                self.db_manager = DatabaseManager()
+                self.db_manager.connect()
+                logger.info("✓ Banco de dados conectado")
+                return
+                
+            except Exception as e:
+                logger.warning("Erro ao inicializar banco: %s", e)
+                self.db_manager = None
+                
+                # Arquivo bloqueado (antivírus, backup, outra cópia) costuma ser
+                # passageiro: oferece nova tentativa em vez de encerrar direto
+                answer = QMessageBox.critical(
+                    None,
+                    "OrionTax Sync",
+                    f"Não foi possível abrir o banco de dados local:\n\n{e}",
+                    QMessageBox.Retry | QMessageBox.Cancel,
+                    QMessageBox.Retry
+                )
+                if answer != QMessageBox.Retry:
+                    logger.error("Inicialização cancelada: banco de dados indisponível")
+                    sys.exit(1)
+    
+    def start_backend(self):
+        """Carrega os módulos do agendador em background; init_scheduler roda ao terminar"""
+        logger.info("Carregando módulos do agendador em segundo plano...")
+        self._init_worker = InitWorker()
+        self._init_worker.signals.finished.connect(self._on_backend_ready, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._init_worker)
+    
+    def _on_backend_ready(self, error):
+        """Módulos carregados (thread principal): inicia scheduler e heartbeat"""
+        self._init_worker = None
+        
+        if self._quitting:
+            # Encerrando: não iniciar APScheduler/heartbeat sobre o banco já desconectado
+            return
+        
+        if error is not None:
+            logger.error("Erro ao carregar módulos do agendador: %s", error)
+        else:
+            self.init_scheduler()
+        self._backend_ready = True
+        
+        # Login concluído antes do agendador: a janela principal abre agora
+        if self._main_window_pending:
+            self._main_window_pending = False
+            self.create_main_window()
     
     def init_scheduler(self):
         """Inicializa scheduler e heartbeat"""
         try:
             logger.info("Iniciando agendador de tarefas...")
+            from core.scheduler import Scheduler
+            from core.heartbeat import HeartbeatService
+            
             self.scheduler = Scheduler(self.db_manager)
             self.scheduler.start()
             logger.info("✓ Scheduler iniciado")
 
-            jobs = self.scheduler.get_jobs()
-            if jobs:
-                logger.info(f"{len(jobs)} job(s) agendado(s)")
+            job_count = self.scheduler.job_count()
+            if job_count:
+                logger.info("%d job(s) agendado(s)", job_count)
             else:
                 logger.info("Nenhum job agendado no momento")
 
@@ -147,10 +274,10 @@ class OrionTaxSyncApp:
             )
             interval = self.db_manager.get_heartbeat_interval()
             self.scheduler.start_heartbeat(heartbeat_service, interval)
-            logger.info(f"✓ Heartbeat iniciado (intervalo: {interval} min)")
+            logger.info("✓ Heartbeat iniciado (intervalo: %s min)", interval)
 
         except Exception as e:
-            logger.error(f"Erro ao iniciar scheduler: {e}")
+            logger.error("Erro ao iniciar scheduler: %s", e)
     
     def init_tray(self):
         """Inicializa System Tray Icon"""
@@ -159,8 +286,7 @@ class OrionTaxSyncApp:
             self.tray_icon = QSystemTrayIcon(self.app)
             
             # Usar ícone padrão
-            icon = self.app.style().standardIcon(self.app.style().SP_ComputerIcon)
-            self.tray_icon.setIcon(icon)
+            self.tray_icon.setIcon(self._default_icon())
             
             # Criar menu do tray
             tray_menu = QMenu()
@@ -188,40 +314,98 @@ class OrionTaxSyncApp:
             logger.info("✓ System Tray inicializado")
             
         except Exception as e:
-            logger.error(f"Erro ao inicializar tray: {e}")
+            logger.error("Erro ao inicializar tray: %s", e)
+    
+    def _default_icon(self) -> QIcon:
+        """Ícone padrão do sistema (obtido do estilo uma única vez)"""
+        if self._tray_icon_cache is None:
+            style = self.app.style()
+            self._tray_icon_cache = style.standardIcon(style.SP_ComputerIcon)
+        return self._tray_icon_cache
+    
+    def _info_icon(self):
+        """
+        Ícone das notificações do tray (obtido do estilo uma única vez)
+        
+        Sem ícone no tema, volta ao QSystemTrayIcon.Information.
+        """
+        if self._info_icon_cache is None:
+            icon = self.app.style().standardIcon(QStyle.SP_MessageBoxInformation)
+            self._info_icon_cache = QSystemTrayIcon.Information if icon.isNull() else icon
+        return self._info_icon_cache
     
     def tray_icon_activated(self, reason):
         """Chamado quando tray icon é clicado"""
         if reason == QSystemTrayIcon.DoubleClick:
             self.show_main_window()
     
+    def _prompt_login(self):
+        """
+        Pede login no diálogo compartilhado
+        
+        Returns:
+            True se autenticado, False se cancelado, None se o diálogo já está aberto
+        """
+        if self._login_dialog is None:
+            self._login_dialog = LoginDialog(db_manager=self.db_manager)
+        elif self._login_dialog.isVisible():
+            # Duplo clique no tray com o login já aberto: só trazer para frente
+            self._login_dialog.raise_()
+            self._login_dialog.activateWindow()
+            return None
+        else:
+            self._login_dialog.reset_fields()
+        
+        # Laço próprio, encerrado pelo finished do diálogo (em vez de exec_()).
+        # Sem ExcludeUserInputEvents: o usuário precisa digitar no login.
+        # Threads do agendador não abrem QMessageBox: falam com a interface
+        # só por sinais (conexão enfileirada), nunca chamando widgets direto.
+        loop = QEventLoop()
+        self._login_dialog.finished.connect(loop.quit)
+        self._login_dialog.setModal(True)
+        self._login_dialog.show()
+        loop.exec_()
+        self._login_dialog.finished.disconnect(loop.quit)
+        
+        if self._login_dialog.result() != self._login_dialog.Accepted:
+            logger.info("Login cancelado")
+            return False
+        
+        logger.info("✓ Login bem-sucedido: %s", self._login_dialog.username)
+        return True
+    
     def show_login(self):
         """Mostra tela de login INICIAL"""
         try:
             logger.info("Abrindo tela de login...")
             
-            login_dialog = LoginDialog(db_manager=self.db_manager)
-            
-            if login_dialog.exec_() == login_dialog.Accepted:
-                logger.info(f"✓ Login bem-sucedido: {login_dialog.username}")
-                
+            if self._prompt_login():
                 # ✅ ABRIR JANELA PRINCIPAL APÓS LOGIN INICIAL
-                self.create_main_window()
+                # (no próximo ciclo: o login fecha e a tela é repintada antes)
+                QTimer.singleShot(0, self.create_main_window)
             else:
-                logger.info("Login cancelado")
                 self.quit_application()
                 
-        except Exception as e:
-            logger.error(f"Erro no login: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Erro no login")
             self.quit_application()
     
     def create_main_window(self):
         """Cria e mostra janela principal"""
+        if self._quitting:
+            return
+        
+        if not self._backend_ready:
+            # A janela precisa do scheduler; _on_backend_ready a cria
+            logger.info("Aguardando inicialização do agendador...")
+            self._main_window_pending = True
+            return
+        
         try:
             logger.info("Criando janela principal...")
             
+            from gui.main_window import MainWindow
+            
             # Criar nova janela com referência ao app para minimizar para tray
             self.main_window = MainWindow(self.db_manager, self.scheduler, self)
             self.main_window.show()
@@ -230,14 +414,12 @@ class OrionTaxSyncApp:
             self.tray_icon.showMessage(
                 "OrionTax Sync",
                 "Sistema aberto. Minimize para continuar em segundo plano.",
-                QSystemTrayIcon.Information,
+                self._info_icon(),
                 3000
             )
             
-        except Exception as e:
-            logger.error(f"Erro ao criar janela: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Erro ao criar janela")
     
     def show_main_window(self):
         """Mostra janela principal (PEDE LOGIN ANTES)"""
@@ -245,13 +427,8 @@ class OrionTaxSyncApp:
             logger.info("Solicitação para abrir janela...")
             
             # ✅ SEMPRE PEDIR LOGIN ANTES DE MOSTRAR JANELA
-            login_dialog = LoginDialog(db_manager=self.db_manager)
-            
-            if login_dialog.exec_() != login_dialog.Accepted:
-                logger.info("Login cancelado")
-                return  # Login cancelado
-            
-            logger.info(f"✓ Login bem-sucedido: {login_dialog.username}")
+            if not self._prompt_login():
+                return  # Login cancelado (ou já em andamento)
             
             # Se já existe janela, apenas mostrar
             if self.main_window:
@@ -259,13 +436,11 @@ class OrionTaxSyncApp:
                 self.main_window.raise_()
                 self.main_window.activateWindow()
             else:
-                # Criar nova janela
-                self.create_main_window()
+                # Criar nova janela (após o login fechar e a tela ser repintada)
+                QTimer.singleShot(0, self.create_main_window)
             
-        except Exception as e:
-            logger.error(f"Erro ao abrir janela: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Erro ao abrir janela")
     
     def minimize_to_tray(self):
         """Minimiza janela para tray"""
@@ -275,7 +450,7 @@ class OrionTaxSyncApp:
             self.tray_icon.showMessage(
                 "OrionTax Sync",
                 "Sistema minimizado. Clique no ícone para reabrir.",
-                QSystemTrayIcon.Information,
+                self._info_icon(),
                 2000
             )
             
@@ -285,11 +460,16 @@ class OrionTaxSyncApp:
         """Encerra aplicação"""
         try:
             logger.info("Encerrando aplicação...")
+            self._quitting = True
             
             # Parar scheduler
             if self.scheduler:
                 self.scheduler.stop()
             
+            # Fechar conexões mantidas pela janela principal
+            if self.main_window:
+                self.main_window.close_connections()
+            
             # Fechar banco
             if self.db_manager:
                 self.db_manager.disconnect()
@@ -306,11 +486,14 @@ class OrionTaxSyncApp:
             self.app.quit()
             
         except Exception as e:
-            logger.error(f"Erro ao encerrar: {e}")
+            logger.error("Erro ao encerrar: %s", e)
             sys.exit(1)
     
     def run(self):
         """Executa aplicação"""
+        if self._quitting:
+            # app.quit() antes do exec_() não tem efeito: não entrar no event loop
+            return 0
         return self.app.exec_()
 
 
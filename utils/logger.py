@@ -2,8 +2,41 @@
 Sistema de Logging Customizado
 """
 import logging
+import sys
+import time
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from datetime import datetime
+
+# Diretório padrão dos logs (resolvido uma única vez, na importação).
+# No executável do PyInstaller __file__ aponta para a pasta temporária
+# _MEIxxxx, apagada ao sair: os logs ficam ao lado do .exe
+if getattr(sys, 'frozen', False):
+    _BASE_DIR = Path(sys.executable).resolve().parent
+else:
+    _BASE_DIR = Path(__file__).resolve().parent.parent
+_LOG_DIR_DEFAULT = _BASE_DIR / 'logs'
+
+# Formato dos registros (um único Formatter, compartilhado pelos handlers)
+_FORMAT = '%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s'
+_DATEFMT = '%Y-%m-%d %H:%M:%S'
+_FORMATTER = logging.Formatter(_FORMAT, _DATEFMT)
+
+
+@lru_cache(maxsize=1)
+def resolve_log_dir(log_dir: str = None) -> Path:
+    """
+    Diretório de logs, criado se preciso (mkdir só na primeira chamada)
+
+    Usado por OrionTaxLogger.setup e por main.setup_logging, que assim
+    gravam na mesma pasta.
+
+    Args:
+        log_dir: Diretório alternativo (None = pasta logs/ do projeto)
+    """
+    path = _LOG_DIR_DEFAULT if log_dir is None else Path(log_dir)
+    path.mkdir(exist_ok=True)
+    return path
 
 
 class OrionTaxLogger:
@@ -17,31 +50,22 @@ class OrionTaxLogger:
         Args:
             log_dir: Diretório para salvar logs
         """
-        if log_dir is None:
-            log_dir = Path(__file__).parent.parent / 'logs'
-        else:
-            log_dir = Path(log_dir)
-        
-        log_dir.mkdir(exist_ok=True)
+        log_dir = resolve_log_dir(log_dir)
         
         # Nome do arquivo de log com data
-        log_file = log_dir / f'oriontax_{datetime.now().strftime("%Y%m%d")}.log'
+        log_file = log_dir / f'oriontax_{time.strftime("%Y%m%d")}.log'
         
-        # Configurar formato
-        formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        # Handler para arquivo (até 5 MB por arquivo, 7 backups; aberto no primeiro registro)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=5_000_000, backupCount=7, encoding='utf-8', delay=True
         )
-        
-        # Handler para arquivo
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         
         # Handler para console
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
         
         # Configurar logger raiz
         root_logger = logging.getLogger()